@@ -1,5 +1,3 @@
-from datetime import datetime
-
 from twitchpy.bot import Bot
 
 bot = Bot(
@@ -13,17 +11,9 @@ bot = Bot(
     "!",
 )
 
-time = datetime.now()
-
 
 def example_check():
-    global time
-
-    time_diff = datetime.now() - time
-
-    if time_diff.seconds >= 5:
-        bot.me("any_channel_login", "This message is sent every 5 seconds")
-        time = datetime.now()
+    bot.me("any_channel_login", "This message is sent every 5 seconds")
 
 
 def example_listener(message):
@@ -35,7 +25,7 @@ def example_command(message):
     bot.me("any_channel_login", f"{message.user} is who called me")
 
 
-bot.add_check("example_check", example_check)
+bot.add_check("example_check", example_check, interval=5)
 bot.add_listener("example_listener", example_listener)
 bot.add_command("example_command", example_command)
 
@@ -0,0 +1,115 @@
+import threading
+import time
+from datetime import datetime
+
+import pytest
+
+from twitchpy import bot as bot_module
+from twitchpy.dataclasses import UnbanRequest, User
+
+
+class _Client:
+    def __init__(self, *args, **kwargs):
+        pass
+
+
+@pytest.fixture
+def bot(monkeypatch):
+    monkeypatch.setattr(bot_module, "Client", _Client)
+
+    return bot_module.Bot(
+        "oauth:token",
+        "client_id",
+        "client_secret",
+        "redirect_uri",
+        "tokens_path",
+        "MyBot",
+        [],
+        "!",
+    )
+
+
+def test_mixed_case_username_confirms_its_joins(bot):
+    handle = bot._Bot__handle_message
+
+    bot.join_channel("channel")
+    bot._Bot__join_scheduler.take(0)
+
+    handle(None, ":mybot!mybot@mybot.tmi.twitch.tv JOIN #channel")
+    handle(None, ":mybot.tmi.twitch.tv 353 mybot = #channel :mybot viewer")
+    handle(None, ":mybot.tmi.twitch.tv 366 mybot #channel :End of /NAMES list")
+
+    assert bot.username == "mybot"
+    assert bot.get_join_progress().joined == 1
+    assert bot.get_join_progress().pending == 0
+    assert bot.get_chatters("channel") == ["viewer"]
+
+
+class _UnbanClient(_Client):
+    def __init__(self, *args, **kwargs):
+        self.pending = [f"r{index}" for index in range(250)]
+        self.resolved = []
+        self.lock = threading.Lock()
+
+    def get_all_unban_requests(self, broadcaster_id, moderator_id, status):
+        cursor = 0
+
+        # Pages are cut from the requests still pending when each one is read
+        while True:
+            with self.lock:
+                page = self.pending[cursor : cursor + 100]
+
+            if len(page) == 0:
+                return
+
+            cursor += len(page)
+            time.sleep(0.05)
+
+            for request_id in page:
+                yield UnbanRequest(
+                    request_id,
+                    None,
+                    None,
+                    User(request_id[1:], request_id, request_id),
+                    "sorry",
+                    "pending",
+                    datetime(2024, 1, 1),
+                    None,
+                    "",
+                )
+
+    def get_users(self, login=None, user_ids=None):
+        return [User(user_id, user_id, user_id) for user_id in user_ids]
+
+    def get_banned_users(self, broadcaster_id, user_ids, first):
+        return []
+
+    def resolve_unban_requests(self, broadcaster_id, moderator_id, request_id, *args):
+        with self.lock:
+            self.pending.remove(request_id)
+            self.resolved.append(request_id)
+
+
+def test_unban_triage_decides_every_pending_request(monkeypatch, tmp_path):
+    monkeypatch.setattr(bot_module, "Client", _UnbanClient)
+    bot = bot_module.Bot(
+        "oauth:token",
+        "client_id",
+        "client_secret",
+        "redirect_uri",
+        "tokens_path",
+        "bot",
+        [],
+        "!",
+    )
+    handle = bot._Bot__handle_message
+
+    handle(None, "@user-id=7 :tmi.twitch.tv GLOBALUSERSTATE")
+    handle(None, "@room-id=5 :tmi.twitch.tv ROOMSTATE #channel")
+
+    triage = bot.triage_unban_requests(
+        "channel", [lambda context: ("approved", "ok")], str(tmp_path / "audit.log")
+    ).result(10)
+
+    assert triage.approved == 250
+    assert sorted(bot.client.resolved) == sorted(f"r{index}" for index in range(250))
@@ -0,0 +1,61 @@
+import threading
+
+from twitchpy._bot.bulk import BulkOperation, gather
+from twitchpy._bot.executor import LazyExecutor
+from twitchpy._bot.helix_limiter import HelixRateLimiter
+
+
+def _operation(targets, apply, on_progress=None):
+    return BulkOperation(
+        "ban", "channel", targets, apply, HelixRateLimiter(800, 60), on_progress
+    )
+
+
+def test_progress_and_errors():
+    def apply(target):
+        if target == "bad":
+            raise ValueError("nope")
+
+    executor = LazyExecutor(4, "test-bulk")
+    progress = _operation(["a", "b", "a", "bad"], apply).start(executor).result(5)
+
+    assert (progress.total, progress.succeeded, progress.failed) == (3, 2, 1)
+    assert progress.errors == {"bad": "nope"}
+
+    executor.shutdown()
+
+
+def test_no_targets():
+    assert (
+        _operation([], lambda _: None)
+        .start(LazyExecutor(1, "test-bulk"))
+        .result(0)
+        .total
+        == 0
+    )
+
+
+def test_shutdown_without_cancelling_resolves_the_future():
+    release = threading.Event()
+    executor = LazyExecutor(1, "test-bulk")
+    future = _operation(
+        [str(index) for index in range(5)], lambda _: release.wait(5)
+    ).start(executor)
+
+    executor.shutdown(wait=False)
+    release.set()
+
+    assert future.result(5).succeeded == 5
+
+
+def test_gather():
+    executor = LazyExecutor(2, "test-bulk")
+    futures = [
+        _operation(["a"], lambda _: None).start(executor),
+        _operation(["b", "c"], lambda _: None).start(executor),
+    ]
+
+    assert [progress.total for progress in gather(futures).result(5)] == [1, 2]
+    assert gather([]).result(0) == []
+
+    executor.shutdown()
@@ -0,0 +1,84 @@
+from twitchpy._bot.cooldowns import Cooldowns
+
+
+def test_command_without_cooldowns_is_never_limited():
+    cooldowns = Cooldowns(10)
+    cooldowns.set("free", 0, 0, 0, 1)
+
+    assert all(cooldowns.acquire("free", "a", "u", 0) for _ in range(5))
+    assert cooldowns.acquire("unknown", "a", "u", 0)
+
+
+def test_global_cooldown_is_shared_by_every_channel():
+    cooldowns = Cooldowns(10)
+    cooldowns.set("cmd", 10, 0, 0, 1)
+
+    assert cooldowns.acquire("cmd", "a", "u", 0)
+    assert not cooldowns.acquire("cmd", "b", "v", 5)
+    assert cooldowns.acquire("cmd", "b", "v", 10)
+
+
+def test_channel_cooldown():
+    cooldowns = Cooldowns(10)
+    cooldowns.set("cmd", 0, 10, 0, 1)
+
+    assert cooldowns.acquire("cmd", "a", "u", 0)
+    assert not cooldowns.acquire("cmd", "a", "v", 1)
+    assert cooldowns.acquire("cmd", "b", "u", 1)
+
+
+def test_user_cooldown():
+    cooldowns = Cooldowns(10)
+    cooldowns.set("cmd", 0, 0, 10, 1)
+
+    assert cooldowns.acquire("cmd", "a", "u", 0)
+    assert not cooldowns.acquire("cmd", "a", "u", 1)
+    assert cooldowns.acquire("cmd", "a", "v", 1)
+    assert cooldowns.acquire("cmd", "b", "u", 1)
+
+
+def test_uses_per_window():
+    cooldowns = Cooldowns(10)
+    cooldowns.set("cmd", 10, 0, 0, 3)
+
+    assert [cooldowns.acquire("cmd", "a", "u", now) for now in (0, 1, 2, 3)] == [
+        True,
+        True,
+        True,
+        False,
+    ]
+    assert cooldowns.acquire("cmd", "a", "u", 10)
+
+
+def test_refused_invocation_uses_no_window():
+    cooldowns = Cooldowns(10)
+    cooldowns.set("cmd", 0, 10, 10, 1)
+
+    assert cooldowns.acquire("cmd", "a", "u", 0)
+    # Refused by the channel cooldown, so v's own window doesn't start
+    assert not cooldowns.acquire("cmd", "a", "v", 5)
+    assert cooldowns.acquire("cmd", "a", "v", 10)
+
+
+def test_set_and_remove_reset_the_windows():
+    cooldowns = Cooldowns(10)
+    cooldowns.set("cmd", 10, 0, 0, 1)
+    cooldowns.acquire("cmd", "a", "u", 0)
+
+    cooldowns.set("cmd", 10, 0, 0, 1)
+    assert cooldowns.acquire("cmd", "a", "u", 1)
+
+    cooldowns.remove("cmd")
+    assert cooldowns.acquire("cmd", "a", "u", 2)
+
+
+def test_least_recently_used_windows_are_evicted():
+    cooldowns = Cooldowns(2)
+    cooldowns.set("cmd", 0, 0, 10, 1)
+
+    cooldowns.acquire("cmd", "a", "u1", 0)
+    cooldowns.acquire("cmd", "a", "u2", 0)
+    cooldowns.acquire("cmd", "a", "u3", 0)
+
+    assert cooldowns.acquire("cmd", "a", "u1", 1)
+    assert not cooldowns.acquire("cmd", "a", "u3", 1)
@@ -0,0 +1,81 @@
+from datetime import datetime
+
+import pytest
+
+from twitchpy._bot.cron import CronSchedule
+
+
+def test_every_five_minutes():
+    schedule = CronSchedule("*/5 * * * *")
+
+    assert schedule.next_after(datetime(2024, 1, 1, 10, 2, 30)) == datetime(
+        2024, 1, 1, 10, 5
+    )
+
+
+def test_next_after_is_strictly_later():
+    schedule = CronSchedule("0 * * * *")
+
+    assert schedule.next_after(datetime(2024, 1, 1, 10, 0)) == datetime(
+        2024, 1, 1, 11, 0
+    )
+
+
+def test_rolls_over_month_and_year():
+    schedule = CronSchedule("30 8 1 1 *")
+
+    assert schedule.next_after(datetime(2024, 1, 1, 9, 0)) == datetime(
+        2025, 1, 1, 8, 30
+    )
+
+
+def test_ranges_lists_and_steps():
+    schedule = CronSchedule("0 9-17/4 * * *")
+
+    assert [
+        schedule.next_after(datetime(2024, 1, 1, hour, 0)).hour for hour in (8, 9, 13)
+    ] == [9, 13, 17]
+
+
+def test_sunday_is_zero_and_seven():
+    # 2024-01-07 is a Sunday
+    for expression in ("0 0 * * 0", "0 0 * * 7"):
+        assert CronSchedule(expression).next_after(datetime(2024, 1, 3)) == datetime(
+            2024, 1, 7
+        )
+
+
+def test_restricted_day_of_month_and_week_match_either():
+    # The 15th or any Monday, 2024-01-08 being the first Monday after the 3rd
+    schedule = CronSchedule("0 0 15 * 1")
+
+    assert schedule.next_after(datetime(2024, 1, 3)) == datetime(2024, 1, 8)
+    assert schedule.next_after(datetime(2024, 1, 13)) == datetime(2024, 1, 15)
+
+
+def test_stepped_day_of_month_counts_as_unrestricted():
+    # Odd days that are also Mondays, as in Vixie cron: 2024-01-01 and 2024-01-15
+    schedule = CronSchedule("0 0 */2 * 1")
+
+    assert schedule.next_after(datetime(2024, 1, 1, 12)) == datetime(2024, 1, 15)
+
+
+def test_stepped_day_of_week_counts_as_unrestricted():
+    # The 10th, only on Sundays, Tuesdays, Thursdays and Saturdays: 2024-02-10 is a Saturday
+    schedule = CronSchedule("0 0 10 * */2")
+
+    assert schedule.next_after(datetime(2024, 1, 1)) == datetime(2024, 2, 10)
+
+
+@pytest.mark.parametrize(
+    "expression",
+    ["* * * *", "60 * * * *", "* 24 * * *", "* * 0 * *", "*/0 * * * *", "5-1 * * * *"],
+)
+def test_invalid_expressions(expression):
+    with pytest.raises(ValueError):
+        CronSchedule(expression)
+
+
+def test_never_matching_expression():
+    with pytest.raises(ValueError):
+        CronSchedule("0 0 31 2 *").next_after(datetime(2024, 1, 1))
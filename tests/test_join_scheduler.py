@@ -0,0 +1,76 @@
+from twitchpy._bot.join_scheduler import JoinScheduler
+
+
+def test_joins_are_released_by_the_rate_limit():
+    scheduler = JoinScheduler(2, 10, 60)
+
+    for channel in ("a", "b", "c"):
+        scheduler.enqueue(channel, 0)
+
+    assert scheduler.take(0) == ["a", "b"]
+    assert scheduler.take(1) == []
+    assert scheduler.delay(1) == 9
+    assert scheduler.take(10) == ["c"]
+    assert scheduler.pending == 3
+
+
+def test_confirm_measures_latency():
+    scheduler = JoinScheduler(20, 10, 60)
+    scheduler.enqueue("a", 0)
+    scheduler.take(1)
+
+    assert scheduler.confirm("a", 3) == 3
+    assert scheduler.confirm("a", 4) is None
+
+    progress = scheduler.progress()
+    assert (progress.requested, progress.joined, progress.pending) == (1, 1, 0)
+    assert progress.average_latency == progress.max_latency == 3
+
+
+def test_restore_puts_channels_back_in_front():
+    scheduler = JoinScheduler(2, 10, 60)
+
+    for channel in ("a", "b", "c"):
+        scheduler.enqueue(channel, 0)
+
+    scheduler.restore(scheduler.take(0))
+
+    assert scheduler.take(10) == ["a", "b"]
+
+
+def test_enqueue_again_a_sent_join():
+    scheduler = JoinScheduler(20, 10, 60)
+    scheduler.enqueue("a", 0)
+    scheduler.take(0)
+    scheduler.enqueue("a", 1)
+
+    assert scheduler.progress().requested == 1
+    assert scheduler.pending == 1
+    assert scheduler.take(1) == ["a"]
+
+
+def test_unconfirmed_joins_expire():
+    scheduler = JoinScheduler(20, 10, 60)
+    scheduler.enqueue("a", 0)
+    scheduler.enqueue("b", 0)
+    scheduler.take(0)
+
+    assert scheduler.delay(30) == 30
+    assert scheduler.expire(59) == []
+    assert scheduler.expire(60) == ["a", "b"]
+    assert scheduler.pending == 0
+    assert scheduler.delay(60) is None
+
+
+def test_fail_and_discard():
+    scheduler = JoinScheduler(20, 10, 60)
+    scheduler.enqueue("a", 0)
+    scheduler.enqueue("b", 0)
+    scheduler.take(0)
+    scheduler.enqueue("c", 0)
+
+    assert scheduler.fail("a")
+    assert not scheduler.fail("a")
+    assert not scheduler.discard("b")
+    assert scheduler.discard("c")
+    assert scheduler.pending == 0
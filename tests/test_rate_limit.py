@@ -0,0 +1,48 @@
+from twitchpy._bot.rate_limit import RateLimiter
+
+
+def test_limit_inside_the_window():
+    limiter = RateLimiter(3, 10)
+
+    assert [limiter.acquire(now) for now in (0, 1, 2, 3)] == [True, True, True, False]
+    assert limiter.available(3) == 0
+
+
+def test_events_expire_after_the_period():
+    limiter = RateLimiter(2, 10)
+    limiter.acquire(0)
+    limiter.acquire(5)
+
+    assert not limiter.acquire(9.9)
+    assert limiter.acquire(10)
+    assert limiter.available(15) == 1
+
+
+def test_acquire_several_is_all_or_nothing():
+    limiter = RateLimiter(5, 10)
+
+    assert limiter.acquire(0, 3)
+    assert not limiter.acquire(1, 3)
+    assert limiter.available(1) == 2
+
+
+def test_lower_limit():
+    limiter = RateLimiter(100, 30)
+
+    assert all(limiter.acquire(0, 1, 20) for _ in range(20))
+    assert not limiter.acquire(0, 1, 20)
+    assert limiter.acquire(0)
+
+
+def test_delay():
+    limiter = RateLimiter(3, 10)
+
+    assert limiter.delay(0) == 0
+
+    for now in (0, 2, 4):
+        limiter.acquire(now)
+
+    assert limiter.delay(5) == 5
+    assert limiter.delay(5, 2) == 7
+    assert limiter.delay(5, 4) == 10
+    assert limiter.delay(5, 1, 2) == 7
@@ -0,0 +1,127 @@
+import re
+import time
+
+import pytest
+
+from twitchpy._bot.router import CommandRouter
+
+
+def test_prefixed_command_and_arguments():
+    router = CommandRouter()
+    router.add("hello")
+
+    assert router.resolve("!hello there you", ("!",)) == ("hello", ["there", "you"])
+    assert router.resolve("hello there", ("!",)) is None
+    assert router.resolve("!hellothere", ("!",)) is None
+
+
+def test_longest_prefix_is_stripped():
+    router = CommandRouter()
+    router.add("ping")
+
+    assert router.resolve("!!ping", ("!", "!!")) == ("ping", [])
+
+
+def test_longest_sub_command_wins():
+    router = CommandRouter()
+    router.add("queue")
+    router.add("queue add")
+
+    assert router.resolve("!queue add song", ("!",)) == ("queue add", ["song"])
+    assert router.resolve("!queue list", ("!",)) == ("queue", ["list"])
+
+
+def test_sub_command_without_parent():
+    router = CommandRouter()
+    router.add("queue add")
+
+    assert router.resolve("!queue", ("!",)) is None
+    assert router.resolve("!queue add", ("!",)) == ("queue add", [])
+
+
+def test_aliases():
+    router = CommandRouter()
+    router.add("queue add", aliases=["sr", "song request"])
+
+    assert router.resolve("!sr x", ("!",)) == ("queue add", ["x"])
+    assert router.resolve("!song request x", ("!",)) == ("queue add", ["x"])
+
+
+def test_patterns_in_order_after_prefixed_commands():
+    router = CommandRouter()
+    router.add("greet", pattern=r"\bhi\b")
+    router.add("bye", pattern=r"\bhi\b|bye")
+    router.add("hi")
+
+    assert router.resolve("!hi", ("!",)) == ("hi", [])
+    assert router.resolve("oh hi there", ("!",)) == ("greet", ["oh", "hi", "there"])
+    assert router.resolve("bye all", ("!",)) == ("bye", ["bye", "all"])
+    assert router.resolve("!unknown hi", ("!",)) == ("greet", ["!unknown", "hi"])
+
+
+def test_invalid_pattern_keeps_the_previous_command():
+    router = CommandRouter()
+    router.add("greet")
+
+    with pytest.raises(re.error):
+        router.add("greet", pattern="(")
+
+    assert router.resolve("!greet", ("!",)) == ("greet", [])
+
+
+def test_add_replaces_command():
+    router = CommandRouter()
+    router.add("a", aliases=["b"])
+    router.add("a", aliases=["c"])
+
+    assert router.resolve("!b", ("!",)) is None
+    assert router.resolve("!c", ("!",)) == ("a", [])
+
+
+def test_remove_keeps_other_commands_on_the_path():
+    router = CommandRouter()
+    router.add("queue")
+    router.add("queue add")
+
+    router.remove("queue")
+    assert router.resolve("!queue", ("!",)) is None
+    assert router.resolve("!queue add", ("!",)) == ("queue add", [])
+
+    router.remove("queue add")
+    router.remove("never added")
+    assert router.resolve("!queue add", ("!",)) is None
+
+
+def test_remove_alias_shared_with_another_command():
+    router = CommandRouter()
+    router.add("a", aliases=["x"])
+    router.add("b", aliases=["x"])
+
+    # The alias now belongs to b, removing a leaves it alone
+    router.remove("a")
+    assert router.resolve("!x", ("!",)) == ("b", [])
+
+
+@pytest.mark.slow
+def test_resolve_benchmark_with_10k_commands():
+    router = CommandRouter()
+
+    for index in range(10000):
+        router.add(f"command{index}", aliases=[f"alias{index}"])
+        router.add(f"command{index} sub{index % 10}")
+
+    router.add("greet", pattern=r"\bhello\b")
+
+    messages = [
+        f"!command{index} sub{index % 10} argument" for index in range(0, 10000, 7)
+    ] + [f"!alias{index} argument" for index in range(0, 10000, 13)]
+    started_at = time.perf_counter()
+
+    for _ in range(10):
+        for message in messages:
+            assert router.resolve(message, ("!",)) is not None
+
+    elapsed = (time.perf_counter() - started_at) / (10 * len(messages))
+
+    # A lookup per word, independent of the number of commands
+    assert elapsed < 0.0001, f"{elapsed * 1e6:.1f}us per resolve"
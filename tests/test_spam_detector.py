@@ -0,0 +1,114 @@
+import random
+
+from twitchpy._bot.spam_detector import (
+    _HASH_BITS,
+    _HASH_MASK,
+    SpamDetector,
+    _normalize,
+    _spread,
+)
+
+
+def _naive_simhash(shingles: set[str]) -> int:
+    fingerprint = 0
+
+    for bit in range(_HASH_BITS):
+        ones = sum((hash(shingle) & _HASH_MASK) >> bit & 1 for shingle in shingles)
+
+        if ones * 2 > len(shingles):
+            fingerprint |= 1 << bit
+
+    return fingerprint
+
+
+def _burst(detector, texts, channel="a", start=0.0, step=0.1):
+    events = []
+
+    for index, text in enumerate(texts):
+        event = detector.check(
+            channel, text, f"u{index}", f"m{index}", start + index * step
+        )
+
+        if event is not None:
+            events.append(event)
+
+    return events
+
+
+def test_normalize():
+    assert _normalize("  BUY!!!  Nooooow...  ") == "buy now"
+    assert _normalize("!!!") == ""
+
+
+def test_spread_puts_each_bit_in_its_lane():
+    for shingle in ("abc", "xyz", "   "):
+        value = hash(shingle) & _HASH_MASK
+        spread = _spread(shingle)
+
+        for bit in range(_HASH_BITS):
+            assert (spread >> (bit * 16)) & 0xFFFF == (value >> bit) & 1
+
+
+def test_simhash_matches_naive_bit_counts():
+    detector = SpamDetector(10, 5, 100)
+    generator = random.Random(0)
+
+    for _ in range(50):
+        shingles = {
+            "".join(generator.choice("abcdefgh ") for _ in range(3))
+            for _ in range(generator.randint(1, 40))
+        }
+
+        assert detector._SpamDetector__simhash(shingles) == _naive_simhash(shingles)
+
+
+def test_duplicates_are_reported_once():
+    detector = SpamDetector(10, 3, 100)
+
+    events = _burst(detector, ["Follow me!!"] * 6)
+
+    assert len(events) == 1
+    assert events[0].kind == "duplicate"
+    assert events[0].count == 3
+    assert events[0].user_ids == ["u0", "u1", "u2"]
+    assert events[0].message_ids == ["m0", "m1", "m2"]
+
+
+def test_near_duplicates():
+    detector = SpamDetector(10, 4, 100)
+    base = "check out my channel for free followers and cheap viewers today"
+
+    events = _burst(detector, [f"{base} {index}" for index in range(6)])
+
+    assert [event.kind for event in events] == ["near_duplicate"]
+
+
+def test_unrelated_messages_are_not_a_burst():
+    detector = SpamDetector(10, 3, 100)
+
+    assert _burst(detector, ["hello everyone", "gg", "what a play", "lol"]) == []
+    assert detector.last_count == 1
+
+
+def test_messages_outside_the_window_do_not_count():
+    detector = SpamDetector(10, 3, 100)
+
+    assert _burst(detector, ["spam"] * 5, step=11) == []
+
+
+def test_burst_is_reported_again_after_fading():
+    detector = SpamDetector(10, 3, 100)
+
+    assert len(_burst(detector, ["spam"] * 3)) == 1
+    assert len(_burst(detector, ["spam"] * 3, start=100)) == 1
+
+
+def test_channels_are_separate_and_discarded():
+    detector = SpamDetector(10, 3, 100)
+
+    _burst(detector, ["spam"] * 2, channel="a")
+    assert _burst(detector, ["spam"], channel="b", start=1) == []
+
+    detector.discard("a")
+    assert _burst(detector, ["spam"], channel="a", start=2) == []
+    assert detector.last_count == 1
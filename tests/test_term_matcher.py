@@ -0,0 +1,135 @@
+import random
+
+from twitchpy._bot.term_matcher import TermMatcher
+
+
+def _matches(term: str, text: str) -> bool:
+    text = text.lower()
+    word = term.strip("*")
+    start = text.find(word)
+
+    while start != -1:
+        end = start + len(word)
+        before = text[start - 1] if start > 0 else " "
+        after = text[end] if end < len(text) else " "
+
+        if (term.startswith("*") or not (before.isalnum() or before == "_")) and (
+            term.endswith("*") or not (after.isalnum() or after == "_")
+        ):
+            return True
+
+        start = text.find(word, start + 1)
+
+    return False
+
+
+def _matcher(*terms: str) -> TermMatcher:
+    matcher = TermMatcher()
+
+    for term in terms:
+        matcher.add(term)
+
+    return matcher
+
+
+def test_empty_matcher():
+    assert TermMatcher().search("anything") is None
+
+
+def test_whole_words_only():
+    matcher = _matcher("ass")
+
+    assert matcher.search("you ass!") == "ass"
+    assert matcher.search("ASS") == "ass"
+    assert matcher.search("a classic passage") is None
+    assert matcher.search("ass_") is None
+
+
+def test_wildcards():
+    matcher = _matcher("spam*", "*coin", "*scam*")
+
+    assert matcher.search("spammer here") == "spam*"
+    assert matcher.search("buy bitcoin") == "*coin"
+    assert matcher.search("totally-not-ascammer") == "*scam*"
+    assert matcher.search("antispam coins") is None
+
+
+def test_phrases():
+    matcher = _matcher("free followers")
+
+    assert matcher.search("get FREE followers now") == "free followers"
+    assert matcher.search("free followersss") is None
+
+
+def test_overlapping_terms_use_failure_links():
+    # Reaching "hers" needs the failure link from "she" to "he"
+    matcher = _matcher("*she", "*hers")
+
+    assert matcher.search("ushers") == "*hers"
+    assert matcher.search("ushe") == "*she"
+
+
+def test_term_inside_longer_term_candidate():
+    # "abcd" fails at the last character, "bc" still has to be found
+    matcher = _matcher("abcd", "bc")
+
+    assert matcher.search("abc") is None
+    assert matcher.search("a bc") == "bc"
+    assert _matcher("abcd", "*bc*").search("abce") == "*bc*"
+
+
+def test_remove_counts_references():
+    matcher = _matcher("bad", "bad")
+
+    matcher.remove("bad")
+    assert matcher.search("bad") == "bad"
+
+    matcher.remove("BAD ")
+    assert matcher.search("bad") is None
+
+    matcher.remove("never added")
+
+
+def test_add_after_search_rebuilds():
+    matcher = _matcher("one")
+
+    assert matcher.search("two") is None
+
+    matcher.add("two")
+    assert matcher.search("two") == "two"
+
+
+def test_blank_terms_are_ignored():
+    matcher = _matcher("", "  ", "**")
+
+    assert matcher.search("* anything") is None
+
+
+def test_matches_naive_search():
+    generator = random.Random(0)
+    alphabet = "ab _"
+
+    for _ in range(300):
+        terms = set()
+
+        for _ in range(generator.randint(1, 6)):
+            term = "".join(
+                generator.choice("ab") for _ in range(generator.randint(1, 4))
+            )
+            prefix = "*" if generator.random() < 0.3 else ""
+            suffix = "*" if generator.random() < 0.3 else ""
+            terms.add(prefix + term + suffix)
+
+        matcher = _matcher(*terms)
+
+        for _ in range(10):
+            text = "".join(
+                generator.choice(alphabet) for _ in range(generator.randint(0, 12))
+            )
+            found = matcher.search(text)
+
+            if found is None:
+                assert not any(_matches(term, text) for term in terms), (terms, text)
+
+            else:
+                assert found in terms and _matches(found, text), (terms, text)
@@ -1,3 +1,4 @@
+from collections.abc import Iterator
 from datetime import datetime
 
 from .._utils import date, http
@@ -192,6 +193,19 @@ def get_vips(
     return [User(vip["user_id"], vip["user_login"], vip["user_name"]) for vip in vips]
 
 
+def get_all_vips(token: str, client_id: str, broadcaster_id: str) -> Iterator[User]:
+    url = ENDPOINT_VIPS
+    headers = {
+        "Authorization": f"Bearer {token}",
+        "Client-Id": client_id,
+    }
+    params = {"broadcaster_id": broadcaster_id}
+
+    for vips in http.send_get_pages(url, headers, params, 100):
+        for vip in vips:
+            yield User(vip["user_id"], vip["user_login"], vip["user_name"])
+
+
 def add_channel_vip(
     token: str, client_id: str, user_id: str, broadcaster_id: str
 ) -> None:
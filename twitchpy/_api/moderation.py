@@ -1,4 +1,6 @@
+from collections.abc import Iterator
 from datetime import datetime
+from urllib.parse import urlencode
 
 from .._utils import date, http
 from ..dataclasses import (
@@ -21,20 +23,19 @@ CONTENT_TYPE_APPLICATION_JSON = "application/json"
 def check_automod_status(
     token: str, client_id: str, broadcaster_id: str, data: list[tuple[str, str]]
 ) -> list[tuple[str, bool]]:
-    url = "https://api.twitch.tv/helix/moderation/enforcements/status"
+    url = f"https://api.twitch.tv/helix/moderation/enforcements/status?broadcaster_id={broadcaster_id}"
     headers = {
         "Authorization": f"Bearer {token}",
         "Client-Id": client_id,
     }
     payload = {
-        "broadcaster_id": broadcaster_id,
-        "data": data,
+        "data": [{"msg_id": msg_id, "msg_text": msg_text} for msg_id, msg_text in data],
     }
 
     messages_status = http.send_post_get_result(url, headers, payload)
 
     return [
-        (message_status["msg_id"], message_status["is_permited"])
+        (message_status["msg_id"], message_status["is_permitted"])
         for message_status in messages_status
     ]
 
@@ -174,7 +175,11 @@ def get_banned_users(
     return [
         BannedUser(
             User(user["user_id"], user["user_login"], user["user_name"]),
-            datetime.strptime(user["expires_at"], date.RFC3339_FORMAT),
+            (
+                datetime.strptime(user["expires_at"], date.RFC3339_FORMAT)
+                if user["expires_at"]
+                else None
+            ),
             datetime.strptime(user["created_at"], date.RFC3339_FORMAT),
             user["reason"],
             User(user["moderator_id"], user["moderator_login"], user["moderator_name"]),
@@ -183,6 +188,35 @@ def get_banned_users(
     ]
 
 
+def get_all_banned_users(
+    token: str, client_id: str, broadcaster_id: str
+) -> Iterator[BannedUser]:
+    url = "https://api.twitch.tv/helix/moderation/banned"
+    headers = {
+        "Authorization": f"Bearer {token}",
+        "Client-Id": client_id,
+    }
+    params = {"broadcaster_id": broadcaster_id}
+
+    for users in http.send_get_pages(url, headers, params, 100):
+        for user in users:
+            yield BannedUser(
+                User(user["user_id"], user["user_login"], user["user_name"]),
+                (
+                    datetime.strptime(user["expires_at"], date.RFC3339_FORMAT)
+                    if user["expires_at"]
+                    else None
+                ),
+                datetime.strptime(user["created_at"], date.RFC3339_FORMAT),
+                user["reason"],
+                User(
+                    user["moderator_id"],
+                    user["moderator_login"],
+                    user["moderator_name"],
+                ),
+            )
+
+
 def ban_user(
     token: str,
     client_id: str,
@@ -274,13 +308,68 @@ def get_unban_requests(
             request["text"],
             request["status"],
             datetime.strptime(request["created_at"], date.RFC3339_FORMAT),
-            datetime.strptime(request["resolved_at"], date.RFC3339_FORMAT),
+            (
+                datetime.strptime(request["resolved_at"], date.RFC3339_FORMAT)
+                if request["resolved_at"]
+                else None
+            ),
             request["resolution_text"],
         )
         for request in requests
     ]
 
 
+def get_all_unban_requests(
+    token: str,
+    client_id: str,
+    broadcaster_id: str,
+    moderator_id: str,
+    status: str,
+    user_id: str | None = None,
+) -> Iterator[UnbanRequest]:
+    url = "https://api.twitch.tv/helix/moderation/unban_requests"
+    headers = {
+        "Authorization": f"Bearer {token}",
+        "Client-Id": client_id,
+    }
+    params = {
+        "broadcaster_id": broadcaster_id,
+        "moderator_id": moderator_id,
+        "status": status,
+    }
+
+    if user_id is not None:
+        params["user_id"] = user_id
+
+    for requests in http.send_get_pages(url, headers, params, 100):
+        for request in requests:
+            yield UnbanRequest(
+                request["id"],
+                Channel(
+                    User(
+                        request["broadcaster_id"],
+                        request["broadcaster_login"],
+                        request["broadcaster_name"],
+                    )
+                ),
+                User(
+                    request["moderator_id"],
+                    request["moderator_login"],
+                    request["moderator_name"],
+                ),
+                User(request["user_id"], request["user_login"], request["user_name"]),
+                request["text"],
+                request["status"],
+                datetime.strptime(request["created_at"], date.RFC3339_FORMAT),
+                (
+                    datetime.strptime(request["resolved_at"], date.RFC3339_FORMAT)
+                    if request["resolved_at"]
+                    else None
+                ),
+                request["resolution_text"],
+            )
+
+
 def resolve_unban_requests(
     token: str,
     client_id: str,
@@ -295,17 +384,17 @@ def resolve_unban_requests(
         "Authorization": f"Bearer {token}",
         "Client-Id": client_id,
     }
-    data = {
+    params = {
         "broadcaster_id": broadcaster_id,
         "moderator_id": moderator_id,
         "unban_request_id": unban_request_id,
         "status": status,
     }
 
-    if resolution_text is not None:
-        data["resolution_text"] = resolution_text
+    if resolution_text:
+        params["resolution_text"] = resolution_text
 
-    request = http.send_patch_get_result(url, headers, data)[0]
+    request = http.send_patch_get_result(f"{url}?{urlencode(params)}", headers, {})[0]
 
     return UnbanRequest(
         request["id"],
@@ -355,12 +444,43 @@ def get_blocked_terms(
             term["text"],
             datetime.strptime(term["created_at"], date.RFC3339_FORMAT),
             datetime.strptime(term["updated_at"], date.RFC3339_FORMAT),
-            datetime.strptime(term["expires_at"], date.RFC3339_FORMAT),
+            (
+                datetime.strptime(term["expires_at"], date.RFC3339_FORMAT)
+                if term["expires_at"]
+                else None
+            ),
         )
         for term in terms
     ]
 
 
+def get_all_blocked_terms(
+    token: str, client_id: str, broadcaster_id: str, moderator_id: str
+) -> Iterator[BlockedTerm]:
+    url = ENDPOINT_BLOCKED_TERMS
+    headers = {
+        "Authorization": f"Bearer {token}",
+        "Client-Id": client_id,
+    }
+    params = {"broadcaster_id": broadcaster_id, "moderator_id": moderator_id}
+
+    for terms in http.send_get_pages(url, headers, params, 100):
+        for term in terms:
+            yield BlockedTerm(
+                term["broadcaster_id"],
+                term["moderator_id"],
+                term["id"],
+                term["text"],
+                datetime.strptime(term["created_at"], date.RFC3339_FORMAT),
+                datetime.strptime(term["updated_at"], date.RFC3339_FORMAT),
+                (
+                    datetime.strptime(term["expires_at"], date.RFC3339_FORMAT)
+                    if term["expires_at"]
+                    else None
+                ),
+            )
+
+
 def add_blocked_term(
     token: str, client_id: str, broadcaster_id: str, moderator_id: str, text: str
 ) -> BlockedTerm:
@@ -385,7 +505,11 @@ def add_blocked_term(
         term["text"],
         datetime.strptime(term["created_at"], date.RFC3339_FORMAT),
         datetime.strptime(term["updated_at"], date.RFC3339_FORMAT),
-        datetime.strptime(term["expires_at"], date.RFC3339_FORMAT),
+        (
+            datetime.strptime(term["expires_at"], date.RFC3339_FORMAT)
+            if term["expires_at"]
+            else None
+        ),
     )
 
 
@@ -396,18 +520,13 @@ def remove_blocked_term(
     blocked_term_id: str,
     moderator_id: str,
 ) -> None:
-    url = ENDPOINT_BLOCKED_TERMS
+    url = f"{ENDPOINT_BLOCKED_TERMS}?broadcaster_id={broadcaster_id}&id={blocked_term_id}&moderator_id={moderator_id}"
     headers = {
         "Authorization": f"Bearer {token}",
         "Client-Id": client_id,
     }
-    data = {
-        "broadcaster_id": broadcaster_id,
-        "id": blocked_term_id,
-        "moderator_id": moderator_id,
-    }
 
-    http.send_delete(url, headers, data)
+    http.send_delete(url, headers, {})
 
 
 def delete_chat_messages(
@@ -479,6 +598,21 @@ def get_moderators(
     ]
 
 
+def get_all_moderators(
+    token: str, client_id: str, broadcaster_id: str
+) -> Iterator[User]:
+    url = ENDPOINT_MODERATORS
+    headers = {
+        "Authorization": f"Bearer {token}",
+        "Client-Id": client_id,
+    }
+    params = {"broadcaster_id": broadcaster_id}
+
+    for users in http.send_get_pages(url, headers, params, 100):
+        for user in users:
+            yield User(user["user_id"], user["user_login"], user["user_name"])
+
+
 def add_channel_moderator(
     token: str, client_id: str, broadcaster_id: str, user_id: str
 ) -> None:
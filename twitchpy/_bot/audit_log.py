@@ -0,0 +1,109 @@
+import json
+import os
+import threading
+from datetime import datetime, timezone
+
+
+class AuditLog:
+    """
+    Appends the decisions taken on unban requests to a local file, one JSON object per line
+    The requests already recorded are kept by channel and user with their creation time, so rules can tell repeated
+    requests apart
+    Every method is thread-safe
+    """
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path (str): Path of the file, created if it doesn't exist
+        """
+
+        self.__path = path
+        self.__lock = threading.Lock()
+        # Creation time of each recorded request, by channel and user
+        self.__requests: dict[tuple[str, str], dict[str, datetime]] = {}
+
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as file:
+                for line in file:
+                    try:
+                        self.__count(json.loads(line))
+
+                    except (ValueError, KeyError):
+                        continue
+
+    def __count(self, entry: dict) -> None:
+        # Entries written before the creation time was recorded fall back to the time of the decision
+        created_at = _utc(
+            datetime.fromisoformat(entry.get("created_at", entry["time"]))
+        )
+
+        # A request is kept once, even if it was triaged again after a failure
+        self.__requests.setdefault((entry["channel"], entry["user_id"]), {}).setdefault(
+            entry["request_id"], created_at
+        )
+
+    def count_requests(
+        self, channel: str, user_id: str, request_id: str, created_at: datetime
+    ) -> int:
+        """
+        Gets the number of requests of a user in a channel recorded before one, created earlier than it
+
+        Args:
+            channel (str): Channel's name
+            user_id (str): User's ID
+            request_id (str): ID of the request being triaged, not counted
+            created_at (datetime): Creation time of the request being triaged, naive times are taken as UTC
+
+        Returns:
+            int
+        """
+
+        created_at = _utc(created_at)
+
+        with self.__lock:
+            return sum(
+                1
+                for recorded_id, recorded_at in self.__requests.get(
+                    (channel, user_id), {}
+                ).items()
+                if recorded_id != request_id and recorded_at < created_at
+            )
+
+    def write(
+        self,
+        channel: str,
+        user_id: str,
+        request_id: str,
+        created_at: datetime,
+        **fields,
+    ) -> None:
+        """
+        Records a decision taken on an unban request
+
+        Args:
+            channel (str): Channel's name
+            user_id (str): ID of the user who asked for an unban
+            request_id (str): ID of the request
+            created_at (datetime): Creation time of the request, naive times are taken as UTC
+            **fields: Other values to record, they must be JSON serializable
+        """
+
+        entry = {
+            "time": datetime.now(timezone.utc).isoformat(),
+            "channel": channel,
+            "user_id": user_id,
+            "request_id": request_id,
+            "created_at": _utc(created_at).isoformat(),
+            **fields,
+        }
+
+        with self.__lock:
+            with open(self.__path, "a", encoding="utf-8") as file:
+                file.write(json.dumps(entry, ensure_ascii=False) + "\n")
+
+            self.__count(entry)
+
+
+def _utc(value: datetime) -> datetime:
+    return value.replace(tzinfo=timezone.utc) if value.tzinfo is None else value
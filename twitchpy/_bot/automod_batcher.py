@@ -0,0 +1,103 @@
+from concurrent.futures import Future
+from dataclasses import dataclass
+
+
+@dataclass
+class AutoModCheck:
+    """
+    Represents a message waiting to be checked against a channel's AutoMod settings
+    """
+
+    check_id: str
+    text: str
+    future: Future
+
+
+class AutoModBatcher:
+    """
+    Groups the messages to check against AutoMod into batches, one per channel
+    A batch is released when it's full or when its oldest message has waited long enough
+    """
+
+    def __init__(self, batch_size: int, max_delay: float):
+        """
+        Args:
+            batch_size (int): Maximum number of messages of a batch
+            max_delay (float): Maximum seconds a message waits for its batch to fill
+        """
+
+        self.__batch_size = batch_size
+        self.__max_delay = max_delay
+        self.__batches: dict[str, list[AutoModCheck]] = {}
+        self.__started_at: dict[str, float] = {}
+        self.__next_id = 0
+
+    def add(self, channel: str, text: str, now: float) -> tuple[Future, bool]:
+        """
+        Adds a message to its channel's batch
+
+        Args:
+            channel (str): Channel's name
+            text (str): Message's text
+            now (float): Current monotonic time
+
+        Returns:
+            tuple[Future, bool]: Future of whether AutoMod permits the message, and whether the batch is full
+        """
+
+        self.__next_id += 1
+        check = AutoModCheck(str(self.__next_id), text, Future())
+        batch = self.__batches.get(channel)
+
+        if batch is None:
+            batch = []
+            self.__batches[channel] = batch
+            self.__started_at[channel] = now
+
+        batch.append(check)
+
+        return check.future, len(batch) >= self.__batch_size
+
+    def take(self, now: float) -> list[tuple[str, list[AutoModCheck]]]:
+        """
+        Releases the batches that are full or have waited long enough
+
+        Args:
+            now (float): Current monotonic time
+
+        Returns:
+            list[tuple[str, list[AutoModCheck]]]: Channels and their batches
+        """
+
+        ready = []
+
+        for channel, batch in list(self.__batches.items()):
+            if (
+                len(batch) < self.__batch_size
+                and now - self.__started_at[channel] < self.__max_delay
+            ):
+                continue
+
+            self.__batches.pop(channel)
+            self.__started_at.pop(channel)
+
+            for start in range(0, len(batch), self.__batch_size):
+                ready.append((channel, batch[start : start + self.__batch_size]))
+
+        return ready
+
+    def delay(self, now: float) -> float | None:
+        """
+        Gets the seconds until the next batch has to be released
+
+        Args:
+            now (float): Current monotonic time
+
+        Returns:
+            float | None: None if no message is waiting
+        """
+
+        if len(self.__started_at) == 0:
+            return None
+
+        return max(0, min(self.__started_at.values()) + self.__max_delay - now)
@@ -0,0 +1,81 @@
+import sys
+from functools import lru_cache
+
+from ..dataclasses import Role
+
+_CACHE_SIZE = 4096
+
+_BADGE_ROLES = {
+    "subscriber": Role.SUBSCRIBER,
+    "founder": Role.SUBSCRIBER | Role.FOUNDER,
+    "vip": Role.VIP,
+    "moderator": Role.MODERATOR,
+    "broadcaster": Role.BROADCASTER,
+    "staff": Role.STAFF,
+    "admin": Role.STAFF,
+    "global_mod": Role.STAFF,
+}
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def _parse(value: str) -> tuple[tuple[tuple[str, str], ...], Role, int]:
+    badges = []
+    roles = Role.NONE
+    tier = 0
+
+    for badge in value.split(","):
+        name, _, version = badge.partition("/")
+
+        if len(name) == 0:
+            continue
+
+        name = sys.intern(name)
+        badges.append((name, sys.intern(version)))
+        roles |= _BADGE_ROLES.get(name, Role.NONE)
+
+        if name == "subscriber":
+            # Tier 2 and 3 badges use versions 2000 and 3000 plus the months subscribed
+            tier = int(version) // 1000 if version.isdigit() else 1
+            tier = tier if tier in (2, 3) else 1
+
+        elif name == "founder":
+            tier = max(tier, 1)
+
+    return tuple(badges), roles, tier
+
+
+def parse_badges(value: str | None) -> tuple[dict[str, str], Role, int]:
+    """
+    Parses the value of a badges tag, e.g. "broadcaster/1,subscriber/3012"
+    Repeated values are only parsed once
+
+    Args:
+        value (str | None): Value of the tag
+
+    Returns:
+        tuple[dict[str, str], Role, int]: Version of each badge, roles they grant and subscription tier
+    """
+
+    if not value:
+        return {}, Role.NONE, 0
+
+    badges, roles, tier = _parse(value)
+
+    return dict(badges), roles, tier
+
+
+def parse_badge_info(value: str | None) -> dict[str, str]:
+    """
+    Parses the value of a badge-info tag, e.g. "subscriber/12"
+
+    Args:
+        value (str | None): Value of the tag
+
+    Returns:
+        dict[str, str]: Details of each badge
+    """
+
+    if not value:
+        return {}
+
+    return dict(_parse(value)[0])
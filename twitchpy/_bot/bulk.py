@@ -0,0 +1,143 @@
+import dataclasses
+import logging
+import threading
+from concurrent.futures import Executor, Future
+from typing import Callable
+
+from ..dataclasses import BulkProgress
+from .helix_limiter import HelixRateLimiter
+
+logger = logging.getLogger(__name__)
+
+
+class BulkOperation:
+    """
+    Applies an action to many targets concurrently, as fast as the Helix rate limit allows
+    The progress is reported after each target
+    """
+
+    def __init__(
+        self,
+        action: str,
+        channel: str,
+        targets: list[str],
+        apply: Callable[[str], None],
+        limiter: HelixRateLimiter,
+        on_progress: Callable[[BulkProgress], None] | None,
+    ):
+        """
+        Args:
+            action (str): Name of the action
+            channel (str): Channel where the action is applied
+            targets (list[str]): IDs of the users or messages, duplicates are applied once
+            apply (Callable[[str], None]): Applies the action to a target
+            limiter (HelixRateLimiter): Rate limit shared with the other Helix requests
+            on_progress (Callable[[BulkProgress], None] | None): Called with a copy of the progress after each target
+        """
+
+        self.__targets = list(dict.fromkeys(targets))
+        self.__apply = apply
+        self.__limiter = limiter
+        self.__on_progress = on_progress
+        self.__progress = BulkProgress(action, channel, len(self.__targets))
+        self.__lock = threading.Lock()
+        self.future: Future = Future()
+
+    def start(self, executor: Executor) -> Future:
+        """
+        Submits every target to an executor
+
+        Args:
+            executor (Executor): Executor whose workers apply the action
+
+        Returns:
+            Future: Future whose result is the final BulkProgress
+        """
+
+        if len(self.__targets) == 0:
+            self.future.set_result(dataclasses.replace(self.__progress))
+
+        for target in self.__targets:
+            executor.submit(self.__run, target)
+
+        return self.future
+
+    def __run(self, target: str) -> None:
+        error = None
+
+        try:
+            self.__limiter.acquire()
+            self.__apply(target)
+
+        except Exception as exception:
+            error = exception
+
+        with self.__lock:
+            if error is None:
+                self.__progress.succeeded += 1
+
+            else:
+                self.__progress.failed += 1
+                self.__progress.errors[target] = str(error)
+
+            finished = (
+                self.__progress.succeeded + self.__progress.failed
+                == self.__progress.total
+            )
+
+            if self.__on_progress is None and not finished:
+                return
+
+            progress = dataclasses.replace(
+                self.__progress, errors=dict(self.__progress.errors)
+            )
+
+            # Reported under the lock, so the callback sees the progress in order
+            if self.__on_progress is not None:
+                try:
+                    self.__on_progress(progress)
+
+                except Exception:
+                    logger.exception("Progress callback of %s failed", progress.action)
+
+        if finished:
+            self.future.set_result(progress)
+
+
+def gather(futures: list[Future]) -> Future:
+    """
+    Combines futures into one that is done when all of them are
+
+    Args:
+        futures (list[Future]): Futures to wait for
+
+    Returns:
+        Future: Future whose result is the list of their results, or whose exception is the first one they raised
+    """
+
+    result = Future()
+    remaining = [len(futures)]
+    lock = threading.Lock()
+
+    def on_done(_: Future) -> None:
+        with lock:
+            remaining[0] -= 1
+
+            if remaining[0] > 0:
+                return
+
+        for future in futures:
+            if future.exception() is not None:
+                result.set_exception(future.exception())
+
+                return
+
+        result.set_result([future.result() for future in futures])
+
+    if len(futures) == 0:
+        result.set_result([])
+
+    for future in futures:
+        future.add_done_callback(on_done)
+
+    return result
@@ -0,0 +1,146 @@
+import dataclasses
+from datetime import datetime
+
+from ..dataclasses import ChatSettings, ChatState, Role
+
+
+class ChatStateCache:
+    """
+    Keeps the state of a bot's chats up to date from the ROOMSTATE, USERSTATE and CLEARCHAT messages
+    """
+
+    def __init__(self):
+        self.__states: dict[str, ChatState] = {}
+        self.__complete: set[str] = set()
+
+    def __get_state(self, channel: str) -> ChatState:
+        state = self.__states.get(channel)
+
+        if state is None:
+            state = ChatState(channel)
+            self.__states[channel] = state
+
+        return state
+
+    def update_room(self, channel: str, tags: dict) -> None:
+        """
+        Applies the tags of a ROOMSTATE message
+        The first one of a channel has every setting, the next ones only the settings that changed
+
+        Args:
+            channel (str): Channel's name
+            tags (dict): Tags of the message
+        """
+
+        state = self.__get_state(channel)
+
+        if "room-id" in tags:
+            state.room_id = tags["room-id"]
+
+        if "emote-only" in tags:
+            state.emote_mode = tags["emote-only"] == "1"
+
+        if "followers-only" in tags:
+            duration = int(tags["followers-only"] or -1)
+            state.follower_mode = duration >= 0
+            state.follower_mode_duration = max(0, duration)
+
+        if "slow" in tags:
+            state.slow_mode_wait_time = int(tags["slow"] or 0)
+            state.slow_mode = state.slow_mode_wait_time > 0
+
+        if "subs-only" in tags:
+            state.subscriber_mode = tags["subs-only"] == "1"
+
+        if "r9k" in tags:
+            state.unique_chat_mode = tags["r9k"] == "1"
+
+        if all(
+            tag in tags
+            for tag in ("emote-only", "followers-only", "slow", "subs-only", "r9k")
+        ):
+            self.__complete.add(channel)
+
+    def update_user(self, channel: str, roles: Role) -> None:
+        """
+        Applies the roles the bot has in a channel, as given by a USERSTATE message
+
+        Args:
+            channel (str): Channel's name
+            roles (Role): Bot's roles
+        """
+
+        state = self.__get_state(channel)
+        state.is_moderator = bool(roles & (Role.MODERATOR | Role.BROADCASTER))
+        state.is_vip = bool(roles & Role.VIP)
+
+    def clear(self, channel: str, cleared_at: datetime) -> None:
+        """
+        Registers that a chat was cleared
+
+        Args:
+            channel (str): Channel's name
+            cleared_at (datetime): Time of the clearing
+        """
+
+        self.__get_state(channel).last_cleared = cleared_at
+
+    def update_settings(self, channel: str, settings: ChatSettings) -> None:
+        """
+        Applies the chat settings got from the API
+
+        Args:
+            channel (str): Channel's name
+            settings (ChatSettings): Channel's chat settings
+        """
+
+        state = self.__get_state(channel)
+        state.room_id = settings.broadcaster_id
+        state.emote_mode = settings.emote_mode
+        state.follower_mode = settings.follower_mode
+        state.follower_mode_duration = settings.follower_mode_duration or 0
+        state.slow_mode = settings.slow_mode
+        state.slow_mode_wait_time = settings.slow_mode_wait_time or 0
+        state.subscriber_mode = settings.subscriber_mode
+        state.unique_chat_mode = settings.unique_chat_mode
+
+        self.__complete.add(channel)
+
+    def is_cold(self, channel: str) -> bool:
+        """
+        Checks whether the settings of a chat haven't been received yet
+
+        Args:
+            channel (str): Channel's name
+
+        Returns:
+            bool
+        """
+
+        return channel not in self.__complete
+
+    def get(self, channel: str) -> ChatState | None:
+        """
+        Gets the state of a chat
+
+        Args:
+            channel (str): Channel's name
+
+        Returns:
+            ChatState | None: A copy of the state, None if nothing is known about the chat
+        """
+
+        state = self.__states.get(channel)
+
+        return dataclasses.replace(state) if state is not None else None
+
+    def discard(self, channel: str) -> None:
+        """
+        Forgets the state of a chat
+
+        Args:
+            channel (str): Channel's name
+        """
+
+        self.__states.pop(channel, None)
+        self.__complete.discard(channel)
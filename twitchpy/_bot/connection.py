@@ -0,0 +1,164 @@
+import socket
+import ssl
+
+_RECV_SIZE = 4096
+_LINE_SEPARATOR = b"\r\n"
+
+
+class Connection:
+    """
+    Represents one of the IRC connections a bot spreads its channels across
+    """
+
+    def __init__(self, shard_id: int, context: ssl.SSLContext):
+        """
+        Args:
+            shard_id (int): Number that identifies the connection inside the bot
+            context (ssl.SSLContext): Context used to wrap the connection's socket
+        """
+
+        self.shard_id = shard_id
+        self.channels: set[str] = set()
+        self.socket: ssl.SSLSocket | None = None
+        self.__context = context
+        self.__timeout: float | None = None
+        self.__buffer = b""
+
+    @property
+    def alive(self) -> bool:
+        """
+        Whether the connection is open
+        """
+
+        return self.socket is not None
+
+    @property
+    def session(self) -> ssl.SSLSession | None:
+        """
+        TLS session of the connection, which can be reused to open other connections faster
+        """
+
+        if self.socket is None:
+            return None
+
+        return self.socket.session
+
+    @property
+    def session_reused(self) -> bool:
+        """
+        Whether the connection resumed a previous TLS session
+        """
+
+        return self.socket is not None and self.socket.session_reused
+
+    def open(
+        self,
+        host: str,
+        port: int,
+        timeout: float,
+        session: ssl.SSLSession | None = None,
+    ) -> None:
+        """
+        Opens the connection
+
+        Args:
+            host (str): IRC server
+            port (int): IRC server's port
+            timeout (float): Seconds to wait for socket operations
+            session (ssl.SSLSession | None): TLS session to resume, which skips part of the handshake
+        """
+
+        raw_socket = socket.create_connection((host, port), timeout)
+
+        try:
+            self.socket = self.__context.wrap_socket(
+                raw_socket, server_hostname=host, session=session
+            )
+
+        except (OSError, ValueError):
+            raw_socket.close()
+            raise
+        self.__timeout = timeout
+        self.__buffer = b""
+
+        # Reads only happen when select() reports data, and must not block on
+        # TLS records that carry no application data (e.g. session tickets)
+        self.socket.setblocking(False)
+
+    def close(self) -> None:
+        """
+        Closes the connection
+        """
+
+        if self.socket is None:
+            return
+
+        try:
+            self.socket.close()
+
+        except OSError:
+            pass
+
+        self.socket = None
+
+    def fileno(self) -> int:
+        return self.socket.fileno() if self.socket is not None else -1
+
+    def send(self, data: bytes) -> None:
+        """
+        Writes the whole data to the connection
+
+        Args:
+            data (bytes): Data to write
+        """
+
+        if self.socket is None:
+            raise ConnectionError(f"Connection {self.shard_id} is closed")
+
+        self.socket.settimeout(self.__timeout)
+
+        try:
+            self.socket.sendall(data)
+
+        finally:
+            if self.socket is not None:
+                self.socket.setblocking(False)
+
+    def receive(self) -> list[str]:
+        """
+        Reads the lines that are available on the connection
+        Incomplete lines are kept until the rest of them is received
+
+        Raises:
+            ConnectionError: If the server closed the connection
+
+        Returns:
+            list[str]
+        """
+
+        if self.socket is None:
+            raise ConnectionError(f"Connection {self.shard_id} is closed")
+
+        data = b""
+
+        while True:
+            try:
+                chunk = self.socket.recv(_RECV_SIZE)
+
+            except (ssl.SSLWantReadError, ssl.SSLWantWriteError, BlockingIOError):
+                break
+
+            if not chunk:
+                raise ConnectionError(
+                    f"Connection {self.shard_id} closed by the server"
+                )
+
+            data += chunk
+
+            # TLS may hold already decrypted data that select() doesn't report
+            if self.socket.pending() == 0 and len(chunk) < _RECV_SIZE:
+                break
+
+        *lines, self.__buffer = (self.__buffer + data).split(_LINE_SEPARATOR)
+
+        return [line.decode(errors="replace") for line in lines]
@@ -0,0 +1,125 @@
+from collections import OrderedDict
+
+_GLOBAL = 0
+_CHANNEL = 1
+_USER = 2
+
+
+class _Window:
+    __slots__ = ("started_at", "uses")
+
+    def __init__(self, started_at: float):
+        self.started_at = started_at
+        self.uses = 0
+
+
+class Cooldowns:
+    """
+    Tracks the global, per-channel and per-user cooldowns of a bot's commands
+    The windows are kept in least recently used order, so the memory used is bounded
+    no matter how many users invoke the commands
+    """
+
+    def __init__(self, max_entries: int):
+        """
+        Args:
+            max_entries (int): Maximum number of windows kept, the least recently used are evicted first
+        """
+
+        self.__max_entries = max(1, max_entries)
+        self.__limits: dict[str, tuple[tuple[float, float, float], int]] = {}
+        self.__windows: OrderedDict[tuple, _Window] = OrderedDict()
+
+    def set(
+        self,
+        command: str,
+        global_cooldown: float,
+        channel_cooldown: float,
+        user_cooldown: float,
+        uses: int,
+    ) -> None:
+        """
+        Sets the cooldowns of a command
+        A command without cooldowns is never limited
+
+        Args:
+            command (str): Command's name
+            global_cooldown (float): Seconds of the window shared by every channel
+            channel_cooldown (float): Seconds of the window of each channel
+            user_cooldown (float): Seconds of the window of each user in each channel
+            uses (int): Invocations allowed inside each window
+        """
+
+        self.remove(command)
+
+        if global_cooldown > 0 or channel_cooldown > 0 or user_cooldown > 0:
+            self.__limits[command] = (
+                (global_cooldown, channel_cooldown, user_cooldown),
+                max(1, uses),
+            )
+
+    def remove(self, command: str) -> None:
+        """
+        Drops the cooldowns of a command
+
+        Args:
+            command (str): Command's name
+        """
+
+        if self.__limits.pop(command, None) is None:
+            return
+
+        for key in [key for key in self.__windows if key[0] == command]:
+            self.__windows.pop(key)
+
+    def acquire(self, command: str, channel: str, user: str, now: float) -> bool:
+        """
+        Registers an invocation of a command if none of its cooldowns is active
+
+        Args:
+            command (str): Command's name
+            channel (str): Channel where the command was invoked
+            user (str): User who invoked the command
+            now (float): Current monotonic time
+
+        Returns:
+            bool: Whether the command can run
+        """
+
+        limits = self.__limits.get(command)
+
+        if limits is None:
+            return True
+
+        cooldowns, uses = limits
+        keys = (
+            (command, _GLOBAL),
+            (command, _CHANNEL, channel),
+            (command, _USER, channel, user),
+        )
+        windows = []
+
+        for key, cooldown in zip(keys, cooldowns):
+            if cooldown <= 0:
+                continue
+
+            window = self.__windows.get(key)
+
+            if window is None or now - window.started_at >= cooldown:
+                window = _Window(now)
+
+            elif window.uses >= uses:
+                return False
+
+            windows.append((key, window))
+
+        # Windows are only updated once every scope allowed the invocation
+        for key, window in windows:
+            window.uses += 1
+            self.__windows[key] = window
+            self.__windows.move_to_end(key)
+
+        while len(self.__windows) > self.__max_entries:
+            self.__windows.popitem(last=False)
+
+        return True
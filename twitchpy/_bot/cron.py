@@ -0,0 +1,119 @@
+from datetime import datetime, timedelta
+
+_FIELD_RANGES = ((0, 59), (0, 23), (1, 31), (1, 12), (0, 7))
+_MAX_SEARCHED_DAYS = 366 * 5
+
+
+def _parse_field(field: str, minimum: int, maximum: int) -> frozenset[int]:
+    values = set()
+
+    for part in field.split(","):
+        step = 1
+
+        if "/" in part:
+            part, raw_step = part.split("/", 1)
+            step = int(raw_step)
+
+            if step <= 0:
+                raise ValueError(f"Invalid cron step: {raw_step}")
+
+        if part == "*":
+            start, end = minimum, maximum
+
+        elif "-" in part:
+            raw_start, raw_end = part.split("-", 1)
+            start, end = int(raw_start), int(raw_end)
+
+        else:
+            start = int(part)
+            end = maximum if step != 1 else start
+
+        if start < minimum or end > maximum or start > end:
+            raise ValueError(f"Cron field out of range: {field}")
+
+        values.update(range(start, end + 1, step))
+
+    return frozenset(values)
+
+
+class CronSchedule:
+    """
+    Represents a cron expression with minute, hour, day of month, month and day of week fields
+    """
+
+    def __init__(self, expression: str):
+        """
+        Args:
+            expression (str): Cron expression, e.g. "*/5 * * * *"
+                Days of the week go from 0 (Sunday) to 6, 7 is also Sunday
+
+        Raises:
+            ValueError: If the expression is not valid
+        """
+
+        fields = expression.split()
+
+        if len(fields) != 5:
+            raise ValueError(f"Cron expressions need 5 fields: {expression}")
+
+        minutes, hours, days, months, weekdays = (
+            _parse_field(field, minimum, maximum)
+            for field, (minimum, maximum) in zip(fields, _FIELD_RANGES)
+        )
+
+        self.expression = expression
+        self.__minutes = minutes
+        self.__hours = hours
+        self.__days = days
+        self.__months = months
+        self.__weekdays = frozenset(weekday % 7 for weekday in weekdays)
+        # As in Vixie cron, a field starting with "*", like "*/2", counts as unrestricted
+        self.__any_day = fields[2].startswith("*")
+        self.__any_weekday = fields[4].startswith("*")
+
+    def __matches_day(self, moment: datetime) -> bool:
+        day_matches = moment.day in self.__days
+        weekday_matches = (moment.weekday() + 1) % 7 in self.__weekdays
+
+        # As in cron, a restricted day of month and day of week match either one
+        if not self.__any_day and not self.__any_weekday:
+            return day_matches or weekday_matches
+
+        return day_matches and weekday_matches
+
+    def next_after(self, moment: datetime) -> datetime:
+        """
+        Gets the first time after a moment that matches the expression
+
+        Args:
+            moment (datetime): Moment to start searching from
+
+        Raises:
+            ValueError: If the expression never matches
+
+        Returns:
+            datetime
+        """
+
+        candidate = moment.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        limit = candidate + timedelta(days=_MAX_SEARCHED_DAYS)
+
+        while candidate < limit:
+            if candidate.month not in self.__months:
+                candidate = (candidate.replace(day=1) + timedelta(days=32)).replace(
+                    day=1, hour=0, minute=0
+                )
+
+            elif not self.__matches_day(candidate):
+                candidate = candidate.replace(hour=0, minute=0) + timedelta(days=1)
+
+            elif candidate.hour not in self.__hours:
+                candidate = candidate.replace(minute=0) + timedelta(hours=1)
+
+            elif candidate.minute not in self.__minutes:
+                candidate += timedelta(minutes=1)
+
+            else:
+                return candidate
+
+        raise ValueError(f"Cron expression never matches: {self.expression}")
@@ -0,0 +1,154 @@
+import sys
+from collections import Counter, OrderedDict, deque
+
+from ..dataclasses import EmoteSpans, EmoteUsage
+
+
+def parse_emotes(value: str | None, text: str | None) -> EmoteSpans | None:
+    """
+    Parses the value of an emotes tag, e.g. "25:0-4,12-16/1902:6-10"
+    Spans that don't fit in the text are dropped
+
+    Args:
+        value (str | None): Value of the tag
+        text (str | None): Message's text
+
+    Returns:
+        EmoteSpans | None: Spans sorted by position, None if the message has no emotes
+    """
+
+    if not value or text is None:
+        return None
+
+    spans = []
+
+    for emote in value.split("/"):
+        emote_id, _, positions = emote.partition(":")
+        emote_id = sys.intern(emote_id)
+
+        for position in positions.split(","):
+            raw_start, _, raw_end = position.partition("-")
+
+            if not raw_start.isdigit() or not raw_end.isdigit():
+                continue
+
+            # Twitch counts code points and gives the index of the last character
+            start, end = int(raw_start), int(raw_end) + 1
+
+            if start < end <= len(text):
+                spans.append((start, end, emote_id))
+
+    if len(spans) == 0:
+        return None
+
+    spans.sort()
+    emotes = EmoteSpans()
+
+    for start, end, emote_id in spans:
+        emotes.ids.append(emote_id)
+        emotes.starts.append(start)
+        emotes.ends.append(end)
+
+    return emotes
+
+
+class EmoteUsageAggregator:
+    """
+    Counts the emotes used in each channel over a sliding window
+    Counts are kept in buckets, so old usage expires a bucket at a time
+    """
+
+    def __init__(self, period: float, resolution: float, max_names: int):
+        """
+        Args:
+            period (float): Longest window that can be queried, in seconds
+            resolution (float): Seconds covered by each bucket
+            max_names (int): Maximum number of emote names remembered
+        """
+
+        self.__period = period
+        self.__resolution = resolution
+        self.__max_names = max_names
+        self.__buckets: dict[str, deque[tuple[int, Counter]]] = {}
+        self.__names: OrderedDict[str, str] = OrderedDict()
+
+    def __expire(self, buckets: deque[tuple[int, Counter]], now: float) -> None:
+        oldest = int((now - self.__period) // self.__resolution)
+
+        while len(buckets) > 0 and buckets[0][0] <= oldest:
+            buckets.popleft()
+
+    def add(self, channel: str, emotes: EmoteSpans, text: str, now: float) -> None:
+        """
+        Counts the emotes of a message
+
+        Args:
+            channel (str): Channel of the message
+            emotes (EmoteSpans): Emotes of the message
+            text (str): Message's text
+            now (float): Current monotonic time
+        """
+
+        buckets = self.__buckets.setdefault(channel, deque())
+        bucket = int(now // self.__resolution)
+
+        self.__expire(buckets, now)
+
+        if len(buckets) == 0 or buckets[-1][0] != bucket:
+            buckets.append((bucket, Counter()))
+
+        buckets[-1][1].update(emotes.ids)
+
+        for emote_id, name in zip(emotes.ids, emotes.names(text)):
+            self.__names[emote_id] = name
+            self.__names.move_to_end(emote_id)
+
+        while len(self.__names) > self.__max_names:
+            self.__names.popitem(last=False)
+
+    def discard(self, channel: str) -> None:
+        """
+        Drops the counts of a channel
+
+        Args:
+            channel (str): Channel's name
+        """
+
+        self.__buckets.pop(channel, None)
+
+    def top(
+        self, channel: str, window: float, limit: int | None, now: float
+    ) -> list[EmoteUsage]:
+        """
+        Gets the most used emotes of a channel
+
+        Args:
+            channel (str): Channel's name
+            window (float): Seconds to look back, up to the aggregator's period
+            limit (int | None): Maximum number of emotes returned, None for all of them
+            now (float): Current monotonic time
+
+        Returns:
+            list[EmoteUsage]: Emotes sorted from most to least used
+        """
+
+        buckets = self.__buckets.get(channel)
+
+        if buckets is None:
+            return []
+
+        self.__expire(buckets, now)
+
+        oldest = int((now - min(window, self.__period)) // self.__resolution)
+        counts = Counter()
+
+        for bucket, bucket_counts in reversed(buckets):
+            if bucket <= oldest:
+                break
+
+            counts.update(bucket_counts)
+
+        return [
+            EmoteUsage(emote_id, self.__names.get(emote_id, ""), count)
+            for emote_id, count in counts.most_common(limit)
+        ]
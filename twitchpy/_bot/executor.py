@@ -0,0 +1,61 @@
+import threading
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from typing import Callable
+
+
+class LazyExecutor(Executor):
+    """
+    Thread pool that starts its workers on the first submitted task, and can be started again after a shutdown
+    """
+
+    def __init__(self, max_workers: int, thread_name_prefix: str):
+        """
+        Args:
+            max_workers (int): Maximum number of worker threads
+            thread_name_prefix (str): Prefix of the names of the worker threads
+        """
+
+        self.__max_workers = max_workers
+        self.__thread_name_prefix = thread_name_prefix
+        self.__executor: ThreadPoolExecutor | None = None
+        self.__lock = threading.Lock()
+
+    def submit(self, fn: Callable, /, *args, **kwargs) -> Future:
+        """
+        Schedules a task on a worker
+
+        Args:
+            fn (Callable): Task
+            *args: Positional arguments of the task
+            **kwargs: Keyword arguments of the task
+
+        Returns:
+            Future: Result of the task
+        """
+
+        with self.__lock:
+            if self.__executor is None:
+                self.__executor = ThreadPoolExecutor(
+                    max_workers=self.__max_workers,
+                    thread_name_prefix=self.__thread_name_prefix,
+                )
+
+            return self.__executor.submit(fn, *args, **kwargs)
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False) -> None:
+        """
+        Stops the workers, a later task starts new ones
+
+        Args:
+            wait (bool): Whether to wait for the running tasks to finish
+                Default: True
+            cancel_futures (bool): Whether to cancel the tasks that haven't started
+                Default: False
+        """
+
+        with self.__lock:
+            executor = self.__executor
+            self.__executor = None
+
+        if executor is not None:
+            executor.shutdown(wait, cancel_futures=cancel_futures)
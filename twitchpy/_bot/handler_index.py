@@ -0,0 +1,164 @@
+import itertools
+import re
+
+from ..dataclasses import Message
+
+
+class _Filter:
+    __slots__ = ("sequence", "channels", "users", "badges", "message_types", "pattern")
+
+    def __init__(
+        self,
+        sequence: int,
+        channels: frozenset[str] | None,
+        users: frozenset[str] | None,
+        badges: frozenset[str] | None,
+        message_types: frozenset[str] | None,
+        pattern: re.Pattern | None,
+    ):
+        self.sequence = sequence
+        self.channels = channels
+        self.users = users
+        self.badges = badges
+        self.message_types = message_types
+        self.pattern = pattern
+
+
+def _normalize(values: list[str] | None, transform) -> frozenset[str] | None:
+    if values is None:
+        return None
+
+    return frozenset(transform(value) for value in values)
+
+
+class HandlerIndex:
+    """
+    Indexes the filters of a bot's handlers by message type and channel,
+    so each message is only checked against the handlers that can match it
+    """
+
+    def __init__(self):
+        self.__filters: dict[str, _Filter] = {}
+        self.__index: dict[str | None, dict[str | None, list[str]]] = {}
+        self.__sequence = itertools.count()
+
+    def add(
+        self,
+        name: str,
+        channels: list[str] | None = None,
+        users: list[str] | None = None,
+        badges: list[str] | None = None,
+        message_types: list[str] | None = None,
+        pattern: str | None = None,
+    ) -> None:
+        """
+        Registers the filters of a handler, replacing the filters of any handler with the same name
+        Filters left as None match every message
+
+        Args:
+            name (str): Handler's name
+            channels (list[str] | None): Channels whose messages match
+            users (list[str] | None): Users whose messages match
+            badges (list[str] | None): Badges, e.g. "moderator", of which the sender must have at least one
+            message_types (list[str] | None): IRC commands, e.g. "PRIVMSG", of the messages that match
+            pattern (str | None): Regular expression that must be found in the message's text
+
+        Raises:
+            re.error: If the pattern is not a valid regular expression
+        """
+
+        handler_filter = _Filter(
+            next(self.__sequence),
+            _normalize(channels, lambda channel: channel.replace("#", "").lower()),
+            _normalize(users, lambda user: user.replace("@", "").lower()),
+            _normalize(badges, str.lower),
+            _normalize(message_types, str.upper),
+            re.compile(pattern) if pattern is not None else None,
+        )
+
+        self.remove(name)
+        self.__filters[name] = handler_filter
+
+        for message_type in handler_filter.message_types or (None,):
+            by_channel = self.__index.setdefault(message_type, {})
+
+            for channel in handler_filter.channels or (None,):
+                by_channel.setdefault(channel, []).append(name)
+
+    def remove(self, name: str) -> None:
+        """
+        Unregisters the filters of a handler
+
+        Args:
+            name (str): Handler's name
+        """
+
+        handler_filter = self.__filters.pop(name, None)
+
+        if handler_filter is None:
+            return
+
+        for message_type in handler_filter.message_types or (None,):
+            by_channel = self.__index[message_type]
+
+            for channel in handler_filter.channels or (None,):
+                by_channel[channel].remove(name)
+
+                if len(by_channel[channel]) == 0:
+                    by_channel.pop(channel)
+
+            if len(by_channel) == 0:
+                self.__index.pop(message_type)
+
+    def match(self, message: Message) -> list[str]:
+        """
+        Gets the handlers whose filters match a message
+
+        Args:
+            message (Message): Received message
+
+        Returns:
+            list[str]: Names of the matching handlers, in the order they were added
+        """
+
+        candidates = []
+
+        for message_type in {message.irc_command, None}:
+            by_channel = self.__index.get(message_type)
+
+            if by_channel is None:
+                continue
+
+            for channel in {message.channel, None}:
+                candidates.extend(by_channel.get(channel, ()))
+
+        if len(candidates) == 0:
+            return []
+
+        names = []
+
+        for name in candidates:
+            handler_filter = self.__filters[name]
+
+            if handler_filter.users is not None and message.user not in (
+                handler_filter.users
+            ):
+                continue
+
+            if handler_filter.badges is not None and handler_filter.badges.isdisjoint(
+                message.badges
+            ):
+                continue
+
+            if handler_filter.pattern is not None and (
+                message.text is None
+                or handler_filter.pattern.search(message.text) is None
+            ):
+                continue
+
+            names.append(name)
+
+        if len(names) > 1:
+            names.sort(key=lambda name: self.__filters[name].sequence)
+
+        return names
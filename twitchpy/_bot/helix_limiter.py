@@ -0,0 +1,38 @@
+import threading
+import time
+
+from .rate_limit import RateLimiter
+
+
+class HelixRateLimiter:
+    """
+    Shares the Helix rate limit of a token between the threads that call the API
+    Callers wait until the limit allows their request
+    """
+
+    def __init__(self, limit: int, period: float):
+        """
+        Args:
+            limit (int): Requests allowed inside the window
+            period (float): Length of the window, in seconds
+        """
+
+        self.__limiter = RateLimiter(limit, period)
+        self.__lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """
+        Waits until a request can be made and registers it
+        """
+
+        while True:
+            with self.__lock:
+                now = time.monotonic()
+                delay = self.__limiter.delay(now)
+
+                if delay <= 0:
+                    self.__limiter.acquire(now)
+
+                    return
+
+            time.sleep(delay)
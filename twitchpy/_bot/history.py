@@ -0,0 +1,160 @@
+import dataclasses
+import sys
+from collections import OrderedDict, deque
+
+from ..dataclasses import HistoryEntry
+
+# Rough size of an entry without its text, used to keep the memory under the cap
+_ENTRY_OVERHEAD = 400
+
+
+class MessageHistory:
+    """
+    Keeps the last messages of each user in each channel
+    Users are evicted in least recently active order when the memory cap is reached
+    """
+
+    def __init__(self, messages_per_user: int, max_memory: int):
+        """
+        Args:
+            messages_per_user (int): Messages kept for each user in each channel
+            max_memory (int): Approximate maximum number of bytes used by the kept messages
+        """
+
+        self.__messages_per_user = max(1, messages_per_user)
+        self.__max_memory = max_memory
+        self.__buffers: OrderedDict[tuple[str, str], deque[HistoryEntry]] = (
+            OrderedDict()
+        )
+        self.__by_message_id: dict[str, HistoryEntry] = {}
+        self.__users_by_channel: dict[str, set[str]] = {}
+        self.__memory = 0
+
+    def __size_of(self, entry: HistoryEntry) -> int:
+        return _ENTRY_OVERHEAD + sys.getsizeof(entry.text)
+
+    def __forget(self, entry: HistoryEntry) -> None:
+        self.__memory -= self.__size_of(entry)
+
+        if entry.message_id is not None:
+            self.__by_message_id.pop(entry.message_id, None)
+
+    def __evict(self) -> None:
+        key, buffer = self.__buffers.popitem(last=False)
+
+        for entry in buffer:
+            self.__forget(entry)
+
+        channel, user_id = key
+        users = self.__users_by_channel[channel]
+        users.discard(user_id)
+
+        if len(users) == 0:
+            self.__users_by_channel.pop(channel)
+
+    def add(self, entry: HistoryEntry) -> None:
+        """
+        Keeps a message
+
+        Args:
+            entry (HistoryEntry): Message to keep
+        """
+
+        key = (entry.channel, entry.user_id)
+        buffer = self.__buffers.get(key)
+
+        if buffer is None:
+            buffer = deque()
+            self.__buffers[key] = buffer
+            self.__users_by_channel.setdefault(entry.channel, set()).add(entry.user_id)
+
+        else:
+            self.__buffers.move_to_end(key)
+
+        if len(buffer) == self.__messages_per_user:
+            self.__forget(buffer.popleft())
+
+        buffer.append(entry)
+        self.__memory += self.__size_of(entry)
+
+        if entry.message_id is not None:
+            self.__by_message_id[entry.message_id] = entry
+
+        while self.__memory > self.__max_memory and len(self.__buffers) > 1:
+            self.__evict()
+
+    def get_message(self, message_id: str) -> HistoryEntry | None:
+        """
+        Gets a kept message by its ID
+
+        Args:
+            message_id (str): Message's ID
+
+        Returns:
+            HistoryEntry | None: A copy of the message, None if it isn't kept
+        """
+
+        entry = self.__by_message_id.get(message_id)
+
+        return dataclasses.replace(entry) if entry is not None else None
+
+    def get_user_messages(self, channel: str, user_id: str) -> list[HistoryEntry]:
+        """
+        Gets the kept messages of a user in a channel
+
+        Args:
+            channel (str): Channel's name
+            user_id (str): User's ID
+
+        Returns:
+            list[HistoryEntry]: Copies of the messages, from oldest to newest
+        """
+
+        return [
+            dataclasses.replace(entry)
+            for entry in self.__buffers.get((channel, user_id), ())
+        ]
+
+    def delete_message(self, message_id: str) -> None:
+        """
+        Marks a message as deleted
+
+        Args:
+            message_id (str): Message's ID
+        """
+
+        entry = self.__by_message_id.get(message_id)
+
+        if entry is not None:
+            entry.deleted = True
+
+    def delete_user_messages(self, channel: str, user_id: str | None) -> None:
+        """
+        Marks as deleted the messages of a user in a channel, or of the whole channel
+
+        Args:
+            channel (str): Channel's name
+            user_id (str | None): User's ID, None for every user of the channel
+        """
+
+        user_ids = (
+            [user_id]
+            if user_id is not None
+            else self.__users_by_channel.get(channel, ())
+        )
+
+        for current_user_id in user_ids:
+            for entry in self.__buffers.get((channel, current_user_id), ()):
+                entry.deleted = True
+
+    def discard(self, channel: str) -> None:
+        """
+        Forgets the messages of a channel
+
+        Args:
+            channel (str): Channel's name
+        """
+
+        for user_id in self.__users_by_channel.pop(channel, set()):
+            for entry in self.__buffers.pop((channel, user_id), ()):
+                self.__forget(entry)
@@ -0,0 +1,153 @@
+import logging
+import queue
+from logging.handlers import QueueListener
+
+from ..dataclasses import Message
+
+
+class IrcLog:
+    """
+    Logs the IRC lines a bot sends and receives, at a level chosen for each command
+    The lines of a command can be sampled, and they can be handed to a handler that formats and writes them in a
+    background thread
+    """
+
+    def __init__(
+        self,
+        logger: logging.Logger,
+        default_level: int,
+        levels: dict[str, int],
+        sample_rates: dict[str, int],
+        sink: logging.Handler | None,
+    ):
+        """
+        Args:
+            logger (logging.Logger): Logger of the lines
+            default_level (int): Level of the commands without one
+            levels (dict[str, int]): Level of the lines of each command
+            sample_rates (dict[str, int]): For each command, only 1 line of every N is logged
+            sink (logging.Handler | None): Handler that receives the lines in a background thread instead of the
+                logger's handlers, None to log them through the logger
+        """
+
+        self.__logger = logger
+        self.__default_level = default_level
+        self.__levels = {command.upper(): level for command, level in levels.items()}
+        self.__sample_rates = {
+            command.upper(): rate for command, rate in sample_rates.items() if rate > 1
+        }
+        self.__sampled: dict[str, int] = {}
+        self.__sink = sink
+        self.__queue: queue.SimpleQueue | None = None
+        self.__listener: QueueListener | None = None
+        self.__started = False
+
+        if sink is not None:
+            self.__queue = queue.SimpleQueue()
+            self.__listener = QueueListener(
+                self.__queue, sink, respect_handler_level=True
+            )
+
+    def start(self) -> None:
+        """
+        Starts handing the lines to the sink
+        """
+
+        if self.__listener is not None and not self.__started:
+            self.__listener.start()
+            self.__started = True
+
+    def stop(self) -> None:
+        """
+        Writes the lines waiting for the sink and stops its thread
+        """
+
+        if self.__listener is not None and self.__started:
+            self.__listener.stop()
+            self.__started = False
+
+    def level(self, command: str | None) -> int:
+        """
+        Decides whether a line is logged, callers build the arguments only if it is
+
+        Args:
+            command (str | None): IRC command of the line
+
+        Returns:
+            int: Level of the line, 0 if it mustn't be logged
+        """
+
+        level = self.__levels.get(command, self.__default_level)
+
+        if self.__sink is not None:
+            if level < self.__sink.level:
+                return 0
+
+        elif not self.__logger.isEnabledFor(level):
+            return 0
+
+        rate = self.__sample_rates.get(command)
+
+        if rate is not None:
+            sampled = self.__sampled.get(command, 0)
+            self.__sampled[command] = sampled + 1
+
+            if sampled % rate != 0:
+                return 0
+
+        return level
+
+    def log_received(self, level: int, message: Message, text: str, *args) -> None:
+        """
+        Logs a received line, with its command, channel and user as fields of the record
+
+        Args:
+            level (int): Level returned by level
+            message (Message): Received message
+            text (str): Format of the line
+            *args: Arguments of the format
+        """
+
+        self.__log(
+            level,
+            text,
+            args,
+            {
+                "irc_direction": "received",
+                "irc_command": message.irc_command,
+                "irc_channel": message.channel,
+                "irc_user": message.user,
+            },
+        )
+
+    def log_sent(self, level: int, command: str, text: str, *args) -> None:
+        """
+        Logs a sent line, with its command as a field of the record
+
+        Args:
+            level (int): Level returned by level
+            command (str): IRC command of the line
+            text (str): Format of the line
+            *args: Arguments of the format
+        """
+
+        self.__log(level, text, args, {"irc_direction": "sent", "irc_command": command})
+
+    def __log(self, level: int, text: str, args: tuple, fields: dict) -> None:
+        if self.__queue is None:
+            self.__logger.log(level, text, *args, extra=fields)
+            return
+
+        # Formatted by the sink in the listener's thread
+        self.__queue.put_nowait(
+            self.__logger.makeRecord(
+                self.__logger.name,
+                level,
+                "(unknown file)",
+                0,
+                text,
+                args,
+                None,
+                extra=fields,
+            )
+        )
@@ -0,0 +1,213 @@
+from itertools import islice
+
+from ..dataclasses import JoinProgress
+from .rate_limit import RateLimiter
+
+
+class JoinScheduler:
+    """
+    Queues channel joins and releases them as fast as Twitch's JOIN rate limit allows
+    """
+
+    def __init__(self, limit: int, period: float, timeout: float):
+        """
+        Args:
+            limit (int): Maximum number of joins inside the window
+            period (float): Length of the window, in seconds
+            timeout (float): Seconds to wait for the server's confirmation of a sent join before giving it up
+        """
+
+        self.__limiter = RateLimiter(limit, period)
+        self.__timeout = timeout
+        self.__queued: dict[str, float] = {}
+        # Time each join was requested and sent at, in the order they were sent
+        self.__sent: dict[str, tuple[float, float]] = {}
+        self.__requested = 0
+        self.__joined = 0
+        self.__total_latency = 0.0
+        self.__max_latency: float | None = None
+
+    @property
+    def pending(self) -> int:
+        """
+        Number of joins waiting for the rate limit or for the server's confirmation
+        """
+
+        return len(self.__queued) + len(self.__sent)
+
+    def enqueue(self, channel: str, now: float) -> None:
+        """
+        Queues the join of a channel
+
+        Args:
+            channel (str): Channel to join
+            now (float): Current monotonic time
+        """
+
+        if channel in self.__queued:
+            return
+
+        # A join sent on a lost connection is sent again, not requested again
+        if self.__sent.pop(channel, None) is None:
+            self.__requested += 1
+
+        self.__queued[channel] = now
+
+    def discard(self, channel: str) -> bool:
+        """
+        Removes a channel from the queue
+
+        Args:
+            channel (str): Channel to remove
+
+        Returns:
+            bool: Whether the channel was waiting to be joined
+        """
+
+        self.__sent.pop(channel, None)
+
+        return self.__queued.pop(channel, None) is not None
+
+    def take(self, now: float) -> list[str]:
+        """
+        Gets the queued channels that can be joined right now
+
+        Args:
+            now (float): Current monotonic time
+
+        Returns:
+            list[str]
+        """
+
+        count = min(self.__limiter.available(now), len(self.__queued))
+
+        if count <= 0:
+            return []
+
+        channels = []
+
+        for channel in list(islice(self.__queued, count)):
+            self.__sent[channel] = (self.__queued.pop(channel), now)
+            channels.append(channel)
+
+        self.__limiter.acquire(now, count)
+
+        return channels
+
+    def restore(self, channels: list[str]) -> None:
+        """
+        Puts back at the front of the queue taken channels that couldn't be joined
+
+        Args:
+            channels (list[str]): Channels in the order they were taken
+        """
+
+        restored = {
+            channel: self.__sent.pop(channel)[0]
+            for channel in channels
+            if channel in self.__sent
+        }
+        restored.update(self.__queued)
+        self.__queued = restored
+
+    def expire(self, now: float) -> list[str]:
+        """
+        Gives up the sent joins the server hasn't confirmed in time, e.g. of banned or suspended channels
+
+        Args:
+            now (float): Current monotonic time
+
+        Returns:
+            list[str]: Channels whose join was given up
+        """
+
+        expired = []
+
+        for channel, (_, sent_at) in self.__sent.items():
+            if now - sent_at < self.__timeout:
+                break
+
+            expired.append(channel)
+
+        for channel in expired:
+            self.__sent.pop(channel)
+
+        return expired
+
+    def fail(self, channel: str) -> bool:
+        """
+        Gives up a sent join the server refused
+
+        Args:
+            channel (str): Channel that couldn't be joined
+
+        Returns:
+            bool: Whether the join was waiting for the server's confirmation
+        """
+
+        return self.__sent.pop(channel, None) is not None
+
+    def delay(self, now: float) -> float | None:
+        """
+        Gets the seconds to wait until the next queued channel can be joined, or the oldest sent join expires
+
+        Args:
+            now (float): Current monotonic time
+
+        Returns:
+            float | None: None if there are no pending joins
+        """
+
+        delays = []
+
+        if len(self.__queued) > 0:
+            delays.append(self.__limiter.delay(now))
+
+        if len(self.__sent) > 0:
+            _, sent_at = next(iter(self.__sent.values()))
+            delays.append(max(0.0, sent_at + self.__timeout - now))
+
+        return min(delays, default=None)
+
+    def confirm(self, channel: str, now: float) -> float | None:
+        """
+        Registers the server's confirmation of a join
+
+        Args:
+            channel (str): Joined channel
+            now (float): Current monotonic time
+
+        Returns:
+            float | None: Seconds since the join was requested, None if it wasn't pending
+        """
+
+        times = self.__sent.pop(channel, None)
+
+        if times is None:
+            return None
+
+        latency = now - times[0]
+
+        self.__joined += 1
+        self.__total_latency += latency
+
+        if self.__max_latency is None or latency > self.__max_latency:
+            self.__max_latency = latency
+
+        return latency
+
+    def progress(self) -> JoinProgress:
+        """
+        Gets the progress of the requested joins
+
+        Returns:
+            JoinProgress
+        """
+
+        return JoinProgress(
+            self.__requested,
+            self.__joined,
+            self.pending,
+            self.__total_latency / self.__joined if self.__joined > 0 else None,
+            self.__max_latency,
+        )
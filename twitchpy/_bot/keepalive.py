@@ -0,0 +1,186 @@
+import itertools
+import math
+from collections import deque
+
+from ..dataclasses import PingStats
+from .connection import Connection
+
+_TOKEN_PREFIX = "twitchpy-"
+
+
+class _PingState:
+    def __init__(self, next_ping_at: float):
+        self.next_ping_at = next_ping_at
+        self.token: str | None = None
+        self.sent_at: float | None = None
+        self.missed = 0
+
+
+class Keepalive:
+    """
+    Sends PINGs through idle connections and detects the ones that stopped answering
+    """
+
+    def __init__(self, interval: float, timeout: float, max_missed: int, samples: int):
+        """
+        Args:
+            interval (float): Seconds between PINGs of a connection
+            timeout (float): Seconds to wait for the PONG of a PING
+            max_missed (int): Consecutive unanswered PINGs after which a connection is dead
+            samples (int): Number of recent round-trip times kept for the percentiles
+        """
+
+        self.__interval = interval
+        self.__timeout = timeout
+        self.__max_missed = max(1, max_missed)
+        self.__states: dict[Connection, _PingState] = {}
+        self.__tokens = itertools.count(1)
+        self.__rtts: deque[float] = deque(maxlen=samples)
+        self.__sent = 0
+        self.__answered = 0
+        self.__missed = 0
+        self.__dead = 0
+        self.__last_rtt: float | None = None
+
+    def watch(self, connection: Connection, now: float) -> None:
+        """
+        Starts watching a connection
+
+        Args:
+            connection (Connection): Opened connection
+            now (float): Current monotonic time
+        """
+
+        self.__states[connection] = _PingState(now + self.__interval)
+
+    def forget(self, connection: Connection) -> None:
+        """
+        Stops watching a connection
+
+        Args:
+            connection (Connection): Closed connection
+        """
+
+        self.__states.pop(connection, None)
+
+    def due(self, now: float) -> tuple[list[tuple[Connection, str]], list[Connection]]:
+        """
+        Gets the connections that need a PING and the ones that are dead
+
+        Args:
+            now (float): Current monotonic time
+
+        Returns:
+            tuple[list[tuple[Connection, str]], list[Connection]]: Connections to PING with the token of each PING,
+                and connections that missed too many PONGs
+        """
+
+        pings = []
+        dead = []
+
+        for connection, state in self.__states.items():
+            if state.sent_at is not None and now - state.sent_at >= self.__timeout:
+                state.missed += 1
+                state.token = None
+                state.sent_at = None
+                self.__missed += 1
+
+                if state.missed >= self.__max_missed:
+                    self.__dead += 1
+                    dead.append(connection)
+                    continue
+
+                # An unanswered PING is retried right away instead of after an interval
+                state.next_ping_at = now
+
+            if state.sent_at is None and state.next_ping_at <= now:
+                state.token = f"{_TOKEN_PREFIX}{next(self.__tokens)}"
+                state.sent_at = now
+                self.__sent += 1
+                pings.append((connection, state.token))
+
+        return pings, dead
+
+    def pong(self, connection: Connection, token: str | None, now: float) -> bool:
+        """
+        Registers a PONG received through a connection
+
+        Args:
+            connection (Connection): Connection that received the PONG
+            token (str | None): Text of the PONG
+            now (float): Current monotonic time
+
+        Returns:
+            bool: Whether the PONG answered a PING of the keepalive
+        """
+
+        state = self.__states.get(connection)
+
+        if state is None or state.token is None or token != state.token:
+            return False
+
+        rtt = now - state.sent_at
+
+        state.token = None
+        state.sent_at = None
+        state.missed = 0
+        state.next_ping_at = now + self.__interval
+
+        self.__answered += 1
+        self.__last_rtt = rtt
+        self.__rtts.append(rtt)
+
+        return True
+
+    def delay(self, now: float) -> float | None:
+        """
+        Gets the seconds until a connection needs a PING or its PONG is late
+
+        Args:
+            now (float): Current monotonic time
+
+        Returns:
+            float | None: None if there are no watched connections
+        """
+
+        deadlines = [
+            (
+                state.sent_at + self.__timeout
+                if state.sent_at is not None
+                else state.next_ping_at
+            )
+            for state in self.__states.values()
+        ]
+
+        if len(deadlines) == 0:
+            return None
+
+        return max(0, min(deadlines) - now)
+
+    def stats(self) -> PingStats:
+        """
+        Gets the statistics of the PINGs
+
+        Returns:
+            PingStats
+        """
+
+        rtts = sorted(self.__rtts)
+
+        def percentile(rank: float) -> float | None:
+            if len(rtts) == 0:
+                return None
+
+            return rtts[max(0, math.ceil(rank * len(rtts)) - 1)]
+
+        return PingStats(
+            self.__sent,
+            self.__answered,
+            self.__missed,
+            self.__dead,
+            self.__last_rtt,
+            percentile(0.5),
+            percentile(0.9),
+            percentile(0.99),
+            rtts[-1] if len(rtts) > 0 else None,
+        )
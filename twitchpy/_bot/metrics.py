@@ -0,0 +1,415 @@
+import bisect
+import math
+import threading
+from typing import Callable
+
+from ..dataclasses import MetricSample, MetricSnapshot
+
+COUNTER = "counter"
+GAUGE = "gauge"
+HISTOGRAM = "histogram"
+
+
+class _Cells:
+    """
+    Values of a metric, with a preallocated list of them for each thread that updates it
+    Each thread only writes its own list, so updates take no lock
+    """
+
+    def __init__(self, size: int):
+        self.__size = size
+        self.__cells: dict[int, list[float]] = {}
+        self.__lock = threading.Lock()
+
+    def get(self) -> list[float]:
+        cell = self.__cells.get(threading.get_ident())
+
+        if cell is None:
+            cell = [0.0] * self.__size
+
+            # Replaced instead of updated, so the readers never see it change size
+            with self.__lock:
+                self.__cells = {**self.__cells, threading.get_ident(): cell}
+
+        return cell
+
+    def totals(self) -> list[float]:
+        totals = [0.0] * self.__size
+
+        for cell in list(self.__cells.values()):
+            for index, value in enumerate(cell):
+                totals[index] += value
+
+        return totals
+
+
+class CounterChild:
+    """
+    Value of a counter for a set of labels
+    """
+
+    def __init__(self):
+        self.__cells = _Cells(1)
+
+    def inc(self, amount: float = 1) -> None:
+        """
+        Increases the counter
+
+        Args:
+            amount (float): Amount to add, it can't be negative
+                Default: 1
+        """
+
+        self.__cells.get()[0] += amount
+
+    def value(self) -> float:
+        """
+        Gets the current value of the counter
+
+        Returns:
+            float
+        """
+
+        return self.__cells.totals()[0]
+
+
+class GaugeChild:
+    """
+    Value of a gauge for a set of labels
+    """
+
+    def __init__(self):
+        self.__value = 0.0
+
+    def set(self, value: float) -> None:
+        """
+        Sets the gauge
+
+        Args:
+            value (float)
+        """
+
+        self.__value = value
+
+    def value(self) -> float:
+        """
+        Gets the current value of the gauge
+
+        Returns:
+            float
+        """
+
+        return self.__value
+
+
+class HistogramChild:
+    """
+    Distribution of the values observed by a histogram for a set of labels
+    """
+
+    def __init__(self, buckets: tuple[float, ...]):
+        self.__buckets = buckets
+        # One count per bucket and one for +Inf, then the sum and the count
+        self.__cells = _Cells(len(buckets) + 3)
+
+    def observe(self, value: float) -> None:
+        """
+        Records a value
+
+        Args:
+            value (float)
+        """
+
+        cell = self.__cells.get()
+        cell[bisect.bisect_left(self.__buckets, value)] += 1
+        cell[-2] += value
+        cell[-1] += 1
+
+    def values(self) -> tuple[list[float], float, float]:
+        """
+        Gets the observed values
+
+        Returns:
+            tuple[list[float], float, float]: Cumulative count of each bucket and +Inf, sum and count
+        """
+
+        totals = self.__cells.totals()
+        cumulative = []
+        count = 0.0
+
+        for bucket_count in totals[:-2]:
+            count += bucket_count
+            cumulative.append(count)
+
+        return cumulative, totals[-2], totals[-1]
+
+
+class Metric:
+    """
+    Metric with a value for each combination of its labels
+    """
+
+    def __init__(
+        self,
+        name: str,
+        description: str,
+        kind: str,
+        label_names: tuple[str, ...],
+        function: Callable[[], dict[tuple[str, ...], float]] | None = None,
+        buckets: tuple[float, ...] = (),
+    ):
+        """
+        Args:
+            name (str): Metric's name
+            description (str): What the metric measures
+            kind (str): Metric's type
+                Possible values: counter, gauge, histogram
+            label_names (tuple[str, ...]): Names of the labels
+            function (Callable[[], dict[tuple[str, ...], float]] | None): Gets the values by labels when the metric is
+                collected, instead of keeping them
+            buckets (tuple[float, ...]): Upper bounds of the buckets of a histogram, in ascending order
+        """
+
+        self.name = name
+        self.description = description
+        self.kind = kind
+        self.label_names = label_names
+        self.__function = function
+        self.__buckets = buckets
+        self.__children: dict[tuple[str, ...], object] = {}
+        self.__lock = threading.Lock()
+
+    def labels(self, *values: str):
+        """
+        Gets the value of a combination of labels, the result can be kept to update it without lookups
+
+        Args:
+            *values (str): Values of the labels, in the order of their names
+
+        Returns:
+            CounterChild | GaugeChild | HistogramChild
+        """
+
+        child = self.__children.get(values)
+
+        if child is not None:
+            return child
+
+        with self.__lock:
+            child = self.__children.get(values)
+
+            if child is None:
+                if self.kind == COUNTER:
+                    child = CounterChild()
+
+                elif self.kind == GAUGE:
+                    child = GaugeChild()
+
+                else:
+                    child = HistogramChild(self.__buckets)
+
+                self.__children = {**self.__children, values: child}
+
+        return child
+
+    def remove(self, *values: str) -> None:
+        """
+        Forgets the value of a combination of labels
+
+        Args:
+            *values (str): Values of the labels, in the order of their names
+        """
+
+        with self.__lock:
+            if values in self.__children:
+                self.__children = {
+                    labels: child
+                    for labels, child in self.__children.items()
+                    if labels != values
+                }
+
+    def collect(self) -> MetricSnapshot:
+        """
+        Gets the current values of the metric
+
+        Returns:
+            MetricSnapshot
+        """
+
+        samples = []
+
+        if self.__function is not None:
+            for values, value in self.__function().items():
+                samples.append(
+                    MetricSample(self.name, dict(zip(self.label_names, values)), value)
+                )
+
+            return MetricSnapshot(self.name, self.kind, self.description, samples)
+
+        for values, child in self.__children.items():
+            labels = dict(zip(self.label_names, values))
+
+            if self.kind != HISTOGRAM:
+                samples.append(MetricSample(self.name, labels, child.value()))
+                continue
+
+            buckets, total, count = child.values()
+
+            for bound, bucket_count in zip(self.__buckets + (math.inf,), buckets):
+                samples.append(
+                    MetricSample(
+                        f"{self.name}_bucket",
+                        {**labels, "le": _format_value(bound)},
+                        bucket_count,
+                    )
+                )
+
+            samples.append(MetricSample(f"{self.name}_sum", labels, total))
+            samples.append(MetricSample(f"{self.name}_count", labels, count))
+
+        return MetricSnapshot(self.name, self.kind, self.description, samples)
+
+
+class MetricsRegistry:
+    """
+    Keeps a bot's metrics and exports them
+    """
+
+    def __init__(self):
+        self.__metrics: dict[str, Metric] = {}
+
+    def __register(self, metric: Metric) -> Metric:
+        if metric.name in self.__metrics:
+            raise ValueError(f"Metric already registered: {metric.name}")
+
+        self.__metrics[metric.name] = metric
+
+        return metric
+
+    def counter(
+        self,
+        name: str,
+        description: str,
+        label_names: tuple[str, ...] = (),
+        function: Callable[[], dict[tuple[str, ...], float]] | None = None,
+    ) -> Metric:
+        """
+        Registers a value that only increases
+
+        Args:
+            name (str): Metric's name
+            description (str): What the metric counts
+            label_names (tuple[str, ...]): Names of the labels
+                Default: ()
+            function (Callable[[], dict[tuple[str, ...], float]] | None): Gets the values by labels when collected
+                Default: None
+
+        Returns:
+            Metric
+        """
+
+        return self.__register(
+            Metric(name, description, COUNTER, label_names, function)
+        )
+
+    def gauge(
+        self,
+        name: str,
+        description: str,
+        label_names: tuple[str, ...] = (),
+        function: Callable[[], dict[tuple[str, ...], float]] | None = None,
+    ) -> Metric:
+        """
+        Registers a value that can go up and down
+
+        Args:
+            name (str): Metric's name
+            description (str): What the metric measures
+            label_names (tuple[str, ...]): Names of the labels
+                Default: ()
+            function (Callable[[], dict[tuple[str, ...], float]] | None): Gets the values by labels when collected
+                Default: None
+
+        Returns:
+            Metric
+        """
+
+        return self.__register(Metric(name, description, GAUGE, label_names, function))
+
+    def histogram(
+        self,
+        name: str,
+        description: str,
+        buckets: tuple[float, ...],
+        label_names: tuple[str, ...] = (),
+    ) -> Metric:
+        """
+        Registers a distribution of values
+
+        Args:
+            name (str): Metric's name
+            description (str): What the metric measures
+            buckets (tuple[float, ...]): Upper bounds of the buckets, in ascending order
+            label_names (tuple[str, ...]): Names of the labels
+                Default: ()
+
+        Returns:
+            Metric
+        """
+
+        return self.__register(
+            Metric(name, description, HISTOGRAM, label_names, buckets=buckets)
+        )
+
+    def collect(self) -> list[MetricSnapshot]:
+        """
+        Gets the current values of every metric
+
+        Returns:
+            list[MetricSnapshot]
+        """
+
+        return [metric.collect() for metric in list(self.__metrics.values())]
+
+    def render(self) -> str:
+        """
+        Formats the current values of every metric in the Prometheus text format
+
+        Returns:
+            str
+        """
+
+        lines = []
+
+        for snapshot in self.collect():
+            lines.append(f"# HELP {snapshot.name} {_escape(snapshot.description)}")
+            lines.append(f"# TYPE {snapshot.name} {snapshot.kind}")
+
+            for sample in snapshot.samples:
+                labels = ",".join(
+                    f'{name}="{_escape(value, True)}"'
+                    for name, value in sample.labels.items()
+                )
+                lines.append(
+                    f"{sample.name}{{{labels}}} {_format_value(sample.value)}"
+                    if labels
+                    else f"{sample.name} {_format_value(sample.value)}"
+                )
+
+        return "\n".join(lines) + "\n"
+
+
+def _escape(text: str, quoted: bool = False) -> str:
+    text = text.replace("\\", "\\\\").replace("\n", "\\n")
+
+    return text.replace('"', '\\"') if quoted else text
+
+
+def _format_value(value: float) -> str:
+    if math.isnan(value):
+        return "NaN"
+
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+
+    return str(int(value)) if value == int(value) else repr(value)
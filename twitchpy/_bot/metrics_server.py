@@ -0,0 +1,79 @@
+import logging
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable
+
+logger = logging.getLogger(__name__)
+
+CONTENT_TYPE_PROMETHEUS = "text/plain; version=0.0.4; charset=utf-8"
+
+
+class MetricsServer:
+    """
+    Serves metrics in the Prometheus text format over HTTP, from a background thread
+    """
+
+    def __init__(self, host: str, port: int, render: Callable[[], str]):
+        """
+        Args:
+            host (str): Address to listen on
+            port (int): Port to listen on, 0 to pick a free one
+            render (Callable[[], str]): Formats the current metrics
+        """
+
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:
+                if self.path.split("?")[0] not in ("/", "/metrics"):
+                    self.send_error(404)
+                    return
+
+                try:
+                    body = server.render().encode("utf-8")
+
+                except Exception:
+                    logger.exception("Could not render the metrics")
+                    self.send_error(500)
+                    return
+
+                self.send_response(200)
+                self.send_header("Content-Type", CONTENT_TYPE_PROMETHEUS)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format: str, *args) -> None:
+                logger.debug(format, *args)
+
+        self.render = render
+        self.__server = ThreadingHTTPServer((host, port), Handler)
+        self.__server.daemon_threads = True
+        self.__thread = threading.Thread(
+            target=self.__server.serve_forever,
+            name="twitchpy-metrics",
+            daemon=True,
+        )
+
+    @property
+    def port(self) -> int:
+        """
+        Port the server listens on
+        """
+
+        return self.__server.server_address[1]
+
+    def start(self) -> None:
+        """
+        Starts serving the metrics
+        """
+
+        self.__thread.start()
+
+    def stop(self) -> None:
+        """
+        Stops serving the metrics and closes the socket
+        """
+
+        self.__server.shutdown()
+        self.__server.server_close()
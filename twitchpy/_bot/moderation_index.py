@@ -0,0 +1,342 @@
+import threading
+
+BANNED = "banned"
+MODERATORS = "moderators"
+VIPS = "vips"
+
+# Seconds before retrying a failed rebuild, doubled after each consecutive failure
+_RETRY_DELAY = 10
+
+
+class _Channel:
+    __slots__ = (
+        "banned",
+        "moderators",
+        "vips",
+        "refreshed_at",
+        "journal",
+        "failures",
+        "retry_at",
+    )
+
+    def __init__(self):
+        # Expiration of each ban as a timestamp, None for permanent bans
+        self.banned: dict[str, float | None] = {}
+        self.moderators: set[str] = set()
+        self.vips: set[str] = set()
+        self.refreshed_at: float | None = None
+        # Changes made while a refresh is running, replayed over its result
+        self.journal: list[tuple] | None = None
+        self.failures = 0
+        self.retry_at: float | None = None
+
+
+class ModerationIndex:
+    """
+    Keeps the banned users, the moderators and the VIPs of channels in memory, so they can be checked in constant time
+    The lists are rebuilt in the background while the index keeps answering, and the changes made in the meantime
+    are applied again over the new lists
+    Every method is thread-safe
+    """
+
+    def __init__(self, refresh_interval: float):
+        """
+        Args:
+            refresh_interval (float): Seconds between the rebuilds of a channel's lists
+        """
+
+        self.__refresh_interval = refresh_interval
+        self.__channels: dict[str, _Channel] = {}
+        self.__lock = threading.Lock()
+
+    def begin_refresh(self, channel: str) -> bool:
+        """
+        Registers that a channel's lists are being rebuilt
+
+        Args:
+            channel (str): Channel's name
+
+        Returns:
+            bool: Whether the rebuild can start, False if another one is running
+        """
+
+        with self.__lock:
+            state = self.__channels.setdefault(channel, _Channel())
+
+            if state.journal is not None:
+                return False
+
+            state.journal = []
+
+            return True
+
+    def finish_refresh(
+        self,
+        channel: str,
+        banned: dict[str, float | None] | None,
+        moderators: set[str] | None,
+        vips: set[str] | None,
+        now: float,
+    ) -> None:
+        """
+        Replaces a channel's lists with rebuilt ones
+
+        Args:
+            channel (str): Channel's name
+            banned (dict[str, float | None] | None): Expiration of each ban, None to keep the current list
+            moderators (set[str] | None): IDs of the moderators, None to keep the current list
+            vips (set[str] | None): IDs of the VIPs, None to keep the current list
+            now (float): Current monotonic time
+        """
+
+        with self.__lock:
+            state = self.__channels.get(channel)
+
+            if state is None:
+                return
+
+            journal = state.journal or []
+            state.journal = None
+            state.refreshed_at = now
+            state.failures = 0
+            state.retry_at = None
+
+            if banned is not None:
+                state.banned = banned
+
+            if moderators is not None:
+                state.moderators = moderators
+
+            if vips is not None:
+                state.vips = vips
+
+            for change in journal:
+                self.__apply(state, *change)
+
+    def cancel_refresh(self, channel: str, now: float) -> None:
+        """
+        Registers that a channel's rebuild failed, the current lists are kept
+        The rebuild is retried later, waiting twice as long after each consecutive failure, up to the refresh interval
+
+        Args:
+            channel (str): Channel's name
+            now (float): Current monotonic time
+        """
+
+        with self.__lock:
+            state = self.__channels.get(channel)
+
+            if state is not None:
+                state.journal = None
+                state.retry_at = now + min(
+                    self.__refresh_interval, _RETRY_DELAY * 2**state.failures
+                )
+                state.failures += 1
+
+    def __next_refresh(self, state: _Channel) -> float | None:
+        if state.journal is not None or state.refreshed_at is None:
+            return None
+
+        if state.retry_at is not None:
+            return state.retry_at
+
+        return state.refreshed_at + self.__refresh_interval
+
+    def __apply(self, state: _Channel, kind: str, user_id: str, value) -> None:
+        if kind == BANNED:
+            if value is False:
+                state.banned.pop(user_id, None)
+
+            else:
+                state.banned[user_id] = value
+
+        elif kind == MODERATORS:
+            if value:
+                state.moderators.add(user_id)
+
+            else:
+                state.moderators.discard(user_id)
+
+        elif value:
+            state.vips.add(user_id)
+
+        else:
+            state.vips.discard(user_id)
+
+    def __update(self, channel: str, kind: str, user_id: str, value) -> None:
+        with self.__lock:
+            state = self.__channels.get(channel)
+
+            if state is None:
+                return
+
+            self.__apply(state, kind, user_id, value)
+
+            if state.journal is not None:
+                state.journal.append((kind, user_id, value))
+
+    def ban(self, channel: str, user_id: str, expires_at: float | None) -> None:
+        """
+        Registers a ban or a timeout in an indexed channel
+
+        Args:
+            channel (str): Channel's name
+            user_id (str): ID of the banned user
+            expires_at (float | None): Timestamp when the timeout expires, None for a permanent ban
+        """
+
+        self.__update(channel, BANNED, user_id, expires_at)
+
+    def unban(self, channel: str, user_id: str) -> None:
+        """
+        Registers that a ban or a timeout was lifted in an indexed channel
+
+        Args:
+            channel (str): Channel's name
+            user_id (str): ID of the user
+        """
+
+        self.__update(channel, BANNED, user_id, False)
+
+    def set_moderator(self, channel: str, user_id: str, is_moderator: bool) -> None:
+        """
+        Registers whether a user is a moderator of an indexed channel
+
+        Args:
+            channel (str): Channel's name
+            user_id (str): User's ID
+            is_moderator (bool)
+        """
+
+        self.__update(channel, MODERATORS, user_id, is_moderator)
+
+    def set_vip(self, channel: str, user_id: str, is_vip: bool) -> None:
+        """
+        Registers whether a user is a VIP of an indexed channel
+
+        Args:
+            channel (str): Channel's name
+            user_id (str): User's ID
+            is_vip (bool)
+        """
+
+        self.__update(channel, VIPS, user_id, is_vip)
+
+    def is_indexed(self, channel: str) -> bool:
+        """
+        Checks whether a channel's lists have been built
+
+        Args:
+            channel (str): Channel's name
+
+        Returns:
+            bool
+        """
+
+        state = self.__channels.get(channel)
+
+        return state is not None and state.refreshed_at is not None
+
+    def is_banned(self, channel: str, user_id: str, timestamp: float) -> bool:
+        """
+        Checks whether a user is banned or timed out in a channel
+
+        Args:
+            channel (str): Channel's name
+            user_id (str): User's ID
+            timestamp (float): Current timestamp, to tell expired timeouts apart
+
+        Returns:
+            bool
+        """
+
+        state = self.__channels.get(channel)
+
+        if state is None or user_id not in state.banned:
+            return False
+
+        expires_at = state.banned.get(user_id)
+
+        return expires_at is None or expires_at > timestamp
+
+    def is_moderator(self, channel: str, user_id: str) -> bool:
+        """
+        Checks whether a user is a moderator of a channel
+
+        Args:
+            channel (str): Channel's name
+            user_id (str): User's ID
+
+        Returns:
+            bool
+        """
+
+        state = self.__channels.get(channel)
+
+        return state is not None and user_id in state.moderators
+
+    def is_vip(self, channel: str, user_id: str) -> bool:
+        """
+        Checks whether a user is a VIP of a channel
+
+        Args:
+            channel (str): Channel's name
+            user_id (str): User's ID
+
+        Returns:
+            bool
+        """
+
+        state = self.__channels.get(channel)
+
+        return state is not None and user_id in state.vips
+
+    def due(self, now: float) -> list[str]:
+        """
+        Gets the channels whose lists have to be rebuilt
+
+        Args:
+            now (float): Current monotonic time
+
+        Returns:
+            list[str]
+        """
+
+        with self.__lock:
+            return [
+                channel
+                for channel, state in self.__channels.items()
+                if (refresh_at := self.__next_refresh(state)) is not None
+                and now >= refresh_at
+            ]
+
+    def delay(self, now: float) -> float | None:
+        """
+        Gets the seconds until the next rebuild
+
+        Args:
+            now (float): Current monotonic time
+
+        Returns:
+            float | None: None if no channel is indexed
+        """
+
+        with self.__lock:
+            refreshes = [
+                refresh_at - now
+                for state in self.__channels.values()
+                if (refresh_at := self.__next_refresh(state)) is not None
+            ]
+
+        return max(0, min(refreshes)) if len(refreshes) > 0 else None
+
+    def discard(self, channel: str) -> None:
+        """
+        Forgets a channel's lists
+
+        Args:
+            channel (str): Channel's name
+        """
+
+        with self.__lock:
+            self.__channels.pop(channel, None)
@@ -0,0 +1,251 @@
+from collections import deque
+from dataclasses import dataclass
+
+from ..dataclasses import OutboundStats
+from .rate_limit import RateLimiter
+
+
+@dataclass
+class OutboundMessage:
+    """
+    Represents a message waiting to be written to a channel
+    """
+
+    channel: str
+    line: str
+    enqueued_at: float
+    key: tuple | None = None
+
+
+class OutboundQueue:
+    """
+    Holds the messages a bot sends and releases them as Twitch's rate limits allow
+    """
+
+    def __init__(
+        self,
+        limit: int,
+        moderator_limit: int,
+        period: float,
+        channel_interval: float,
+        max_size: int,
+    ):
+        """
+        Args:
+            limit (int): Messages allowed inside the window in channels the bot doesn't moderate
+            moderator_limit (int): Messages allowed inside the window in channels the bot moderates
+            period (float): Length of the window, in seconds
+            channel_interval (float): Minimum seconds between messages in a channel the bot doesn't moderate
+            max_size (int): Maximum number of queued messages, newer ones are dropped
+        """
+
+        self.__limiter = RateLimiter(moderator_limit, period)
+        self.__limit = limit
+        self.__channel_interval = channel_interval
+        self.__max_size = max_size
+        self.__queues: dict[str, deque[OutboundMessage]] = {}
+        self.__keys: set[tuple] = set()
+        self.__size = 0
+        self.__moderated_channels: set[str] = set()
+        self.__slow_mode: dict[str, int] = {}
+        self.__next_allowed: dict[str, float] = {}
+        self.__sent = 0
+        self.__dropped = 0
+        self.__coalesced = 0
+        self.__total_latency = 0.0
+        self.__max_latency: float | None = None
+
+    def __len__(self) -> int:
+        return self.__size
+
+    def set_moderator(self, channel: str, is_moderator: bool) -> None:
+        """
+        Sets whether the bot moderates a channel
+
+        Args:
+            channel (str): Channel's name
+            is_moderator (bool): Whether the bot is a moderator or the broadcaster of the channel
+        """
+
+        if is_moderator:
+            self.__moderated_channels.add(channel)
+
+        else:
+            self.__moderated_channels.discard(channel)
+
+    def set_slow_mode(self, channel: str, seconds: int) -> None:
+        """
+        Sets the slow mode of a channel
+
+        Args:
+            channel (str): Channel's name
+            seconds (int): Seconds users must wait between messages, 0 if slow mode is off
+        """
+
+        self.__slow_mode[channel] = seconds
+
+    def put(self, message: OutboundMessage) -> bool:
+        """
+        Queues a message
+        A message with the same key as one that is still queued is coalesced into it
+
+        Args:
+            message (OutboundMessage): Message to queue
+
+        Returns:
+            bool: Whether the message was queued
+        """
+
+        if message.key is not None and message.key in self.__keys:
+            self.__coalesced += 1
+            return False
+
+        if self.__size >= self.__max_size:
+            self.__dropped += 1
+            return False
+
+        self.__queues.setdefault(message.channel, deque()).append(message)
+        self.__size += 1
+
+        if message.key is not None:
+            self.__keys.add(message.key)
+
+        return True
+
+    def restore(self, messages: list[OutboundMessage]) -> None:
+        """
+        Puts back at the front of the queue messages that couldn't be written
+
+        Args:
+            messages (list[OutboundMessage]): Messages in the order they were taken
+        """
+
+        for message in reversed(messages):
+            self.__queues.setdefault(message.channel, deque()).appendleft(message)
+            self.__size += 1
+
+            if message.key is not None:
+                self.__keys.add(message.key)
+
+    def discard(self, channel: str) -> None:
+        """
+        Drops the queued messages of a channel
+
+        Args:
+            channel (str): Channel's name
+        """
+
+        for message in self.__queues.pop(channel, ()):
+            self.__forget(message)
+            self.__dropped += 1
+
+    def __forget(self, message: OutboundMessage) -> None:
+        self.__size -= 1
+
+        if message.key is not None:
+            self.__keys.discard(message.key)
+
+    def __limit_of(self, channel: str) -> int | None:
+        return None if channel in self.__moderated_channels else self.__limit
+
+    def __interval_of(self, channel: str) -> float:
+        if channel in self.__moderated_channels:
+            return 0
+
+        return max(self.__channel_interval, self.__slow_mode.get(channel, 0))
+
+    def take(self, now: float) -> list[OutboundMessage]:
+        """
+        Gets the queued messages that can be written right now
+
+        Args:
+            now (float): Current monotonic time
+
+        Returns:
+            list[OutboundMessage]
+        """
+
+        messages = []
+        progress = True
+
+        # One message per channel and pass, so a busy channel can't starve the rest
+        while progress and self.__size > 0:
+            progress = False
+
+            for channel in list(self.__queues):
+                if self.__next_allowed.get(channel, 0) > now:
+                    continue
+
+                if not self.__limiter.acquire(now, 1, self.__limit_of(channel)):
+                    continue
+
+                queue = self.__queues[channel]
+                message = queue.popleft()
+
+                if len(queue) == 0:
+                    self.__queues.pop(channel)
+
+                self.__forget(message)
+                self.__next_allowed[channel] = now + self.__interval_of(channel)
+                messages.append(message)
+                progress = True
+
+        return messages
+
+    def record(self, messages: list[OutboundMessage], now: float) -> None:
+        """
+        Registers that taken messages were written
+
+        Args:
+            messages (list[OutboundMessage]): Written messages
+            now (float): Current monotonic time
+        """
+
+        for message in messages:
+            latency = now - message.enqueued_at
+
+            self.__sent += 1
+            self.__total_latency += latency
+
+            if self.__max_latency is None or latency > self.__max_latency:
+                self.__max_latency = latency
+
+    def delay(self, now: float) -> float | None:
+        """
+        Gets the seconds to wait until the next queued message can be written
+
+        Args:
+            now (float): Current monotonic time
+
+        Returns:
+            float | None: None if there are no queued messages
+        """
+
+        if self.__size == 0:
+            return None
+
+        return min(
+            max(
+                self.__next_allowed.get(channel, 0) - now,
+                self.__limiter.delay(now, 1, self.__limit_of(channel)),
+                0,
+            )
+            for channel in self.__queues
+        )
+
+    def stats(self) -> OutboundStats:
+        """
+        Gets the statistics of the queue
+
+        Returns:
+            OutboundStats
+        """
+
+        return OutboundStats(
+            self.__size,
+            self.__sent,
+            self.__dropped,
+            self.__coalesced,
+            self.__total_latency / self.__sent if self.__sent > 0 else None,
+            self.__max_latency,
+        )
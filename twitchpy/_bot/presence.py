@@ -0,0 +1,218 @@
+class Presence:
+    """
+    Tracks the users present in each of a bot's channels
+    Each user name is stored once and channels hold small integer IDs, so large channels stay compact
+    """
+
+    def __init__(self):
+        self.__ids: dict[str, int] = {}
+        self.__names: list[str | None] = []
+        self.__references: list[int] = []
+        self.__free_ids: list[int] = []
+        self.__channels: dict[str, set[int]] = {}
+        # Users present before a reset, until the next NAMES reply tells which of them are still there
+        self.__stale: dict[str, set[int]] = {}
+        self.__pending_names: dict[str, list[str]] = {}
+
+    def __acquire_id(self, user: str) -> int:
+        user_id = self.__ids.get(user)
+
+        if user_id is None:
+            if len(self.__free_ids) > 0:
+                user_id = self.__free_ids.pop()
+                self.__names[user_id] = user
+
+            else:
+                user_id = len(self.__names)
+                self.__names.append(user)
+                self.__references.append(0)
+
+            self.__ids[user] = user_id
+
+        self.__references[user_id] += 1
+
+        return user_id
+
+    def __release_id(self, user_id: int) -> None:
+        self.__references[user_id] -= 1
+
+        # IDs of users that aren't in any channel are reused
+        if self.__references[user_id] == 0:
+            self.__ids.pop(self.__names[user_id])
+            self.__names[user_id] = None
+            self.__free_ids.append(user_id)
+
+    def join(self, channel: str, user: str) -> bool:
+        """
+        Registers that a user joined a channel
+
+        Args:
+            channel (str): Channel's name
+            user (str): User's name
+
+        Returns:
+            bool: Whether the user wasn't already present
+        """
+
+        present = self.__channels.setdefault(channel, set())
+        user_id = self.__ids.get(user)
+
+        if user_id is not None and user_id in present:
+            return False
+
+        present.add(self.__acquire_id(user))
+
+        stale = self.__stale.get(channel)
+
+        # Already known before the reset
+        if user_id is not None and stale is not None and user_id in stale:
+            stale.discard(user_id)
+            self.__release_id(user_id)
+
+            return False
+
+        return True
+
+    def leave(self, channel: str, user: str) -> bool:
+        """
+        Registers that a user left a channel
+
+        Args:
+            channel (str): Channel's name
+            user (str): User's name
+
+        Returns:
+            bool: Whether the user was present
+        """
+
+        user_id = self.__ids.get(user)
+
+        if user_id is None:
+            return False
+
+        for users in (self.__channels.get(channel), self.__stale.get(channel)):
+            if users is not None and user_id in users:
+                users.discard(user_id)
+                self.__release_id(user_id)
+
+                return True
+
+        return False
+
+    def add_names(self, channel: str, users: list[str]) -> None:
+        """
+        Registers a part of a NAMES reply
+
+        Args:
+            channel (str): Channel's name
+            users (list[str]): Users listed in the part
+        """
+
+        self.__pending_names.setdefault(channel, []).extend(users)
+
+    def end_names(self, channel: str) -> tuple[list[str], list[str]]:
+        """
+        Applies a complete NAMES reply
+        Users are only removed after a reset, since Twitch only lists moderators in channels with many users
+
+        Args:
+            channel (str): Channel's name
+
+        Returns:
+            tuple[list[str], list[str]]: Users that weren't present before, and users present before the reset that
+                aren't listed anymore
+        """
+
+        joined = [
+            user
+            for user in self.__pending_names.pop(channel, [])
+            if self.join(channel, user)
+        ]
+        left = []
+
+        for user_id in self.__stale.pop(channel, set()):
+            left.append(self.__names[user_id])
+            self.__release_id(user_id)
+
+        return joined, left
+
+    def reset(self, channel: str) -> None:
+        """
+        Empties a channel until its next NAMES reply, e.g. while the bot rejoins it after losing its connection
+        The users present before are remembered, so the reply only reports the changes
+
+        Args:
+            channel (str): Channel's name
+        """
+
+        self.__pending_names.pop(channel, None)
+
+        present = self.__channels.pop(channel, set())
+        stale = self.__stale.setdefault(channel, set())
+
+        for user_id in present:
+            # Already remembered from an earlier reset
+            if user_id in stale:
+                self.__release_id(user_id)
+
+            else:
+                stale.add(user_id)
+
+    def discard(self, channel: str) -> None:
+        """
+        Forgets the users of a channel
+
+        Args:
+            channel (str): Channel's name
+        """
+
+        self.__pending_names.pop(channel, None)
+
+        for users in (
+            self.__channels.pop(channel, set()),
+            self.__stale.pop(channel, set()),
+        ):
+            for user_id in users:
+                self.__release_id(user_id)
+
+    def contains(self, channel: str, user: str) -> bool:
+        """
+        Checks whether a user is present in a channel
+
+        Args:
+            channel (str): Channel's name
+            user (str): User's name
+
+        Returns:
+            bool
+        """
+
+        user_id = self.__ids.get(user)
+
+        return user_id is not None and user_id in self.__channels.get(channel, ())
+
+    def count(self, channel: str) -> int:
+        """
+        Gets the number of users present in a channel
+
+        Args:
+            channel (str): Channel's name
+
+        Returns:
+            int
+        """
+
+        return len(self.__channels.get(channel, ()))
+
+    def users(self, channel: str) -> list[str]:
+        """
+        Gets the users present in a channel
+
+        Args:
+            channel (str): Channel's name
+
+        Returns:
+            list[str]
+        """
+
+        return [self.__names[user_id] for user_id in self.__channels.get(channel, ())]
@@ -0,0 +1,292 @@
+import logging
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from typing import Callable
+
+from ..dataclasses import HandlerStats
+
+logger = logging.getLogger(__name__)
+
+CLIENT = "client"
+
+
+class _Call:
+    __slots__ = (
+        "kind",
+        "name",
+        "started_at",
+        "client_calls",
+        "client_time",
+        "reported",
+    )
+
+    def __init__(self, kind: str, name: str, started_at: float):
+        self.kind = kind
+        self.name = name
+        self.started_at = started_at
+        self.client_calls = 0
+        self.client_time = 0.0
+        self.reported = False
+
+
+class _Entry:
+    __slots__ = (
+        "calls",
+        "exceptions",
+        "total_time",
+        "max_time",
+        "client_calls",
+        "client_time",
+        "samples",
+    )
+
+    def __init__(self, max_samples: int):
+        self.calls = 0
+        self.exceptions = 0
+        self.total_time = 0.0
+        self.max_time = 0.0
+        self.client_calls = 0
+        self.client_time = 0.0
+        self.samples: deque[float] = deque(maxlen=max_samples)
+
+
+class HandlerProfiler:
+    """
+    Measures the time taken by a bot's handlers and by the Client calls made from them
+    A watchdog thread logs the stack of the handlers that run longer than a threshold, while they are still running
+    """
+
+    def __init__(self, slow_threshold: float, max_samples: int):
+        """
+        Args:
+            slow_threshold (float): Seconds after which a handler is reported as slow
+            max_samples (int): Number of recent times of each handler kept for the percentiles
+        """
+
+        self.__slow_threshold = slow_threshold
+        self.__max_samples = max_samples
+        self.__entries: dict[tuple[str, str], _Entry] = {}
+        self.__lock = threading.Lock()
+        self.__local = threading.local()
+        # Outermost handler running in each thread, watched for slowness
+        self.__running: dict[int, _Call] = {}
+        self.__stopped = threading.Event()
+        self.__watchdog = threading.Thread(
+            target=self.__watch, name="twitchpy-profiler", daemon=True
+        )
+
+    def start(self) -> None:
+        """
+        Starts watching for slow handlers
+        """
+
+        self.__watchdog.start()
+
+    def stop(self) -> None:
+        """
+        Stops watching for slow handlers, the measures are kept
+        """
+
+        self.__stopped.set()
+
+    def call(self, kind: str, name: str, method: Callable, *args) -> None:
+        """
+        Runs a handler and measures it
+
+        Args:
+            kind (str): Kind of handler, e.g. "command"
+            name (str): Handler's name
+            method (Callable): Handler
+            *args: Arguments of the handler
+        """
+
+        parent = getattr(self.__local, "call", None)
+        call = _Call(kind, name, time.perf_counter())
+        self.__local.call = call
+
+        if parent is None:
+            self.__running[threading.get_ident()] = call
+
+        failed = False
+
+        try:
+            method(*args)
+
+        except Exception:
+            failed = True
+            raise
+
+        finally:
+            elapsed = time.perf_counter() - call.started_at
+            self.__local.call = parent
+
+            if parent is None:
+                self.__running.pop(threading.get_ident(), None)
+
+            self.__record(kind, name, elapsed, failed, call)
+
+            if elapsed >= self.__slow_threshold:
+                logger.warning("Slow %s %s took %.3fs", kind, name, elapsed)
+
+    def client_call(self, name: str, method: Callable, *args, **kwargs):
+        """
+        Runs a Client method and measures it if it's called from a handler
+
+        Args:
+            name (str): Method's name
+            method (Callable): Bound method of the Client
+            *args: Positional arguments of the method
+            **kwargs: Keyword arguments of the method
+
+        Returns:
+            The method's result
+        """
+
+        call = getattr(self.__local, "call", None)
+
+        if call is None:
+            return method(*args, **kwargs)
+
+        started_at = time.perf_counter()
+        failed = False
+
+        try:
+            return method(*args, **kwargs)
+
+        except Exception:
+            failed = True
+            raise
+
+        finally:
+            elapsed = time.perf_counter() - started_at
+            call.client_calls += 1
+            call.client_time += elapsed
+
+            self.__record(CLIENT, name, elapsed, failed, None)
+
+    def __record(
+        self, kind: str, name: str, elapsed: float, failed: bool, call: _Call | None
+    ) -> None:
+        with self.__lock:
+            entry = self.__entries.get((kind, name))
+
+            if entry is None:
+                entry = _Entry(self.__max_samples)
+                self.__entries[(kind, name)] = entry
+
+            entry.calls += 1
+            entry.total_time += elapsed
+            entry.max_time = max(entry.max_time, elapsed)
+            entry.samples.append(elapsed)
+
+            if failed:
+                entry.exceptions += 1
+
+            if call is not None:
+                entry.client_calls += call.client_calls
+                entry.client_time += call.client_time
+
+    def __watch(self) -> None:
+        interval = max(0.01, self.__slow_threshold / 4)
+
+        while not self.__stopped.wait(interval):
+            now = time.perf_counter()
+            frames = None
+
+            for thread_id, call in list(self.__running.items()):
+                if call.reported or now - call.started_at < self.__slow_threshold:
+                    continue
+
+                if frames is None:
+                    frames = sys._current_frames()
+
+                frame = frames.get(thread_id)
+
+                # The handler can finish between the check and the sample
+                if frame is None or self.__running.get(thread_id) is not call:
+                    continue
+
+                call.reported = True
+
+                logger.warning(
+                    "Slow %s %s has been running for %.3fs:\n%s",
+                    call.kind,
+                    call.name,
+                    now - call.started_at,
+                    "".join(traceback.format_stack(frame)),
+                )
+
+    def stats(self) -> list[HandlerStats]:
+        """
+        Gets the measures of every handler and Client method, slowest first
+
+        Returns:
+            list[HandlerStats]
+        """
+
+        with self.__lock:
+            entries = [
+                (kind, name, entry, sorted(entry.samples))
+                for (kind, name), entry in self.__entries.items()
+            ]
+
+        stats = [
+            HandlerStats(
+                kind,
+                name,
+                entry.calls,
+                entry.exceptions,
+                entry.total_time,
+                entry.total_time / entry.calls,
+                _percentile(samples, 0.5),
+                _percentile(samples, 0.95),
+                _percentile(samples, 0.99),
+                entry.max_time,
+                entry.client_calls,
+                entry.client_time,
+            )
+            for kind, name, entry, samples in entries
+        ]
+
+        return sorted(stats, key=lambda handler: handler.total_time, reverse=True)
+
+
+class ProfiledClient:
+    """
+    Forwards every attribute to a Client, measuring the methods called from a bot's handlers
+    """
+
+    def __init__(self, client, profiler: HandlerProfiler):
+        """
+        Args:
+            client (Client): Client whose calls are measured
+            profiler (HandlerProfiler): Profiler of the bot's handlers
+        """
+
+        self.__client = client
+        self.__profiler = profiler
+
+    @property
+    def client(self):
+        """
+        Client whose calls are measured
+        """
+
+        return self.__client
+
+    def __getattr__(self, name: str):
+        value = getattr(self.__client, name)
+
+        if name.startswith("_") or not callable(value):
+            return value
+
+        return lambda *args, **kwargs: self.__profiler.client_call(
+            name, value, *args, **kwargs
+        )
+
+
+def _percentile(samples: list[float], quantile: float) -> float:
+    return samples[min(len(samples) - 1, int(quantile * len(samples)))]
@@ -0,0 +1,83 @@
+from collections import deque
+
+
+class RateLimiter:
+    """
+    Allows at most a number of events inside any window of time of a given length
+    """
+
+    def __init__(self, limit: int, period: float):
+        """
+        Args:
+            limit (int): Maximum number of events inside the window
+            period (float): Length of the window, in seconds
+        """
+
+        self.limit = limit
+        self.period = period
+        self.__events: deque[float] = deque()
+
+    def __expire(self, now: float) -> None:
+        while len(self.__events) > 0 and now - self.__events[0] >= self.period:
+            self.__events.popleft()
+
+    def available(self, now: float, limit: int | None = None) -> int:
+        """
+        Gets the number of events that can happen right now
+
+        Args:
+            now (float): Current monotonic time
+            limit (int | None): Lower limit to apply instead of the limiter's one
+
+        Returns:
+            int
+        """
+
+        self.__expire(now)
+
+        return (limit if limit is not None else self.limit) - len(self.__events)
+
+    def acquire(self, now: float, count: int = 1, limit: int | None = None) -> bool:
+        """
+        Registers events if the limit allows them
+
+        Args:
+            now (float): Current monotonic time
+            count (int): Number of events
+                Default: 1
+            limit (int | None): Lower limit to apply instead of the limiter's one
+
+        Returns:
+            bool: Whether the events were allowed
+        """
+
+        if self.available(now, limit) < count:
+            return False
+
+        self.__events.extend([now] * count)
+
+        return True
+
+    def delay(self, now: float, count: int = 1, limit: int | None = None) -> float:
+        """
+        Gets the seconds to wait until a number of events can happen
+
+        Args:
+            now (float): Current monotonic time
+            count (int): Number of events
+                Default: 1
+            limit (int | None): Lower limit to apply instead of the limiter's one
+
+        Returns:
+            float
+        """
+
+        available = self.available(now, limit)
+
+        if available >= count:
+            return 0
+
+        if count > (limit if limit is not None else self.limit):
+            return self.period
+
+        return self.__events[count - available - 1] + self.period - now
@@ -0,0 +1,131 @@
+import re
+
+
+class _Node:
+    __slots__ = ("children", "command")
+
+    def __init__(self):
+        self.children: dict[str, _Node] = {}
+        self.command: str | None = None
+
+
+class CommandRouter:
+    """
+    Resolves chat messages to the commands of a bot
+    Commands are kept in a trie over their words, so sub-commands and aliases cost one lookup per word
+    """
+
+    def __init__(self):
+        self.__root = _Node()
+        self.__paths: dict[str, list[tuple[str, ...]]] = {}
+        self.__patterns: dict[str, re.Pattern] = {}
+
+    def add(
+        self,
+        name: str,
+        aliases: list[str] | None = None,
+        pattern: str | None = None,
+    ) -> None:
+        """
+        Registers a command, replacing any command with the same name
+
+        Args:
+            name (str): Command's name, with its words separated by spaces for sub-commands
+            aliases (list[str] | None): Other names of the command
+            pattern (str | None): Regular expression that triggers the command when found in a message
+
+        Raises:
+            re.error: If the pattern is not a valid regular expression
+        """
+
+        compiled = re.compile(pattern) if pattern is not None else None
+
+        self.remove(name)
+
+        paths = [
+            tuple(words.split())
+            for words in [name] + (aliases if aliases is not None else [])
+        ]
+        self.__paths[name] = [path for path in paths if len(path) > 0]
+
+        for path in self.__paths[name]:
+            node = self.__root
+
+            for word in path:
+                node = node.children.setdefault(word, _Node())
+
+            node.command = name
+
+        if compiled is not None:
+            self.__patterns[name] = compiled
+
+    def remove(self, name: str) -> None:
+        """
+        Unregisters a command
+
+        Args:
+            name (str): Command's name
+        """
+
+        for path in self.__paths.pop(name, []):
+            self.__remove_path(self.__root, path, name)
+
+        self.__patterns.pop(name, None)
+
+    def __remove_path(self, node: _Node, path: tuple[str, ...], name: str) -> bool:
+        if len(path) == 0:
+            if node.command == name:
+                node.command = None
+
+        else:
+            child = node.children.get(path[0])
+
+            if child is not None and self.__remove_path(child, path[1:], name):
+                node.children.pop(path[0])
+
+        # Nodes left without commands or children are pruned
+        return node.command is None and len(node.children) == 0
+
+    def resolve(
+        self, text: str, prefixes: tuple[str, ...]
+    ) -> tuple[str, list[str]] | None:
+        """
+        Finds the command a message invokes
+        Prefixed commands take precedence over pattern triggers, and the longest sub-command wins
+        Pattern triggers are tried in the order they were added
+
+        Args:
+            text (str): Message's text
+            prefixes (tuple[str, ...]): Prefixes of the commands
+
+        Returns:
+            tuple[str, list[str]] | None: Command's name and the words that follow it,
+                or None if the message doesn't invoke any command
+        """
+
+        if text.startswith(prefixes):
+            prefix = max(
+                (prefix for prefix in prefixes if text.startswith(prefix)), key=len
+            )
+            words = text[len(prefix) :].split()
+            node = self.__root
+            found = None
+
+            for index, word in enumerate(words):
+                node = node.children.get(word)
+
+                if node is None:
+                    break
+
+                if node.command is not None:
+                    found = (node.command, index + 1)
+
+            if found is not None:
+                return found[0], words[found[1] :]
+
+        # Separate compiled patterns are faster in Python than one big alternation
+        for name, pattern in self.__patterns.items():
+            if pattern.search(text) is not None:
+                return name, text.split()
+
+        return None
@@ -0,0 +1,159 @@
+import heapq
+from datetime import datetime
+
+from ..dataclasses import CheckStats
+from .cron import CronSchedule
+
+
+class _Task:
+    def __init__(self, name: str, interval: float | None, cron: CronSchedule | None):
+        self.name = name
+        self.interval = interval
+        self.cron = cron
+        self.due = 0.0
+        self.runs = 0
+        self.last_lateness: float | None = None
+        self.total_lateness = 0.0
+        self.max_lateness: float | None = None
+
+
+class Scheduler:
+    """
+    Keeps the tasks of a bot ordered by the time they are due to run
+    """
+
+    def __init__(self):
+        self.__tasks: dict[str, _Task] = {}
+        self.__heap: list[tuple[float, int, _Task]] = []
+        self.__sequence = 0
+
+    def __push(self, task: _Task) -> None:
+        self.__sequence += 1
+        heapq.heappush(self.__heap, (task.due, self.__sequence, task))
+
+    def __next_due(self, task: _Task, now: float) -> float:
+        if task.cron is None:
+            return now + task.interval
+
+        wall_now = datetime.now()
+
+        return now + (task.cron.next_after(wall_now) - wall_now).total_seconds()
+
+    def add(
+        self, name: str, now: float, interval: float | None, cron: str | None = None
+    ) -> None:
+        """
+        Schedules a task, replacing any task with the same name
+
+        Args:
+            name (str): Task's name
+            now (float): Current monotonic time
+            interval (float | None): Seconds between runs
+            cron (str | None): Cron expression of the runs, used instead of the interval
+
+        Raises:
+            ValueError: If the schedule is not valid
+        """
+
+        if cron is None and (interval is None or interval <= 0):
+            raise ValueError(f"Invalid interval for {name}: {interval}")
+
+        task = _Task(name, interval, CronSchedule(cron) if cron is not None else None)
+        task.due = self.__next_due(task, now)
+
+        self.__tasks[name] = task
+        self.__push(task)
+
+    def remove(self, name: str) -> None:
+        """
+        Unschedules a task
+
+        Args:
+            name (str): Task's name
+        """
+
+        # Its heap entry is skipped when it comes up
+        self.__tasks.pop(name, None)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.__tasks
+
+    def pop_due(self, now: float) -> list[tuple[str, float]]:
+        """
+        Gets the tasks that are due and schedules their next runs
+
+        Args:
+            now (float): Current monotonic time
+
+        Returns:
+            list[tuple[str, float]]: Name of each task and the seconds it is late
+        """
+
+        due = []
+
+        while len(self.__heap) > 0 and self.__heap[0][0] <= now:
+            _, _, task = heapq.heappop(self.__heap)
+
+            if self.__tasks.get(task.name) is not task:
+                continue
+
+            lateness = now - task.due
+
+            task.runs += 1
+            task.last_lateness = lateness
+            task.total_lateness += lateness
+
+            if task.max_lateness is None or lateness > task.max_lateness:
+                task.max_lateness = lateness
+
+            if task.cron is None:
+                # Missed runs are not repeated, the next one keeps the cadence
+                task.due += ((now - task.due) // task.interval + 1) * task.interval
+
+            else:
+                task.due = self.__next_due(task, now)
+
+            self.__push(task)
+            due.append((task.name, lateness))
+
+        return due
+
+    def delay(self, now: float) -> float | None:
+        """
+        Gets the seconds until the next task is due
+
+        Args:
+            now (float): Current monotonic time
+
+        Returns:
+            float | None: None if there are no tasks
+        """
+
+        while len(self.__heap) > 0:
+            _, _, task = self.__heap[0]
+
+            if self.__tasks.get(task.name) is task:
+                return max(0, task.due - now)
+
+            heapq.heappop(self.__heap)
+
+        return None
+
+    def stats(self) -> list[CheckStats]:
+        """
+        Gets the statistics of the scheduled tasks
+
+        Returns:
+            list[CheckStats]
+        """
+
+        return [
+            CheckStats(
+                task.name,
+                task.runs,
+                task.last_lateness,
+                task.total_lateness / task.runs if task.runs > 0 else None,
+                task.max_lateness,
+            )
+            for task in self.__tasks.values()
+        ]
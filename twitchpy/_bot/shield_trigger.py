@@ -0,0 +1,309 @@
+import math
+from collections import OrderedDict
+
+from ..dataclasses import ChatRates
+
+# Messages the decayed counter must hold before the duplicate ratio is trusted
+_MIN_MESSAGES = 10
+# Fraction of each threshold below which a channel is considered calm again
+_CALM_FACTOR = 0.5
+_CALM_CHECK_INTERVAL = 1
+
+
+class _Channel:
+    __slots__ = (
+        "messages_per_second",
+        "new_chatters_per_second",
+        "duplicate_ratio",
+        "cooldown",
+        "messages",
+        "new_chatters",
+        "duplicates",
+        "updated_at",
+        "chatters",
+        "active",
+        "calm_since",
+        "warm_until",
+    )
+
+    def __init__(
+        self,
+        messages_per_second: float | None,
+        new_chatters_per_second: float | None,
+        duplicate_ratio: float | None,
+        cooldown: float,
+        warm_until: float,
+    ):
+        self.messages_per_second = messages_per_second
+        self.new_chatters_per_second = new_chatters_per_second
+        self.duplicate_ratio = duplicate_ratio
+        self.cooldown = cooldown
+        self.messages = 0.0
+        self.new_chatters = 0.0
+        self.duplicates = 0.0
+        self.updated_at: float | None = None
+        self.chatters: OrderedDict[str, None] = OrderedDict()
+        self.active = False
+        self.calm_since: float | None = None
+        # Until then the chatters are only remembered, or every regular's first message would count as new
+        self.warm_until = warm_until
+
+
+class ShieldModeTrigger:
+    """
+    Tracks the message rate, the new chatter rate and the duplicate ratio of channels with exponentially decayed
+    counters, and decides when their Shield Mode has to be turned on and off
+    Updating a channel's counters is constant time, so it can be done for every message
+    """
+
+    def __init__(self, half_life: float, max_chatters: int, warm_up: float):
+        """
+        Args:
+            half_life (float): Seconds after which a message weighs half in the counters
+            max_chatters (int): Users remembered in each channel to tell new chatters apart, the least recently seen are forgotten first
+            warm_up (float): Seconds after a channel starts being tracked during which its chatters are remembered but
+                not counted as new
+        """
+
+        self.__half_life = half_life
+        self.__max_chatters = max_chatters
+        self.__warm_up = warm_up
+        self.__channels: dict[str, _Channel] = {}
+
+    def enable(
+        self,
+        channel: str,
+        messages_per_second: float | None,
+        new_chatters_per_second: float | None,
+        duplicate_ratio: float | None,
+        cooldown: float,
+        now: float,
+    ) -> None:
+        """
+        Starts tracking a channel, or changes its thresholds
+
+        Args:
+            channel (str): Channel's name
+            messages_per_second (float | None): Message rate that turns Shield Mode on, None to ignore it
+            new_chatters_per_second (float | None): Rate of first messages from users that turns Shield Mode on, None to ignore it
+            duplicate_ratio (float | None): Fraction of repeated messages that turns Shield Mode on, None to ignore it
+            cooldown (float): Seconds the channel must stay calm before Shield Mode is turned off
+            now (float): Current monotonic time
+        """
+
+        state = self.__channels.get(channel)
+
+        if state is None:
+            self.__channels[channel] = _Channel(
+                messages_per_second,
+                new_chatters_per_second,
+                duplicate_ratio,
+                cooldown,
+                now + self.__warm_up,
+            )
+
+            return
+
+        state.messages_per_second = messages_per_second
+        state.new_chatters_per_second = new_chatters_per_second
+        state.duplicate_ratio = duplicate_ratio
+        state.cooldown = cooldown
+
+    def disable(self, channel: str) -> bool:
+        """
+        Stops tracking a channel
+
+        Args:
+            channel (str): Channel's name
+
+        Returns:
+            bool: Whether Shield Mode was turned on by the trigger and is still on
+        """
+
+        state = self.__channels.pop(channel, None)
+
+        return state is not None and state.active
+
+    def is_enabled(self, channel: str) -> bool:
+        """
+        Checks whether a channel is tracked
+
+        Args:
+            channel (str): Channel's name
+
+        Returns:
+            bool
+        """
+
+        return channel in self.__channels
+
+    def __decay(self, state: _Channel, now: float) -> None:
+        if state.updated_at is not None:
+            factor = 0.5 ** ((now - state.updated_at) / self.__half_life)
+            state.messages *= factor
+            state.new_chatters *= factor
+            state.duplicates *= factor
+
+        state.updated_at = now
+
+    def __rates(self, state: _Channel) -> ChatRates:
+        # The decayed sum of a steady stream converges to rate * half-life / ln(2)
+        scale = math.log(2) / self.__half_life
+
+        return ChatRates(
+            state.messages * scale,
+            state.new_chatters * scale,
+            (
+                state.duplicates / state.messages
+                if state.messages >= _MIN_MESSAGES
+                else 0.0
+            ),
+        )
+
+    def __exceeds(self, state: _Channel, rates: ChatRates, factor: float) -> bool:
+        return (
+            (
+                state.messages_per_second is not None
+                and rates.messages_per_second >= state.messages_per_second * factor
+            )
+            or (
+                state.new_chatters_per_second is not None
+                and rates.new_chatters_per_second
+                >= state.new_chatters_per_second * factor
+            )
+            or (
+                state.duplicate_ratio is not None
+                and rates.duplicate_ratio >= state.duplicate_ratio * factor
+            )
+        )
+
+    def record(self, channel: str, user_id: str, duplicate: bool, now: float) -> bool:
+        """
+        Counts a message of a tracked channel
+
+        Args:
+            channel (str): Channel's name
+            user_id (str): ID of the user who sent the message
+            duplicate (bool): Whether the message repeats a recent one
+            now (float): Current monotonic time
+
+        Returns:
+            bool: Whether Shield Mode has to be turned on
+        """
+
+        state = self.__channels.get(channel)
+
+        if state is None:
+            return False
+
+        self.__decay(state, now)
+
+        state.messages += 1
+
+        if duplicate:
+            state.duplicates += 1
+
+        if user_id in state.chatters:
+            state.chatters.move_to_end(user_id)
+
+        else:
+            if now >= state.warm_until:
+                state.new_chatters += 1
+
+            state.chatters[user_id] = None
+
+            if len(state.chatters) > self.__max_chatters:
+                state.chatters.popitem(last=False)
+
+        if state.active:
+            return False
+
+        if not self.__exceeds(state, self.__rates(state), 1):
+            return False
+
+        state.active = True
+        state.calm_since = None
+
+        return True
+
+    def release(self, channel: str) -> None:
+        """
+        Registers that Shield Mode wasn't turned on by the trigger, so it isn't turned off by it either
+
+        Args:
+            channel (str): Channel's name
+        """
+
+        state = self.__channels.get(channel)
+
+        if state is not None:
+            state.active = False
+
+    def due(self, now: float) -> list[str]:
+        """
+        Gets the channels that have been calm long enough for Shield Mode to be turned off
+
+        Args:
+            now (float): Current monotonic time
+
+        Returns:
+            list[str]
+        """
+
+        channels = []
+
+        for channel, state in self.__channels.items():
+            if not state.active:
+                continue
+
+            self.__decay(state, now)
+
+            if self.__exceeds(state, self.__rates(state), _CALM_FACTOR):
+                state.calm_since = None
+
+            elif state.calm_since is None:
+                state.calm_since = now
+
+            elif now - state.calm_since >= state.cooldown:
+                state.active = False
+                state.calm_since = None
+                channels.append(channel)
+
+        return channels
+
+    def delay(self, now: float) -> float | None:
+        """
+        Gets the seconds until the channels with Shield Mode on have to be checked again
+
+        Args:
+            now (float): Current monotonic time
+
+        Returns:
+            float | None: None if no channel has Shield Mode turned on by the trigger
+        """
+
+        if any(state.active for state in self.__channels.values()):
+            return _CALM_CHECK_INTERVAL
+
+        return None
+
+    def rates(self, channel: str, now: float) -> ChatRates | None:
+        """
+        Gets the current rates of a tracked channel
+
+        Args:
+            channel (str): Channel's name
+            now (float): Current monotonic time
+
+        Returns:
+            ChatRates | None: None if the channel isn't tracked
+        """
+
+        state = self.__channels.get(channel)
+
+        if state is None:
+            return None
+
+        self.__decay(state, now)
+
+        return self.__rates(state)
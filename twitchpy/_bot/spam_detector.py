@@ -0,0 +1,305 @@
+import re
+from collections import OrderedDict, deque
+
+from ..dataclasses import SpamEvent
+
+_HASH_BITS = 64
+_HASH_MASK = (1 << _HASH_BITS) - 1
+_BANDS = 8
+_BAND_BITS = _HASH_BITS // _BANDS
+_BAND_MASK = (1 << _BAND_BITS) - 1
+_MAX_DISTANCE = 7
+_SHINGLE_SIZE = 3
+_MIN_SHINGLES = 8
+_LANE_BITS = 16
+_MAX_SAMPLES = 50
+_MAX_CACHED_SHINGLES = 65536
+_MAX_REPORTED_BURSTS = 16
+
+_NON_WORD = re.compile(r"[^\w\s]+")
+_REPEATED = re.compile(r"(.)\1{2,}")
+
+# Spreads each bit of a byte into its own 16 bit lane, so 64 bit counters can be added at once
+_SPREAD = [
+    sum(((byte >> bit) & 1) << (bit * _LANE_BITS) for bit in range(8))
+    for byte in range(256)
+]
+
+
+def _normalize(text: str) -> str:
+    text = _NON_WORD.sub("", text.lower())
+    text = _REPEATED.sub(r"\1", text)
+
+    return " ".join(text.split())
+
+
+def _spread(shingle: str) -> int:
+    value = hash(shingle) & _HASH_MASK
+    spread = 0
+
+    for byte_index in range(_HASH_BITS // 8):
+        spread += _SPREAD[(value >> (byte_index * 8)) & 0xFF] << (
+            byte_index * 8 * _LANE_BITS
+        )
+
+    return spread
+
+
+class _Window:
+    __slots__ = (
+        "started_at",
+        "count",
+        "previous_count",
+        "fingerprint",
+        "reported",
+        "user_ids",
+        "message_ids",
+    )
+
+    def __init__(self, started_at: float, fingerprint: int):
+        self.started_at = started_at
+        self.count = 0
+        self.previous_count = 0
+        self.fingerprint = fingerprint
+        self.reported = False
+        self.user_ids: deque[str] = deque(maxlen=_MAX_SAMPLES)
+        self.message_ids: deque[str] = deque(maxlen=_MAX_SAMPLES)
+
+
+class SpamDetector:
+    """
+    Counts repeated messages in each channel over a sliding window
+    Identical messages are matched by their normalized text and similar ones by the SimHash of their
+    character trigrams, whose bands are counted separately so that a lookup doesn't depend on the number
+    of recent messages
+    """
+
+    def __init__(self, window: float, threshold: int, max_fingerprints: int):
+        """
+        Args:
+            window (float): Seconds of the window
+            threshold (int): Matching messages inside the window that make a burst
+            max_fingerprints (int): Maximum number of fingerprints kept, the least recently seen are evicted first
+        """
+
+        self.__window = window
+        self.__threshold = threshold
+        self.__max_fingerprints = max_fingerprints
+        self.__windows: OrderedDict[tuple, _Window] = OrderedDict()
+        self.__spread_cache: dict[str, int] = {}
+        self.__last_count = 0.0
+        # Fingerprints of the recent near duplicate bursts of each channel, with when they were last seen
+        self.__reported_bursts: dict[str, deque[list]] = {}
+
+    def __simhash(self, shingles: set[str]) -> int:
+        counters = 0
+
+        for shingle in shingles:
+            spread = self.__spread_cache.get(shingle)
+
+            if spread is None:
+                # Chat reuses a limited set of trigrams, so the cache is just reset when full
+                if len(self.__spread_cache) >= _MAX_CACHED_SHINGLES:
+                    self.__spread_cache.clear()
+
+                spread = _spread(shingle)
+                self.__spread_cache[shingle] = spread
+
+            counters += spread
+
+        fingerprint = 0
+        lane_mask = (1 << _LANE_BITS) - 1
+
+        for bit in range(_HASH_BITS):
+            if ((counters >> (bit * _LANE_BITS)) & lane_mask) * 2 > len(shingles):
+                fingerprint |= 1 << bit
+
+        return fingerprint
+
+    def __roll(self, window: _Window, now: float) -> None:
+        elapsed = now - window.started_at
+
+        if elapsed >= 2 * self.__window:
+            window.started_at = now
+            window.count = 0
+            window.previous_count = 0
+
+        elif elapsed >= self.__window:
+            window.started_at += self.__window
+            window.previous_count = window.count
+            window.count = 0
+
+    def __count(self, window: _Window, now: float) -> float:
+        # Sliding window approximated from the current and the previous fixed windows
+        weight = 1 - (now - window.started_at) / self.__window
+
+        return window.count + window.previous_count * weight
+
+    def __hit(
+        self,
+        key: tuple,
+        fingerprint: int,
+        user_id: str,
+        message_id: str | None,
+        now: float,
+    ) -> _Window:
+        window = self.__windows.get(key)
+
+        if window is None:
+            window = _Window(now, fingerprint)
+            self.__windows[key] = window
+
+            while len(self.__windows) > self.__max_fingerprints:
+                self.__windows.popitem(last=False)
+
+        else:
+            self.__windows.move_to_end(key)
+            self.__roll(window, now)
+
+        window.count += 1
+        window.user_ids.append(user_id)
+
+        if message_id is not None:
+            window.message_ids.append(message_id)
+
+        return window
+
+    @property
+    def last_count(self) -> float:
+        """
+        Approximate number of messages inside the window that matched the last checked message, itself included
+        """
+
+        return self.__last_count
+
+    def __is_reported_burst(self, channel: str, fingerprint: int, now: float) -> bool:
+        # Bands of the same burst can reach the threshold one after the other, and their
+        # representatives can each be up to the maximum distance away from the burst's messages
+        bursts = self.__reported_bursts.setdefault(
+            channel, deque(maxlen=_MAX_REPORTED_BURSTS)
+        )
+
+        for burst in bursts:
+            if (
+                now - burst[0] < self.__window
+                and (burst[1] ^ fingerprint).bit_count() <= 2 * _MAX_DISTANCE
+            ):
+                burst[0] = now
+
+                return True
+
+        bursts.append([now, fingerprint])
+
+        return False
+
+    def discard(self, channel: str) -> None:
+        """
+        Forgets the messages of a channel
+
+        Args:
+            channel (str): Channel's name
+        """
+
+        self.__reported_bursts.pop(channel, None)
+
+        for key in [key for key in self.__windows if key[0] == channel]:
+            self.__windows.pop(key)
+
+    def check(
+        self,
+        channel: str,
+        text: str,
+        user_id: str,
+        message_id: str | None,
+        now: float,
+    ) -> SpamEvent | None:
+        """
+        Counts a message and checks whether it completes a burst
+
+        Args:
+            channel (str): Channel where the message was sent
+            text (str): Message's text
+            user_id (str): ID of the user who sent the message
+            message_id (str | None): Message's ID
+            now (float): Current monotonic time
+
+        Returns:
+            SpamEvent | None: The burst, only the first time its window reaches the threshold
+        """
+
+        normalized = _normalize(text)
+
+        if len(normalized) == 0:
+            self.__last_count = 0.0
+
+            return None
+
+        candidates = [
+            (
+                "duplicate",
+                self.__hit((channel, normalized), 0, user_id, message_id, now),
+            )
+        ]
+        shingles = {
+            normalized[index : index + _SHINGLE_SIZE]
+            for index in range(len(normalized) - _SHINGLE_SIZE + 1)
+        }
+
+        # Short messages don't have enough shingles for a stable fingerprint
+        if len(shingles) >= _MIN_SHINGLES:
+            fingerprint = self.__simhash(shingles)
+
+            # Fingerprints within the distance share at least one band
+            for band in range(_BANDS):
+                key = (channel, band, (fingerprint >> (band * _BAND_BITS)) & _BAND_MASK)
+                window = self.__windows.get(key)
+
+                if window is not None and (
+                    (window.fingerprint ^ fingerprint).bit_count() > _MAX_DISTANCE
+                ):
+                    continue
+
+                candidates.append(
+                    (
+                        "near_duplicate",
+                        self.__hit(key, fingerprint, user_id, message_id, now),
+                    )
+                )
+
+        event = None
+        self.__last_count = 0.0
+
+        for kind, window in candidates:
+            count = self.__count(window, now)
+            self.__last_count = max(self.__last_count, count)
+
+            if count < self.__threshold:
+                # The burst can be reported again once it has faded
+                if count < self.__threshold / 2:
+                    window.reported = False
+
+                continue
+
+            if (
+                not window.reported
+                and event is None
+                and (
+                    kind == "duplicate"
+                    or not self.__is_reported_burst(channel, window.fingerprint, now)
+                )
+            ):
+                event = SpamEvent(
+                    channel,
+                    kind,
+                    round(count),
+                    text,
+                    list(window.user_ids),
+                    list(window.message_ids),
+                )
+
+        # The other windows of the message belong to the same burst
+        if event is not None:
+            for _, window in candidates:
+                window.reported = True
+
+        return event
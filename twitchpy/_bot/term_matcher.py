@@ -0,0 +1,194 @@
+from collections import deque
+
+_WILDCARD = "*"
+
+
+class _Term:
+    __slots__ = (
+        "key",
+        "text",
+        "length",
+        "prefix_wildcard",
+        "suffix_wildcard",
+        "references",
+    )
+
+    def __init__(
+        self, key: str, text: str, prefix_wildcard: bool, suffix_wildcard: bool
+    ):
+        self.key = key
+        self.text = text
+        self.length = len(text)
+        self.prefix_wildcard = prefix_wildcard
+        self.suffix_wildcard = suffix_wildcard
+        self.references = 0
+
+
+def _is_word_character(character: str) -> bool:
+    return character.isalnum() or character == "_"
+
+
+class TermMatcher:
+    """
+    Finds blocked terms in messages with an Aho-Corasick automaton, in time linear in the message's length
+    Terms match whole words unless they start or end with the wildcard character (*)
+    Adding or removing a term updates the trie in place, the failure links are rebuilt before the next search
+    """
+
+    def __init__(self):
+        self.__goto: list[dict[str, int]] = [{}]
+        self.__fail: list[int] = [0]
+        self.__outputs: list[list[_Term]] = [[]]
+        # Closest node on the failure chain with outputs, so searches skip the rest
+        self.__output_link: list[int] = [0]
+        self.__terms: dict[str, _Term] = {}
+        self.__dirty = False
+
+    def __normalize(self, term: str) -> str:
+        return term.strip().lower()
+
+    def add(self, term: str) -> None:
+        """
+        Adds a term
+        Terms added several times need to be removed as many times
+
+        Args:
+            term (str): Word or phrase, with an optional wildcard at its start or end
+        """
+
+        key = self.__normalize(term)
+        text = key.strip(_WILDCARD)
+
+        if len(text) == 0:
+            return
+
+        entry = self.__terms.get(key)
+
+        if entry is None:
+            entry = _Term(key, text, key.startswith(_WILDCARD), key.endswith(_WILDCARD))
+            self.__terms[key] = entry
+
+            node = 0
+
+            for character in text:
+                next_node = self.__goto[node].get(character)
+
+                if next_node is None:
+                    next_node = len(self.__goto)
+                    self.__goto[node][character] = next_node
+                    self.__goto.append({})
+                    self.__fail.append(0)
+                    self.__outputs.append([])
+                    self.__output_link.append(0)
+
+                node = next_node
+
+            self.__outputs[node].append(entry)
+            self.__dirty = True
+
+        entry.references += 1
+
+    def remove(self, term: str) -> None:
+        """
+        Removes a term
+
+        Args:
+            term (str): Word or phrase, as it was added
+        """
+
+        key = self.__normalize(term)
+        entry = self.__terms.get(key)
+
+        if entry is None:
+            return
+
+        entry.references -= 1
+
+        if entry.references > 0:
+            return
+
+        self.__terms.pop(key)
+
+        node = 0
+
+        for character in entry.text:
+            node = self.__goto[node][character]
+
+        # The trie's nodes are kept, only the output is dropped
+        self.__outputs[node].remove(entry)
+        self.__dirty = True
+
+    def __build(self) -> None:
+        queue = deque()
+
+        for node in self.__goto[0].values():
+            self.__fail[node] = 0
+            self.__output_link[node] = 0
+            queue.append(node)
+
+        while len(queue) > 0:
+            node = queue.popleft()
+
+            for character, child in self.__goto[node].items():
+                fail = self.__fail[node]
+
+                while fail != 0 and character not in self.__goto[fail]:
+                    fail = self.__fail[fail]
+
+                fail = self.__goto[fail].get(character, 0)
+
+                self.__fail[child] = fail if fail != child else 0
+                self.__output_link[child] = (
+                    fail if len(self.__outputs[fail]) > 0 else self.__output_link[fail]
+                )
+                queue.append(child)
+
+        self.__dirty = False
+
+    def search(self, text: str) -> str | None:
+        """
+        Finds the first term that appears in a text
+
+        Args:
+            text (str): Text to search
+
+        Returns:
+            str | None: The matching term in lowercase, None if no term appears
+        """
+
+        if len(self.__terms) == 0:
+            return None
+
+        if self.__dirty:
+            self.__build()
+
+        text = text.lower()
+        node = 0
+
+        for index, character in enumerate(text):
+            while node != 0 and character not in self.__goto[node]:
+                node = self.__fail[node]
+
+            node = self.__goto[node].get(character, 0)
+            match_node = (
+                node if len(self.__outputs[node]) > 0 else self.__output_link[node]
+            )
+
+            while match_node != 0:
+                for term in self.__outputs[match_node]:
+                    start = index - term.length + 1
+
+                    if (
+                        term.prefix_wildcard
+                        or start == 0
+                        or not _is_word_character(text[start - 1])
+                    ) and (
+                        term.suffix_wildcard
+                        or index + 1 == len(text)
+                        or not _is_word_character(text[index + 1])
+                    ):
+                        return term.key
+
+                match_node = self.__output_link[match_node]
+
+        return None
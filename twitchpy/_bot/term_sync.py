@@ -0,0 +1,41 @@
+from collections.abc import Iterable
+
+from ..dataclasses import BlockedTerm
+
+
+def diff_blocked_terms(
+    current: Iterable[BlockedTerm], desired: list[str]
+) -> tuple[list[str], list[str]]:
+    """
+    Computes the fewest changes that turn a channel's blocked terms into a list
+    Terms are compared without case or surrounding spaces, as Twitch does, and repeated terms are removed
+
+    Args:
+        current (Iterable[BlockedTerm]): Channel's blocked terms, consumed once
+        desired (list[str]): Terms the channel must have
+
+    Returns:
+        tuple[list[str], list[str]]: Texts to add and IDs of the terms to remove
+    """
+
+    wanted: dict[str, str] = {}
+
+    for text in desired:
+        key = text.strip().lower()
+
+        if len(key) > 0:
+            wanted.setdefault(key, text.strip())
+
+    kept = set()
+    to_remove = []
+
+    for term in current:
+        key = term.text.strip().lower()
+
+        if key in wanted and key not in kept:
+            kept.add(key)
+
+        else:
+            to_remove.append(term.term_id)
+
+    return [text for key, text in wanted.items() if key not in kept], to_remove
@@ -0,0 +1,74 @@
+import threading
+from collections import OrderedDict
+from typing import Callable
+
+from ..dataclasses import User
+
+
+class UserCache:
+    """
+    Keeps the information of the most recently requested users for a while
+    Every method is thread-safe
+    """
+
+    def __init__(self, max_users: int, ttl: float):
+        """
+        Args:
+            max_users (int): Maximum number of users kept, the least recently requested ones are dropped first
+            ttl (float): Seconds the information of a user is kept
+        """
+
+        self.__max_users = max_users
+        self.__ttl = ttl
+        self.__users: OrderedDict[str, tuple[float, User | None]] = OrderedDict()
+        self.__lock = threading.Lock()
+
+    def get_many(
+        self,
+        user_ids: list[str],
+        fetch: Callable[[list[str]], list[User]],
+        now: float,
+    ) -> dict[str, User | None]:
+        """
+        Gets the information of users, fetching the ones that aren't kept
+
+        Args:
+            user_ids (list[str]): IDs of the users
+            fetch (Callable[[list[str]], list[User]]): Gets the users of up to 100 IDs
+            now (float): Current monotonic time
+
+        Raises:
+            errors.ClientError
+
+        Returns:
+            dict[str, User | None]: User of each ID, None for the users that don't exist
+        """
+
+        users = {}
+        missing = []
+
+        with self.__lock:
+            for user_id in dict.fromkeys(user_ids):
+                cached = self.__users.get(user_id)
+
+                if cached is not None and now - cached[0] < self.__ttl:
+                    self.__users.move_to_end(user_id)
+                    users[user_id] = cached[1]
+
+                else:
+                    missing.append(user_id)
+
+        for start in range(0, len(missing), 100):
+            batch = missing[start : start + 100]
+            fetched = {str(user.user_id): user for user in fetch(batch)}
+
+            with self.__lock:
+                for user_id in batch:
+                    users[user_id] = fetched.get(user_id)
+                    self.__users[user_id] = (now, users[user_id])
+                    self.__users.move_to_end(user_id)
+
+                while len(self.__users) > self.__max_users:
+                    self.__users.popitem(last=False)
+
+        return users
@@ -1,4 +1,5 @@
 import math
+from collections.abc import Iterator
 
 import requests
 
@@ -66,6 +67,31 @@ def send_get_with_pagination(
     return results
 
 
+def send_get_pages(
+    url: str, headers: dict, params: dict, page_size: int
+) -> Iterator[list[dict]]:
+    params["first"] = page_size
+
+    while True:
+        response = requests.get(
+            url, headers=headers, params=params, timeout=DEFAULT_TIMEOUT
+        )
+
+        if not response.ok:
+            raise errors.ClientError(response.json()["message"])
+
+        response = response.json()
+
+        yield response["data"]
+
+        cursor = response.get("pagination", {}).get("cursor")
+
+        if not cursor:
+            return
+
+        params["after"] = cursor
+
+
 def send_get_with_infinite_pagination(
     url: str, headers: dict, params: dict
 ) -> list[dict]:
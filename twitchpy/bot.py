@@ -1,19 +1,153 @@
 import logging
+import math
+import random
+import selectors
 import socket
 import ssl
+import threading
+import time
+from itertools import islice
+from collections import deque
+from concurrent.futures import Future
+from datetime import datetime
 from typing import Callable
 
+from . import errors
+from ._bot.audit_log import AuditLog
+from ._bot.automod_batcher import AutoModBatcher, AutoModCheck
+from ._bot.badges import parse_badge_info, parse_badges
+from ._bot.bulk import BulkOperation, gather
+from ._bot.chat_state import ChatStateCache
+from ._bot.connection import Connection
+from ._bot.cooldowns import Cooldowns
+from ._bot.emotes import EmoteUsageAggregator, parse_emotes
+from ._bot.executor import LazyExecutor
+from ._bot.handler_index import HandlerIndex
+from ._bot.helix_limiter import HelixRateLimiter
+from ._bot.irc_log import IrcLog
+from ._bot.history import MessageHistory
+from ._bot.join_scheduler import JoinScheduler
+from ._bot.keepalive import Keepalive
+from ._bot.metrics import MetricsRegistry
+from ._bot.metrics_server import MetricsServer
+from ._bot.moderation_index import ModerationIndex
+from ._bot.outbound import OutboundMessage, OutboundQueue
+from ._bot.presence import Presence
+from ._bot.profiler import HandlerProfiler, ProfiledClient
+from ._bot.router import CommandRouter
+from ._bot.scheduler import Scheduler
+from ._bot.shield_trigger import ShieldModeTrigger
+from ._bot.spam_detector import SpamDetector
+from ._bot.term_matcher import TermMatcher
+from ._bot.term_sync import diff_blocked_terms
+from ._bot.user_cache import UserCache
 from .client import Client
-from .dataclasses import Message
+from .dataclasses import (
+    BlockedTerm,
+    BlockedTermsSync,
+    BulkProgress,
+    ChatRates,
+    ChatState,
+    CheckStats,
+    EmoteUsage,
+    HandlerStats,
+    HistoryEntry,
+    JoinProgress,
+    Message,
+    MetricSnapshot,
+    OutboundStats,
+    PingStats,
+    ReconnectStats,
+    Role,
+    ShieldModeStatus,
+    SpamEvent,
+    UnbanRequest,
+    UnbanRequestContext,
+    UnbanTriage,
+    User,
+)
 
 
 logger = logging.getLogger(__name__)
+# IRC lines sent and received, so their level can be set apart from the bot's other logs
+irc_logger = logging.getLogger(f"{__name__}.irc")
 
 
 _IRC_SERVER = "irc.chat.twitch.tv"
 _IRC_PORT = 6697
 
 _DEFAULT_TIMEOUT = 10
+_DEFAULT_CHANNELS_PER_CONNECTION = 100
+
+_JOIN_LIMIT = 20
+_VERIFIED_JOIN_LIMIT = 2000
+_JOIN_PERIOD = 10
+_MAX_JOIN_LINE_LENGTH = 500
+_JOIN_TIMEOUT = 60
+
+_MESSAGE_LIMIT = 20
+_MODERATOR_MESSAGE_LIMIT = 100
+_MESSAGE_PERIOD = 30
+_CHANNEL_MESSAGE_INTERVAL = 1
+_DEFAULT_OUTBOUND_QUEUE_SIZE = 1000
+
+_RECONNECT_BASE_DELAY = 1
+_RECONNECT_MAX_DELAY = 60
+
+_DEFAULT_PING_INTERVAL = 60
+_PING_TIMEOUT = 10
+_DEFAULT_MAX_MISSED_PONGS = 2
+_PING_SAMPLES = 1000
+
+_MAX_COOLDOWN_ENTRIES = 100000
+
+_DEFAULT_HISTORY_MESSAGES_PER_USER = 20
+_DEFAULT_HISTORY_MAX_MEMORY = 16 * 1024 * 1024
+
+# Helix allows 800 points per minute to each token, most requests cost one
+_HELIX_LIMIT = 800
+_HELIX_PERIOD = 60
+_BULK_WORKERS = 8
+
+_MODERATION_INDEX_REFRESH_INTERVAL = 300
+
+_USER_CACHE_SIZE = 10000
+_USER_CACHE_TTL = 3600
+
+_UNBAN_RESOLUTIONS = ("approved", "denied")
+_UNBAN_TRIAGE_BATCH_SIZE = 100
+_DEFAULT_UNBAN_AUDIT_LOG = "unban_requests.log"
+
+_BLOCKED_TERM_ACTIONS = ("delete", "timeout")
+_DEFAULT_BLOCKED_TERM_TIMEOUT = 600
+
+_DEFAULT_SPAM_WINDOW = 10
+_DEFAULT_SPAM_THRESHOLD = 10
+_MAX_SPAM_FINGERPRINTS = 100000
+
+_SHIELD_MODE_HALF_LIFE = 1
+_MAX_SHIELD_MODE_CHATTERS = 50000
+_SHIELD_MODE_WARM_UP = 300
+_DEFAULT_SHIELD_MODE_COOLDOWN = 300
+
+_AUTOMOD_BATCH_SIZE = 100
+_DEFAULT_AUTOMOD_BATCH_DELAY = 0.05
+_AUTOMOD_WORKERS = 4
+
+_EMOTE_USAGE_PERIOD = 3600
+_EMOTE_USAGE_RESOLUTION = 10
+_MAX_EMOTE_NAMES = 10000
+
+_DEFAULT_METRICS_HOST = "127.0.0.1"
+_DEFAULT_METRICS_PORT = 8000
+_DURATION_BUCKETS = (0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1, 5)
+_LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+
+_DEFAULT_SLOW_HANDLER_THRESHOLD = 0.1
+_PROFILER_SAMPLES = 1000
+
+_DEFAULT_CHECK_INTERVAL = 10
+_CHECK_LATENESS_WARNING = 1
 
 
 class Bot:
@@ -21,149 +155,2037 @@ class Bot:
     Represents a bot
     """
 
-    def __init__(
-        self,
-        oauth_token: str,
-        client_id: str,
-        client_secret: str,
-        redirect_uri: str,
-        tokens_path: str,
-        username: str,
-        channels: list[str],
-        command_prefix: str,
-        authorization_code: str | None = None,
-        jwt_token: str | None = None,
-        ready_message: str | None = None,
-    ):
+    def __init__(
+        self,
+        oauth_token: str,
+        client_id: str,
+        client_secret: str,
+        redirect_uri: str,
+        tokens_path: str,
+        username: str,
+        channels: list[str],
+        command_prefix: str | list[str],
+        authorization_code: str | None = None,
+        jwt_token: str | None = None,
+        ready_message: str | None = None,
+        channels_per_connection: int = _DEFAULT_CHANNELS_PER_CONNECTION,
+        verified: bool = False,
+        outbound_queue_size: int = _DEFAULT_OUTBOUND_QUEUE_SIZE,
+        ping_interval: float = _DEFAULT_PING_INTERVAL,
+        max_missed_pongs: int = _DEFAULT_MAX_MISSED_PONGS,
+        history_messages_per_user: int = _DEFAULT_HISTORY_MESSAGES_PER_USER,
+        history_max_memory: int = _DEFAULT_HISTORY_MAX_MEMORY,
+        blocked_term_action: str = "delete",
+        blocked_term_timeout: int = _DEFAULT_BLOCKED_TERM_TIMEOUT,
+        spam_window: float = _DEFAULT_SPAM_WINDOW,
+        spam_threshold: int = _DEFAULT_SPAM_THRESHOLD,
+        automod_batch_delay: float = _DEFAULT_AUTOMOD_BATCH_DELAY,
+        irc_log_levels: dict[str, int] | None = None,
+        irc_log_sample_rates: dict[str, int] | None = None,
+        irc_log_sink: logging.Handler | None = None,
+    ):
+        """
+        Args:
+            oauth_token (str): OAuth token
+            client_id (str): Client ID
+            client_secret (str): Client secret
+            redirect_uri (str): Redirect URI
+            tokens_path (str): Path of tokens file (file included)
+            username (str): Name of the bot
+            channels (list): Names of channels the bot will access
+            command_prefix (str | list[str]): Prefix or prefixes of the commands the bot will recognize
+            code (str): Authorization code for getting an user token
+            jwt_token (str): JWT Token
+            ready_message (str): Message that the bot will send through the chats of the channels it access
+            channels_per_connection (int): Maximum number of channels joined through each IRC connection
+                The bot opens as many connections as needed to join all its channels
+                Default: 100
+            verified (bool): Whether the bot's account is verified, which raises the rate at which it can join channels
+                Default: False
+            outbound_queue_size (int): Maximum number of messages waiting for the chat rate limits
+                Default: 1000
+            ping_interval (float): Seconds between the PINGs the bot sends to check that each connection is alive
+                Default: 60
+            max_missed_pongs (int): Consecutive unanswered PINGs after which a connection is reopened
+                Default: 2
+            history_messages_per_user (int): Last messages kept for each user in each channel, 0 to keep none
+                Default: 20
+            history_max_memory (int): Approximate maximum bytes used by the kept messages
+                The least recently active users are forgotten first
+                Default: 16 MiB
+            blocked_term_action (str): What to do with chat messages that contain a blocked term, "delete" or "timeout"
+                Default: "delete"
+            blocked_term_timeout (int): Seconds users are timed out for when the action is "timeout"
+                Default: 600
+            spam_window (float): Seconds over which repeated chat messages are counted
+                Default: 10
+            spam_threshold (int): Identical or similar messages inside the window that make a spam burst, 0 to not detect them
+                Default: 10
+            automod_batch_delay (float): Maximum seconds a message waits for others before being checked against AutoMod,
+                since up to 100 messages of a channel are checked with a single request
+                Default: 0.05
+            irc_log_levels (dict[str, int] | None): Level at which the IRC lines of each command, e.g. "PRIVMSG", are
+                logged through the "twitchpy.bot.irc" logger, the other commands are logged at INFO
+                Default: None
+            irc_log_sample_rates (dict[str, int] | None): For each command, only 1 of every N lines is logged
+                Default: None
+            irc_log_sink (logging.Handler | None): Handler that formats and writes the IRC lines in a background
+                thread while the bot runs, instead of the logger's handlers, so the bot doesn't wait for them
+                Default: None
+
+        Raises:
+            ValueError: If the blocked term action is not valid
+        """
+
+        if blocked_term_action not in _BLOCKED_TERM_ACTIONS:
+            raise ValueError(f"Invalid blocked term action: {blocked_term_action}")
+
+        self.client = Client(
+            client_id,
+            client_secret,
+            redirect_uri,
+            tokens_path,
+            authorization_code,
+            jwt_token,
+        )
+        self.__oauth_token = oauth_token
+        self.__finish = False
+        # Twitch sends logins in lowercase
+        self.username = username.lower()
+
+        self.channels = []
+
+        for channel in channels:
+            self.channels.append(channel.replace("@", "").lower())
+
+        self.command_prefix = command_prefix
+        self.ready_message = ready_message if ready_message is not None else ""
+
+        self.custom_methods_before_join_channel = {}
+        self.methods_before_join_channel_to_remove = []
+        self.custom_methods_after_join_channel = {}
+        self.methods_after_join_channel_to_remove = []
+
+        self.custom_methods_before_leave_channel = {}
+        self.methods_before_leave_channel_to_remove = []
+        self.custom_methods_after_leave_channel = {}
+        self.methods_after_leave_channel_to_remove = []
+
+        self.custom_checks = {}
+        self.checks_to_remove = []
+        self.custom_listeners = {}
+        self.listeners_to_remove = []
+        self.__listener_index = HandlerIndex()
+        self.custom_handlers = {}
+        self.handlers_to_remove = []
+        self.__handler_index = HandlerIndex()
+        self.custom_commands = {}
+        self.commands_to_remove = []
+        self.__command_router = CommandRouter()
+        self.__cooldowns = Cooldowns(_MAX_COOLDOWN_ENTRIES)
+        self.__command_permissions: dict[str, tuple[Role, int]] = {}
+        self.__chat_state = ChatStateCache()
+        self.__user_id: str | None = None
+        self.blocked_term_action = blocked_term_action
+        self.blocked_term_timeout = blocked_term_timeout
+        self.__term_matchers: dict[str, TermMatcher] = {}
+        self.__blocked_terms: dict[str, dict[str, str]] = {}
+        self.__blocked_term_matches: list[tuple[str, Message]] = []
+        # Terms changed by synchronizations, handed back to the loop by the workers
+        self.__blocked_term_updates: deque[tuple[str, list[BlockedTerm], list[str]]] = (
+            deque()
+        )
+        self.__moderation_executor = LazyExecutor(
+            max_workers=1, thread_name_prefix="twitchpy-moderation"
+        )
+        self.__bulk_executor = LazyExecutor(
+            max_workers=_BULK_WORKERS, thread_name_prefix="twitchpy-bulk"
+        )
+        self.__helix_limiter = HelixRateLimiter(_HELIX_LIMIT, _HELIX_PERIOD)
+        self.__moderation_index = ModerationIndex(_MODERATION_INDEX_REFRESH_INTERVAL)
+        self.__user_cache = UserCache(_USER_CACHE_SIZE, _USER_CACHE_TTL)
+        self.__audit_logs: dict[str, AuditLog] = {}
+        self.__presence = Presence()
+        self.__spam_detector = (
+            SpamDetector(spam_window, spam_threshold, _MAX_SPAM_FINGERPRINTS)
+            if spam_threshold > 0
+            else None
+        )
+        self.__history = (
+            MessageHistory(history_messages_per_user, history_max_memory)
+            if history_messages_per_user > 0
+            else None
+        )
+        self.__emote_usage = EmoteUsageAggregator(
+            _EMOTE_USAGE_PERIOD, _EMOTE_USAGE_RESOLUTION, _MAX_EMOTE_NAMES
+        )
+        self.custom_methods_before_commands = {}
+        self.methods_before_commands_to_remove = []
+        self.custom_methods_after_commands = {}
+        self.methods_after_commands_to_remove = []
+
+        self.custom_methods_after_clearchat = {}
+        self.methods_after_clearchat_to_remove = []
+
+        self.custom_methods_after_delete_message = {}
+        self.methods_after_delete_message_to_remove = []
+
+        self.custom_methods_after_bot_connected = {}
+        self.methods_after_bot_connected_to_remove = []
+
+        self.custom_methods_after_toggle_host = {}
+        self.methods_after_toggle_host_to_remove = []
+
+        self.custom_methods_after_server_reconnect = {}
+        self.methods_after_server_reconnect_to_remove = []
+
+        self.custom_methods_after_channel_change = {}
+        self.methods_after_channel_change_to_remove = []
+
+        self.custom_methods_after_event = {}
+        self.methods_after_event_to_remove = []
+
+        self.custom_methods_after_user_join = {}
+        self.methods_after_user_join_to_remove = []
+
+        self.custom_methods_after_whisper = {}
+        self.methods_after_whisper_to_remove = []
+
+        self.custom_methods_after_chatter_join = {}
+        self.methods_after_chatter_join_to_remove = []
+        self.custom_methods_after_chatter_leave = {}
+        self.methods_after_chatter_leave_to_remove = []
+
+        self.custom_methods_after_spam = {}
+        self.methods_after_spam_to_remove = []
+
+        self.custom_methods_after_automod_check = {}
+        self.methods_after_automod_check_to_remove = []
+
+        self.__shield_mode_trigger = ShieldModeTrigger(
+            _SHIELD_MODE_HALF_LIFE, _MAX_SHIELD_MODE_CHATTERS, _SHIELD_MODE_WARM_UP
+        )
+        self.__shield_mode_statuses: dict[str, ShieldModeStatus] = {}
+        # Separate from the moderation executor, so that Shield Mode doesn't wait behind mass timeouts
+        self.__shield_mode_executor = LazyExecutor(
+            max_workers=1, thread_name_prefix="twitchpy-shield-mode"
+        )
+
+        self.channels_per_connection = max(1, channels_per_connection)
+        self.connections: list[Connection] = []
+        self.__connections_by_channel: dict[str, Connection] = {}
+        self.__next_shard_id = 0
+        self.__ssl_context = ssl.create_default_context()
+        self.__selector = selectors.DefaultSelector()
+        self.__join_scheduler = JoinScheduler(
+            _VERIFIED_JOIN_LIMIT if verified else _JOIN_LIMIT,
+            _JOIN_PERIOD,
+            _JOIN_TIMEOUT,
+        )
+        self.__outbound = OutboundQueue(
+            _MESSAGE_LIMIT,
+            _MODERATOR_MESSAGE_LIMIT,
+            _MESSAGE_PERIOD,
+            _CHANNEL_MESSAGE_INTERVAL,
+            outbound_queue_size,
+        )
+        self.__outbound_lock = threading.Lock()
+        self.__loop_thread: int | None = None
+        self.__wakeup_reader, self.__wakeup_writer = socket.socketpair()
+        self.__wakeup_reader.setblocking(False)
+        self.__wakeup_writer.setblocking(False)
+        self.__selector.register(self.__wakeup_reader, selectors.EVENT_READ, None)
+        self.__scheduler = Scheduler()
+        self.__scheduler_lock = threading.Lock()
+        self.__tls_session: ssl.SSLSession | None = None
+        self.__failed_connection_attempts = 0
+        self.__reconnect_at: float | None = None
+        self.__connection_lost_at: float | None = None
+        self.__channels_to_recover: set[str] = set()
+        self.__reconnects = 0
+        self.__failed_reconnects = 0
+        self.__total_reconnect_time = 0.0
+        self.__last_reconnect_time: float | None = None
+        self.__max_reconnect_time: float | None = None
+        self.__keepalive = Keepalive(
+            ping_interval, _PING_TIMEOUT, max_missed_pongs, _PING_SAMPLES
+        )
+        self.__automod_batcher = AutoModBatcher(
+            _AUTOMOD_BATCH_SIZE, automod_batch_delay
+        )
+        self.__automod_lock = threading.Lock()
+        self.__automod_executor = LazyExecutor(
+            max_workers=_AUTOMOD_WORKERS, thread_name_prefix="twitchpy-automod"
+        )
+        # Screened messages whose result arrived, handed back to the loop by the workers
+        self.__automod_results: deque[tuple[Message, Future]] = deque()
+
+        self.__irc_log = IrcLog(
+            irc_logger,
+            logging.INFO,
+            irc_log_levels if irc_log_levels is not None else {},
+            irc_log_sample_rates if irc_log_sample_rates is not None else {},
+            irc_log_sink,
+        )
+
+        self.__profiler: HandlerProfiler | None = None
+        self.__profiling = False
+
+        self.__metrics = MetricsRegistry()
+        self.__metrics_server: MetricsServer | None = None
+        self.__received_messages = self.__metrics.counter(
+            "twitchpy_irc_messages_total",
+            "IRC messages received, by command",
+            ("command",),
+        )
+        self.__chat_messages = self.__metrics.counter(
+            "twitchpy_chat_messages_total",
+            "Chat messages received, by channel",
+            ("channel",),
+        )
+        self.__handling_time = self.__metrics.histogram(
+            "twitchpy_message_handling_seconds",
+            "Seconds taken to handle an IRC message, by command",
+            _DURATION_BUCKETS,
+            ("command",),
+        )
+        self.__command_time = self.__metrics.histogram(
+            "twitchpy_command_seconds",
+            "Seconds taken to run a command, by name",
+            _DURATION_BUCKETS,
+            ("command",),
+        )
+        self.__chat_latency = self.__metrics.histogram(
+            "twitchpy_chat_latency_seconds",
+            "Seconds between Twitch sending a message and the bot receiving it",
+            _LATENCY_BUCKETS,
+        ).labels()
+        self.__metrics.gauge(
+            "twitchpy_outbound_queue_depth",
+            "Messages waiting for the rate limits",
+            function=lambda: {(): self.get_outbound_stats().queued},
+        )
+        self.__metrics.counter(
+            "twitchpy_outbound_messages_total",
+            "Messages given to the bot to send, by result",
+            ("result",),
+            self.__count_outbound_messages,
+        )
+        self.__metrics.gauge(
+            "twitchpy_join_queue_depth",
+            "Channels waiting for the join rate limit",
+            function=lambda: {(): self.__join_scheduler.pending},
+        )
+        self.__metrics.gauge(
+            "twitchpy_connections",
+            "Open IRC connections",
+            function=lambda: {(): len(self.connections)},
+        )
+        self.__metrics.gauge(
+            "twitchpy_channels",
+            "Channels joined",
+            function=lambda: {(): len(self.__connections_by_channel)},
+        )
+        self.__metrics.counter(
+            "twitchpy_reconnects_total",
+            "Reconnections to the IRC server",
+            function=lambda: {(): self.__reconnects},
+        )
+
+    def __send_command(
+        self,
+        command: str,
+        args: str,
+        tags: str | None = None,
+        connection: Connection | None = None,
+    ) -> None:
+        level = self.__irc_log.level(command)
+
+        if level:
+            self.__irc_log.log_sent(
+                level,
+                command,
+                "%s%s < %s",
+                tags + " " if tags is not None else "",
+                command,
+                args,
+            )
+
+        if connection is None:
+            connection = self.connections[0]
+
+        try:
+            connection.send(
+                (
+                    f"{tags + ' ' if tags is not None else ''}{command} {args}" + "\r\n"
+                ).encode()
+            )
+
+        except OSError:
+            # Connections still being opened report the error to the opener
+            if connection not in self.connections:
+                raise
+
+            self.__handle_connection_lost(connection)
+
+    def __send_join(self, channels: list[str], connection: Connection) -> None:
+        self.__send_command(
+            "JOIN",
+            ",".join(f"#{channel}" for channel in channels),
+            connection=connection,
+        )
+
+    def __send_nick(self, username: str, connection: Connection) -> None:
+        self.__send_command("NICK", username, connection=connection)
+
+    def __send_part(self, channel: str) -> None:
+        connection = self.__connections_by_channel.pop(channel, None)
+
+        if connection is None:
+            return
+
+        connection.channels.discard(channel)
+
+        self.__send_command("PART", f"#{channel}", connection=connection)
+
+    def __send_pass(self, oauth_token: str, connection: Connection) -> None:
+        self.__send_command("PASS", oauth_token, connection=connection)
+
+    def __send_ping(self, text: str, connection: Connection) -> None:
+        self.__send_command("PING", f":{text}", connection=connection)
+
+    def __send_pong(self, text: str, connection: Connection) -> None:
+        self.__send_command("PONG", f":{text}", connection=connection)
+
+    def __send_privmsg(
+        self,
+        channel: str,
+        text: str,
+        message_to_reply: str | None = None,
+    ) -> None:
+        tags = (
+            f"@reply-parent-msg-id={message_to_reply}"
+            if message_to_reply is not None
+            else None
+        )
+        args = f"#{channel} :{text}"
+        message = OutboundMessage(
+            channel,
+            f"{tags + ' ' if tags is not None else ''}PRIVMSG {args}",
+            time.monotonic(),
+            (channel, text, message_to_reply),
+        )
+
+        with self.__outbound_lock:
+            self.__outbound.put(message)
+
+        if self.__loop_thread != threading.get_ident():
+            self.__wake_up()
+
+    def __wake_up(self) -> None:
+        try:
+            self.__wakeup_writer.send(b"\0")
+
+        except (BlockingIOError, OSError):
+            pass
+
+    def __flush_outbound(self) -> None:
+        if len(self.connections) == 0:
+            return
+
+        with self.__outbound_lock:
+            messages = self.__outbound.take(time.monotonic())
+
+        if len(messages) == 0:
+            return
+
+        batches: dict[Connection, list[OutboundMessage]] = {}
+
+        for message in messages:
+            connection = self.__connections_by_channel.get(
+                message.channel, self.connections[0]
+            )
+            batches.setdefault(connection, []).append(message)
+
+        for connection, batch in batches.items():
+            try:
+                connection.send(
+                    b"".join(f"{message.line}\r\n".encode() for message in batch)
+                )
+
+            except OSError:
+                with self.__outbound_lock:
+                    self.__outbound.restore(batch)
+
+                self.__handle_connection_lost(connection)
+                continue
+
+            with self.__outbound_lock:
+                self.__outbound.record(batch, time.monotonic())
+
+            # Logged once written, the coalesced and dropped messages never are
+            for message in batch:
+                level = self.__irc_log.level("PRIVMSG")
+
+                if level:
+                    tags, _, args = message.line.partition("PRIVMSG ")
+
+                    self.__irc_log.log_sent(
+                        level, "PRIVMSG", "%s%s < %s", tags, "PRIVMSG", args
+                    )
+
+    def get_outbound_stats(self) -> OutboundStats:
+        """
+        Gets the statistics of the messages sent by the bot
+
+        Returns:
+            OutboundStats
+        """
+
+        with self.__outbound_lock:
+            return self.__outbound.stats()
+
+    def __login(self, connection: Connection) -> None:
+        self.__send_pass(self.__oauth_token, connection)
+        self.__send_nick(self.username, connection)
+
+    def __request_irc_capabilities(self, connection: Connection) -> None:
+        self.__send_command(
+            "CAP REQ",
+            ":twitch.tv/commands twitch.tv/membership twitch.tv/tags",
+            connection=connection,
+        )
+
+    def __open_connection(self) -> Connection | None:
+        now = time.monotonic()
+
+        if self.__reconnect_at is not None and now < self.__reconnect_at:
+            return None
+
+        if self.__tls_session is None:
+            self.__tls_session = next(
+                (
+                    connection.session
+                    for connection in self.connections
+                    if connection.session is not None
+                ),
+                None,
+            )
+
+        connection = Connection(self.__next_shard_id, self.__ssl_context)
+
+        try:
+            try:
+                connection.open(
+                    _IRC_SERVER, _IRC_PORT, _DEFAULT_TIMEOUT, self.__tls_session
+                )
+
+            except ValueError:
+                # The session can't be resumed, so a full handshake is needed
+                self.__tls_session = None
+                connection.open(_IRC_SERVER, _IRC_PORT, _DEFAULT_TIMEOUT)
+
+            self.__login(connection)
+            self.__request_irc_capabilities(connection)
+
+        except OSError as error:
+            connection.close()
+            self.__schedule_reconnect(now, error)
+
+            return None
+
+        self.__next_shard_id += 1
+        self.__failed_connection_attempts = 0
+        self.__reconnect_at = None
+        self.__selector.register(connection, selectors.EVENT_READ, connection)
+        self.connections.append(connection)
+        self.__keepalive.watch(connection, time.monotonic())
+
+        logger.info(
+            "Connection %s opened (TLS session reused: %s)",
+            connection.shard_id,
+            connection.session_reused,
+        )
+
+        if self.__connection_lost_at is not None and not self.__channels_to_recover:
+            self.__finish_recovery(time.monotonic())
+
+        return connection
+
+    def __schedule_reconnect(self, now: float, error: OSError) -> None:
+        self.__failed_connection_attempts += 1
+
+        if self.__connection_lost_at is not None:
+            self.__failed_reconnects += 1
+
+        # Exponential backoff with jitter, so many bots don't reconnect at once
+        delay = min(
+            _RECONNECT_MAX_DELAY,
+            _RECONNECT_BASE_DELAY * 2 ** (self.__failed_connection_attempts - 1),
+        )
+        delay = delay / 2 + random.uniform(0, delay / 2)
+        self.__reconnect_at = now + delay
+
+        logger.warning(
+            "Could not open a connection (%s), retrying in %.2fs", error, delay
+        )
+
+    def __close_connection(self, connection: Connection) -> None:
+        if connection in self.connections:
+            self.__selector.unregister(connection)
+            self.connections.remove(connection)
+
+        self.__keepalive.forget(connection)
+
+        if connection.session is not None:
+            self.__tls_session = connection.session
+
+        connection.close()
+
+        for channel in connection.channels:
+            if self.__connections_by_channel.get(channel) is connection:
+                self.__connections_by_channel.pop(channel)
+
+        logger.info("Connection %s closed", connection.shard_id)
+
+    def __assign_channel(self, channel: str) -> Connection | None:
+        connection = self.__connections_by_channel.get(channel)
+
+        if connection is not None:
+            return connection
+
+        candidates = [
+            connection
+            for connection in self.connections
+            if len(connection.channels) < self.channels_per_connection
+        ]
+
+        if len(candidates) > 0:
+            connection = min(candidates, key=lambda candidate: len(candidate.channels))
+
+        else:
+            connection = self.__open_connection()
+
+            if connection is None:
+                return None
+
+        connection.channels.add(channel)
+        self.__connections_by_channel[channel] = connection
+
+        return connection
+
+    def __handle_connection_lost(self, connection: Connection) -> None:
+        channels = sorted(connection.channels)
+        now = time.monotonic()
+
+        logger.warning(
+            "Connection %s lost, rejoining its %s channels",
+            connection.shard_id,
+            len(channels),
+        )
+
+        self.__close_connection(connection)
+
+        if self.__connection_lost_at is None:
+            self.__connection_lost_at = now
+
+        self.__channels_to_recover.update(channels)
+
+        for channel in channels:
+            # Rebuilt from the NAMES reply of the rejoin
+            self.__presence.reset(channel)
+            self.__join_scheduler.enqueue(channel, now)
+
+    def __recover_channel(self, channel: str, now: float) -> None:
+        if channel not in self.__channels_to_recover:
+            return
+
+        self.__channels_to_recover.discard(channel)
+
+        if not self.__channels_to_recover:
+            self.__finish_recovery(now)
+
+    def __finish_recovery(self, now: float) -> None:
+        duration = now - self.__connection_lost_at
+
+        self.__connection_lost_at = None
+        self.__reconnects += 1
+        self.__total_reconnect_time += duration
+        self.__last_reconnect_time = duration
+
+        if self.__max_reconnect_time is None or duration > self.__max_reconnect_time:
+            self.__max_reconnect_time = duration
+
+        logger.info("Reconnected in %.2fs", duration)
+
+    def __check_keepalive(self) -> None:
+        pings, dead = self.__keepalive.due(time.monotonic())
+
+        for connection in dead:
+            logger.warning("Connection %s stopped answering PINGs", connection.shard_id)
+
+            self.__handle_connection_lost(connection)
+
+        for connection, token in pings:
+            if connection.alive:
+                self.__send_ping(token, connection)
+
+    def get_ping_stats(self) -> PingStats:
+        """
+        Gets the round-trip times of the PINGs the bot sends to keep its connections alive
+
+        Returns:
+            PingStats
+        """
+
+        return self.__keepalive.stats()
+
+    def __count_outbound_messages(self) -> dict[tuple[str, ...], float]:
+        stats = self.get_outbound_stats()
+
+        return {
+            ("sent",): stats.sent,
+            ("dropped",): stats.dropped,
+            ("coalesced",): stats.coalesced,
+        }
+
+    def get_metrics(self) -> list[MetricSnapshot]:
+        """
+        Gets the current values of the bot's metrics: messages received by command and channel, handling and command
+        times, latency of the chat, depth of the queues, and connections
+
+        Returns:
+            list[MetricSnapshot]
+        """
+
+        return self.__metrics.collect()
+
+    def get_metrics_text(self) -> str:
+        """
+        Gets the current values of the bot's metrics in the Prometheus text format
+
+        Returns:
+            str
+        """
+
+        return self.__metrics.render()
+
+    def start_metrics_server(
+        self, port: int = _DEFAULT_METRICS_PORT, host: str = _DEFAULT_METRICS_HOST
+    ) -> int:
+        """
+        Serves the bot's metrics in the Prometheus text format over HTTP, at /metrics, from a background thread
+
+        Args:
+            port (int): Port to listen on, 0 to pick a free one
+                Default: 8000
+            host (str): Address to listen on
+                Default: "127.0.0.1"
+
+        Raises:
+            OSError: If the port can't be used
+
+        Returns:
+            int: Port the server listens on
+        """
+
+        self.stop_metrics_server()
+
+        self.__metrics_server = MetricsServer(host, port, self.__metrics.render)
+        self.__metrics_server.start()
+
+        logger.info("Serving metrics on %s:%s", host, self.__metrics_server.port)
+
+        return self.__metrics_server.port
+
+    def stop_metrics_server(self) -> None:
+        """
+        Stops serving the bot's metrics
+        """
+
+        if self.__metrics_server is not None:
+            self.__metrics_server.stop()
+            self.__metrics_server = None
+
+    def get_reconnect_stats(self) -> ReconnectStats:
+        """
+        Gets how many times the bot has reconnected and how long it took
+
+        Returns:
+            ReconnectStats
+        """
+
+        return ReconnectStats(
+            self.__reconnects,
+            self.__failed_reconnects,
+            self.__last_reconnect_time,
+            (
+                self.__total_reconnect_time / self.__reconnects
+                if self.__reconnects > 0
+                else None
+            ),
+            self.__max_reconnect_time,
+        )
+
+    def get_chat_state(self, channel: str, fallback: bool = True) -> ChatState | None:
+        """
+        Gets the state of a channel's chat, kept up to date from the messages of the chat
+        If the bot hasn't received the chat's settings yet, they are requested to the API
+
+        Args:
+            channel (str): Channel's name
+            fallback (bool): Whether to request the settings to the API when they aren't known
+                Default: True
+
+        Raises:
+            errors.ClientError
+
+        Returns:
+            ChatState | None: None if nothing is known about the chat and fallback is False
+        """
+
+        channel = channel.replace("#", "").lower()
+
+        if fallback and self.__chat_state.is_cold(channel):
+            state = self.__chat_state.get(channel)
+            broadcaster_id = state.room_id if state is not None else None
+
+            if broadcaster_id is None:
+                users = self.client.get_users(login=[channel])
+                broadcaster_id = str(users[0].user_id) if len(users) > 0 else None
+
+            if broadcaster_id is not None:
+                self.__chat_state.update_settings(
+                    channel, self.client.get_chat_settings(broadcaster_id)
+                )
+
+        return self.__chat_state.get(channel)
+
+    def __get_moderator_id(self) -> str:
+        if self.__user_id is None:
+            users = self.client.get_users(login=[self.username])
+
+            if len(users) == 0:
+                raise ValueError(f"User not found: {self.username}")
+
+            self.__user_id = str(users[0].user_id)
+
+        return self.__user_id
+
+    def __get_broadcaster_id(self, channel: str) -> str:
+        state = self.__chat_state.get(channel)
+
+        if state is not None and state.room_id is not None:
+            return state.room_id
+
+        users = self.client.get_users(login=[channel])
+
+        if len(users) == 0:
+            raise ValueError(f"Channel not found: {channel}")
+
+        return str(users[0].user_id)
+
+    def __get_term_matcher(self, channel: str) -> TermMatcher:
+        matcher = self.__term_matchers.get(channel)
+
+        if matcher is None:
+            matcher = TermMatcher()
+            self.__term_matchers[channel] = matcher
+
+        return matcher
+
+    def __match_blocked_terms(self, message: Message) -> bool:
+        if message.channel is None or message.text is None:
+            return False
+
+        matcher = self.__term_matchers.get(message.channel)
+
+        # Twitch doesn't apply blocked terms to moderators either
+        if matcher is None or message.roles & (Role.MODERATOR | Role.BROADCASTER):
+            return False
+
+        term = matcher.search(message.text)
+
+        if term is None:
+            return False
+
+        logger.info(
+            "Blocked term %s used by %s in %s", term, message.user, message.channel
+        )
+
+        self.__blocked_term_matches.append((term, message))
+
+        return True
+
+    def __flush_blocked_term_matches(self) -> None:
+        if len(self.__blocked_term_matches) == 0:
+            return
+
+        matches = self.__blocked_term_matches
+        self.__blocked_term_matches = []
+
+        self.__moderation_executor.submit(
+            self.__apply_blocked_term_action,
+            matches,
+            self.blocked_term_action,
+            self.blocked_term_timeout,
+        )
+
+    def __apply_blocked_term_action(
+        self, matches: list[tuple[str, Message]], action: str, timeout: int
+    ) -> None:
+        timed_out = set()
+
+        for term, message in matches:
+            try:
+                broadcaster_id = (
+                    message.irc_tags.get("room-id")
+                    if message.irc_tags is not None
+                    else None
+                ) or self.__get_broadcaster_id(message.channel)
+
+                if action == "timeout":
+                    user_id = self.__get_user_id(message)
+
+                    # Several messages of a user in the same batch need a single timeout
+                    if (broadcaster_id, user_id) in timed_out:
+                        continue
+
+                    timed_out.add((broadcaster_id, user_id))
+                    self.__helix_limiter.acquire()
+
+                    self.client.ban_user(
+                        broadcaster_id,
+                        self.__get_moderator_id(),
+                        f"Blocked term: {term}",
+                        user_id,
+                        timeout,
+                    )
+
+                elif message.irc_tags is not None and "id" in message.irc_tags:
+                    self.__helix_limiter.acquire()
+
+                    self.client.delete_chat_messages(
+                        broadcaster_id,
+                        self.__get_moderator_id(),
+                        message.irc_tags["id"],
+                    )
+
+            except Exception:
+                logger.exception(
+                    "Could not apply the blocked term action in %s", message.channel
+                )
+
+    def __detect_spam(self, message: Message) -> bool:
+        if (
+            self.__spam_detector is None
+            or message.channel is None
+            or message.text is None
+            or message.roles & (Role.MODERATOR | Role.BROADCASTER)
+        ):
+            return False
+
+        event = self.__spam_detector.check(
+            message.channel,
+            message.text,
+            self.__get_user_id(message),
+            message.irc_tags.get("id") if message.irc_tags is not None else None,
+            time.monotonic(),
+        )
+
+        if event is not None:
+            logger.warning(
+                "Spam burst in %s: %s messages like %s",
+                event.channel,
+                event.count,
+                event.text,
+            )
+
+            self.__execute_methods_after_spam(event)
+            self.__remove_methods_after_spam()
+
+        return self.__spam_detector.last_count >= 2
+
+    def __track_chat_rate(self, message: Message, duplicate: bool) -> None:
+        if message.channel is None or not self.__shield_mode_trigger.is_enabled(
+            message.channel
+        ):
+            return
+
+        if self.__shield_mode_trigger.record(
+            message.channel, self.__get_user_id(message), duplicate, time.monotonic()
+        ):
+            status = self.__shield_mode_statuses.get(message.channel)
+
+            # Shield Mode turned on by someone else is left for them to turn off
+            if status is not None and status.is_active:
+                self.__shield_mode_trigger.release(message.channel)
+
+                return
+
+            logger.warning(
+                "Chat anomaly in %s, turning Shield Mode on", message.channel
+            )
+
+            self.__shield_mode_executor.submit(
+                self.__update_shield_mode, message.channel, True
+            )
+
+    def __check_shield_mode(self) -> None:
+        for channel in self.__shield_mode_trigger.due(time.monotonic()):
+            logger.info("Chat of %s is calm again, turning Shield Mode off", channel)
+
+            self.__shield_mode_executor.submit(
+                self.__update_shield_mode, channel, False
+            )
+
+    def __update_shield_mode(self, channel: str, is_active: bool) -> None:
+        try:
+            broadcaster_id = self.__get_broadcaster_id(channel)
+            moderator_id = self.__get_moderator_id()
+            # A moderator may have changed Shield Mode since the bot last looked
+            status = self.client.get_shield_mode_status(broadcaster_id, moderator_id)
+            self.__shield_mode_statuses[channel] = status
+
+            if is_active and status.is_active:
+                logger.info("Shield Mode of %s is already on", channel)
+                self.__shield_mode_trigger.release(channel)
+
+                return
+
+            # Already off, or turned on again by someone else
+            if not is_active and (
+                not status.is_active or str(status.moderator.user_id) != moderator_id
+            ):
+                return
+
+            self.__shield_mode_statuses[channel] = (
+                self.client.update_shield_mode_status(
+                    broadcaster_id, moderator_id, is_active
+                )
+            )
+
+        except Exception as error:
+            logger.warning("Could not update the Shield Mode of %s: %s", channel, error)
+
+            # Left to fire again instead of turning off a Shield Mode that was never turned on
+            if is_active:
+                self.__shield_mode_trigger.release(channel)
+
+    def check_automod_status(self, channel: str, text: str) -> Future:
+        """
+        Checks whether a text meets a channel's AutoMod settings
+        Texts checked within a short delay are grouped into a single request
+        The bot's user token must belong to the channel's broadcaster
+
+        Args:
+            channel (str): Channel's name
+            text (str): Text to check
+
+        Returns:
+            Future: Future whose result is whether AutoMod permits the text,
+                or whose exception is the errors.ClientError of the request
+        """
+
+        with self.__automod_lock:
+            future, full = self.__automod_batcher.add(
+                channel.replace("#", "").lower(), text, time.monotonic()
+            )
+
+        if full or self.__loop_thread != threading.get_ident():
+            self.__wake_up()
+
+        return future
+
+    def __screen_automod(self, message: Message) -> None:
+        if (
+            len(self.custom_methods_after_automod_check) == 0
+            or message.channel is None
+            or message.text is None
+            or message.roles & (Role.MODERATOR | Role.BROADCASTER)
+        ):
+            return
+
+        self.check_automod_status(message.channel, message.text).add_done_callback(
+            lambda future: self.__complete_automod_screening(message, future)
+        )
+
+    def __complete_automod_screening(self, message: Message, future: Future) -> None:
+        self.__automod_results.append((message, future))
+        self.__wake_up()
+
+    def __flush_automod(self) -> None:
+        with self.__automod_lock:
+            batches = self.__automod_batcher.take(time.monotonic())
+
+        for channel, batch in batches:
+            self.__automod_executor.submit(self.__send_automod_batch, channel, batch)
+
+        while len(self.__automod_results) > 0:
+            message, future = self.__automod_results.popleft()
+
+            if future.exception() is not None:
+                logger.warning(
+                    "Could not check a message of %s against AutoMod: %s",
+                    message.channel,
+                    future.exception(),
+                )
+
+                continue
+
+            self.__execute_methods_after_automod_check(message, future.result())
+
+        self.__remove_methods_after_automod_check()
+
+    def __send_automod_batch(self, channel: str, batch: list[AutoModCheck]) -> None:
+        try:
+            results = dict(
+                self.client.check_automod_status(
+                    self.__get_broadcaster_id(channel),
+                    [(check.check_id, check.text) for check in batch],
+                )
+            )
+
+        except Exception as error:
+            for check in batch:
+                check.future.set_exception(error)
+
+            return
+
+        for check in batch:
+            if check.check_id in results:
+                check.future.set_result(results[check.check_id])
+
+            else:
+                check.future.set_exception(
+                    ValueError(f"Missing AutoMod result in {channel}")
+                )
+
+    def enable_auto_shield_mode(
+        self,
+        channel: str,
+        messages_per_second: float | None = None,
+        new_chatters_per_second: float | None = None,
+        duplicate_ratio: float | None = None,
+        cooldown: float = _DEFAULT_SHIELD_MODE_COOLDOWN,
+    ) -> None:
+        """
+        Makes the bot turn on a channel's Shield Mode when its chat's activity crosses any of the given thresholds,
+        and turn it off once the chat stays calm for a while
+        Shield Mode turned on by someone else is never turned off by the bot
+        The bot must be a moderator of the channel
+
+        Args:
+            channel (str): Channel's name
+            messages_per_second (float | None): Messages per second that turn Shield Mode on, None to ignore the message rate
+                Default: None
+            new_chatters_per_second (float | None): Users sending their first message per second that turn Shield Mode on,
+                None to ignore the new chatters
+                The users who chat during the first 5 minutes are only remembered, so regulars aren't counted as new
+                Default: None
+            duplicate_ratio (float | None): Fraction of repeated messages, between 0 and 1, that turns Shield Mode on,
+                None to ignore the repeated messages
+                Repeated messages are only detected when the bot's spam_threshold is greater than 0
+                Default: None
+            cooldown (float): Seconds the chat must stay under half of the thresholds before Shield Mode is turned off
+                Default: 300
+
+        Raises:
+            errors.ClientError
+        """
+
+        channel = channel.replace("#", "").lower()
+
+        self.get_shield_mode_status(channel, refresh=True)
+        self.__shield_mode_trigger.enable(
+            channel,
+            messages_per_second,
+            new_chatters_per_second,
+            duplicate_ratio,
+            cooldown,
+            time.monotonic(),
+        )
+
+    def disable_auto_shield_mode(self, channel: str) -> None:
+        """
+        Stops turning a channel's Shield Mode on and off automatically
+        Shield Mode is turned off if the bot turned it on
+
+        Args:
+            channel (str): Channel's name
+        """
+
+        channel = channel.replace("#", "").lower()
+
+        if self.__shield_mode_trigger.disable(channel):
+            self.__shield_mode_executor.submit(
+                self.__update_shield_mode, channel, False
+            )
+
+    def get_shield_mode_status(
+        self, channel: str, refresh: bool = False
+    ) -> ShieldModeStatus:
+        """
+        Gets a channel's Shield Mode status
+        The status is requested to the API the first time and then kept up to date with the bot's own changes
+        The bot must be a moderator of the channel
+
+        Args:
+            channel (str): Channel's name
+            refresh (bool): Whether to request the status to the API even if it's known
+                Default: False
+
+        Raises:
+            errors.ClientError
+
+        Returns:
+            ShieldModeStatus
+        """
+
+        channel = channel.replace("#", "").lower()
+        status = self.__shield_mode_statuses.get(channel)
+
+        if status is None or refresh:
+            status = self.client.get_shield_mode_status(
+                self.__get_broadcaster_id(channel), self.__get_moderator_id()
+            )
+            self.__shield_mode_statuses[channel] = status
+
+        return status
+
+    def get_chat_rates(self, channel: str) -> ChatRates | None:
+        """
+        Gets the recent activity of a channel's chat, as tracked for the automatic Shield Mode
+
+        Args:
+            channel (str): Channel's name
+
+        Returns:
+            ChatRates | None: None if the automatic Shield Mode isn't enabled for the channel
+        """
+
+        return self.__shield_mode_trigger.rates(
+            channel.replace("#", "").lower(), time.monotonic()
+        )
+
+    def timeout_spammers(
+        self,
+        event: SpamEvent,
+        duration: int,
+        reason: str = "Spam",
+        on_progress: Callable[[BulkProgress], None] | None = None,
+    ) -> Future:
+        """
+        Times out in the background the users of a spam burst
+        The bot must be a moderator of the channel
+
+        Args:
+            event (SpamEvent): Burst, as received by the methods added with add_method_after_spam
+            duration (int): Seconds the users are timed out for
+            reason (str): Reason of the timeouts
+                Default: "Spam"
+            on_progress (Callable[[BulkProgress], None] | None): Method to be executed with the progress after each user
+                Default: None
+
+        Returns:
+            Future: Future whose result is the final BulkProgress
+        """
+
+        return self.timeout_users(
+            event.channel, event.user_ids, duration, reason, on_progress
+        )
+
+    def __index_roles(self, message: Message) -> None:
+        if message.channel is None or not self.__moderation_index.is_indexed(
+            message.channel
+        ):
+            return
+
+        # Badges tell the current roles of the sender, only differences take the lock
+        user_id = self.__get_user_id(message)
+        is_moderator = bool(message.roles & Role.MODERATOR)
+        is_vip = bool(message.roles & Role.VIP)
+
+        if self.__moderation_index.is_moderator(message.channel, user_id) != (
+            is_moderator
+        ):
+            self.__moderation_index.set_moderator(
+                message.channel, user_id, is_moderator
+            )
+
+        if self.__moderation_index.is_vip(message.channel, user_id) != is_vip:
+            self.__moderation_index.set_vip(message.channel, user_id, is_vip)
+
+    def __refresh_moderation_indexes(self) -> None:
+        for channel in self.__moderation_index.due(time.monotonic()):
+            self.__bulk_executor.submit(self.__refresh_moderation_index, channel)
+
+    def __refresh_moderation_index(self, channel: str) -> None:
+        try:
+            self.__build_moderation_index(channel)
+
+        except Exception as error:
+            logger.warning(
+                "Could not refresh the moderation index of %s: %s", channel, error
+            )
+
+    def __build_moderation_index(self, channel: str) -> None:
+        if not self.__moderation_index.begin_refresh(channel):
+            return
+
+        # Any failure has to end the refresh, or the channel would never be refreshed again
+        try:
+            banned, moderators, vips = self.__list_moderation_index(channel)
+
+        except Exception:
+            self.__moderation_index.cancel_refresh(channel, time.monotonic())
+            raise
+
+        self.__moderation_index.finish_refresh(
+            channel, banned, moderators, vips, time.monotonic()
+        )
+
+    def __list_moderation_index(
+        self, channel: str
+    ) -> tuple[dict[str, float | None], set[str] | None, set[str] | None]:
+        broadcaster_id = self.__get_broadcaster_id(channel)
+        banned = {
+            banned_user.user.user_id: (
+                banned_user.expires_at.timestamp()
+                if banned_user.expires_at is not None
+                else None
+            )
+            for banned_user in self.client.get_all_banned_users(broadcaster_id)
+        }
+        roles = []
+
+        # Only the broadcaster can list the moderators and the VIPs
+        for get_users in (self.client.get_all_moderators, self.client.get_all_vips):
+            try:
+                roles.append({user.user_id for user in get_users(broadcaster_id)})
+
+            except errors.ClientError as error:
+                logger.warning("Could not list the roles of %s: %s", channel, error)
+                roles.append(None)
+
+        return banned, roles[0], roles[1]
+
+    def load_moderation_index(self, channel: str) -> None:
+        """
+        Lists a channel's banned users, moderators and VIPs, so that is_banned, is_moderator and is_vip can answer
+        without requests
+        The lists are then kept up to date from the chat and the bot's moderation actions, and rebuilt every 5 minutes
+        The bot must be a moderator of the channel, and its user token must belong to the broadcaster to list the
+        moderators and the VIPs
+
+        Args:
+            channel (str): Channel's name
+
+        Raises:
+            errors.ClientError
+        """
+
+        self.__build_moderation_index(channel.replace("#", "").lower())
+
+    def is_banned(self, channel: str, user_id: str) -> bool:
+        """
+        Checks whether a user is banned or timed out in a channel, as listed by load_moderation_index
+
+        Args:
+            channel (str): Channel's name
+            user_id (str): User's ID
+
+        Returns:
+            bool: False if the channel's lists aren't loaded
+        """
+
+        return self.__moderation_index.is_banned(
+            channel.replace("#", "").lower(), user_id, time.time()
+        )
+
+    def is_moderator(self, channel: str, user_id: str) -> bool:
+        """
+        Checks whether a user is a moderator of a channel, as listed by load_moderation_index
+
+        Args:
+            channel (str): Channel's name
+            user_id (str): User's ID
+
+        Returns:
+            bool: False if the channel's lists aren't loaded
+        """
+
+        return self.__moderation_index.is_moderator(
+            channel.replace("#", "").lower(), user_id
+        )
+
+    def is_vip(self, channel: str, user_id: str) -> bool:
+        """
+        Checks whether a user is a VIP of a channel, as listed by load_moderation_index
+
+        Args:
+            channel (str): Channel's name
+            user_id (str): User's ID
+
+        Returns:
+            bool: False if the channel's lists aren't loaded
+        """
+
+        return self.__moderation_index.is_vip(channel.replace("#", "").lower(), user_id)
+
+    def triage_unban_requests(
+        self,
+        channel: str,
+        rules: list[Callable[[UnbanRequestContext], tuple[str, str] | None]],
+        audit_log: str = _DEFAULT_UNBAN_AUDIT_LOG,
+    ) -> Future:
+        """
+        Resolves in the background a channel's pending unban requests with rules, as fast as the Helix rate limit allows
+        The requests are fetched page by page, and each one is given to the rules with its user's information and
+        current ban
+        The first rule that returns a resolution decides, the requests no rule decides on are left pending
+        Every decision is appended to a local audit log
+        The bot must be a moderator of the channel
+
+        Args:
+            channel (str): Channel's name
+            rules (list[Callable[[UnbanRequestContext], tuple[str, str] | None]]): Methods that return the status of a
+                request, approved or denied, and its resolution text, or None to leave it to the next rule
+            audit_log (str): Path of the audit log, one JSON object per line
+                Default: "unban_requests.log"
+
+        Returns:
+            Future: Future whose result is the UnbanTriage
+        """
+
+        log = self.__audit_logs.get(audit_log)
+
+        if log is None:
+            log = AuditLog(audit_log)
+            self.__audit_logs[audit_log] = log
+
+        result = Future()
+
+        self.__bulk_executor.submit(
+            self.__start_unban_triage,
+            result,
+            channel.replace("#", "").lower(),
+            list(rules),
+            log,
+            time.monotonic(),
+        )
+
+        return result
+
+    def __start_unban_triage(
+        self,
+        result: Future,
+        channel: str,
+        rules: list[Callable[[UnbanRequestContext], tuple[str, str] | None]],
+        audit_log: AuditLog,
+        started_at: float,
+    ) -> None:
+        triage = UnbanTriage(channel)
+        resolutions: dict[str, tuple[UnbanRequestContext, str, str]] = {}
+        operations = []
+
+        pending: list[UnbanRequest] = []
+
+        try:
+            broadcaster_id = self.__get_broadcaster_id(channel)
+            moderator_id = self.__get_moderator_id()
+            requests = self.client.get_all_unban_requests(
+                broadcaster_id, moderator_id, "pending"
+            )
+
+            # Listed before any is resolved, since resolved requests leave the pending pages and shift the next ones
+            while True:
+                # Each batch is one page of requests
+                self.__helix_limiter.acquire()
+                page = list(islice(requests, _UNBAN_TRIAGE_BATCH_SIZE))
+
+                if len(page) == 0:
+                    break
+
+                pending.extend(page)
+
+        except Exception as error:
+            # The requests listed before the failure are still triaged
+            logger.warning(
+                "Could not list the unban requests of %s: %s", channel, error
+            )
+            triage.error = str(error)
+
+        try:
+            for start in range(0, len(pending), _UNBAN_TRIAGE_BATCH_SIZE):
+                batch = pending[start : start + _UNBAN_TRIAGE_BATCH_SIZE]
+                targets = []
+
+                for context in self.__enrich_unban_requests(
+                    channel, broadcaster_id, batch, audit_log
+                ):
+                    resolution = self.__decide_unban_request(
+                        triage, rules, context, audit_log
+                    )
+
+                    if resolution is not None:
+                        resolutions[context.request.request_id] = (context, *resolution)
+                        targets.append(context.request.request_id)
+
+                operation = BulkOperation(
+                    "resolve_unban_request",
+                    channel,
+                    targets,
+                    lambda request_id: self.__resolve_unban_request(
+                        audit_log,
+                        channel,
+                        broadcaster_id,
+                        moderator_id,
+                        *resolutions[request_id],
+                    ),
+                    self.__helix_limiter,
+                    None,
+                )
+                operations.append(operation.start(self.__bulk_executor))
+
+        except Exception as error:
+            # The requests decided before the failure are still resolved
+            logger.warning(
+                "Could not triage the unban requests of %s: %s", channel, error
+            )
+            triage.error = str(error)
+
+        gather(operations).add_done_callback(
+            lambda done: self.__finish_unban_triage(
+                result, triage, resolutions, done.result(), started_at
+            )
+        )
+
+    def __enrich_unban_requests(
+        self,
+        channel: str,
+        broadcaster_id: str,
+        requests: list[UnbanRequest],
+        audit_log: AuditLog,
+    ) -> list[UnbanRequestContext]:
+        user_ids = [str(request.user.user_id) for request in requests]
+        users = self.__user_cache.get_many(
+            user_ids, self.__fetch_users, time.monotonic()
+        )
+
+        self.__helix_limiter.acquire()
+        bans = {
+            str(banned_user.user.user_id): banned_user
+            for banned_user in self.client.get_banned_users(
+                broadcaster_id, user_ids, _UNBAN_TRIAGE_BATCH_SIZE
+            )
+        }
+
+        return [
+            UnbanRequestContext(
+                request,
+                users.get(user_id),
+                bans.get(user_id),
+                audit_log.count_requests(
+                    channel, user_id, request.request_id, request.created_at
+                ),
+            )
+            for request, user_id in zip(requests, user_ids)
+        ]
+
+    def __fetch_users(self, user_ids: list[str]) -> list[User]:
+        self.__helix_limiter.acquire()
+
+        return self.client.get_users(user_ids=user_ids)
+
+    def __decide_unban_request(
+        self,
+        triage: UnbanTriage,
+        rules: list[Callable[[UnbanRequestContext], tuple[str, str] | None]],
+        context: UnbanRequestContext,
+        audit_log: AuditLog,
+    ) -> tuple[str, str] | None:
+        request = context.request
+        triage.reviewed += 1
+
+        try:
+            for rule in rules:
+                resolution = rule(context)
+
+                if resolution is None:
+                    continue
+
+                status, resolution_text = resolution
+
+                if status not in _UNBAN_RESOLUTIONS:
+                    raise ValueError(f"Invalid unban request status: {status}")
+
+                return status, resolution_text
+
+        except Exception as error:
+            triage.failed += 1
+            triage.errors[request.request_id] = str(error)
+
+            audit_log.write(
+                triage.channel,
+                str(request.user.user_id),
+                request.request_id,
+                request.created_at,
+                user_login=request.user.login,
+                status="failed",
+                error=str(error),
+            )
+
+            return None
+
+        triage.skipped += 1
+
+        audit_log.write(
+            triage.channel,
+            str(request.user.user_id),
+            request.request_id,
+            request.created_at,
+            user_login=request.user.login,
+            status="pending",
+        )
+
+        return None
+
+    def __resolve_unban_request(
+        self,
+        audit_log: AuditLog,
+        channel: str,
+        broadcaster_id: str,
+        moderator_id: str,
+        context: UnbanRequestContext,
+        status: str,
+        resolution_text: str,
+    ) -> None:
+        request = context.request
+        user_id = str(request.user.user_id)
+
+        try:
+            self.client.resolve_unban_requests(
+                broadcaster_id,
+                moderator_id,
+                request.request_id,
+                status,
+                resolution_text,
+            )
+
+        except Exception as error:
+            audit_log.write(
+                channel,
+                user_id,
+                request.request_id,
+                request.created_at,
+                user_login=request.user.login,
+                status="failed",
+                resolution=status,
+                error=str(error),
+            )
+            raise
+
+        audit_log.write(
+            channel,
+            user_id,
+            request.request_id,
+            request.created_at,
+            user_login=request.user.login,
+            status=status,
+            resolution_text=resolution_text,
+        )
+
+        if status == "approved":
+            self.__moderation_index.unban(channel, user_id)
+
+    def __finish_unban_triage(
+        self,
+        result: Future,
+        triage: UnbanTriage,
+        resolutions: dict[str, tuple[UnbanRequestContext, str, str]],
+        progress: list[BulkProgress],
+        started_at: float,
+    ) -> None:
+        for operation in progress:
+            triage.failed += operation.failed
+            triage.errors.update(operation.errors)
+
+        for request_id, (_, status, _) in resolutions.items():
+            if request_id in triage.errors:
+                continue
+
+            if status == "approved":
+                triage.approved += 1
+
+            else:
+                triage.denied += 1
+
+        triage.elapsed = time.monotonic() - started_at
+
+        logger.info(
+            "Unban requests of %s triaged in %.2fs: %s approved, %s denied, %s skipped, %s failed",
+            triage.channel,
+            triage.elapsed,
+            triage.approved,
+            triage.denied,
+            triage.skipped,
+            triage.failed,
+        )
+
+        result.set_result(triage)
+
+    def load_blocked_terms(self, channel: str) -> list[BlockedTerm]:
+        """
+        Gets a channel's blocked terms and starts removing the chat messages that contain them
+        The bot must be a moderator of the channel
+
+        Args:
+            channel (str): Channel's name
+
+        Raises:
+            errors.ClientError
+
+        Returns:
+            list[BlockedTerm]
+        """
+
+        channel = channel.replace("#", "").lower()
+        terms = list(
+            self.client.get_all_blocked_terms(
+                self.__get_broadcaster_id(channel), self.__get_moderator_id()
+            )
+        )
+        matcher = self.__get_term_matcher(channel)
+
+        for text in self.__blocked_terms.pop(channel, {}).values():
+            matcher.remove(text)
+
+        self.__blocked_terms[channel] = {term.term_id: term.text for term in terms}
+
+        for term in terms:
+            matcher.add(term.text)
+
+        return terms
+
+    def add_blocked_term(self, channel: str, text: str) -> BlockedTerm:
+        """
+        Adds a term to a channel's blocked terms
+        The bot must be a moderator of the channel
+
+        Args:
+            channel (str): Channel's name
+            text (str): Word or phrase to block, with an optional wildcard (*) at its start or end
+
+        Raises:
+            errors.ClientError
+
+        Returns:
+            BlockedTerm
+        """
+
+        channel = channel.replace("#", "").lower()
+        term = self.client.add_blocked_term(
+            self.__get_broadcaster_id(channel), self.__get_moderator_id(), text
+        )
+
+        self.__blocked_terms.setdefault(channel, {})[term.term_id] = term.text
+        self.__get_term_matcher(channel).add(term.text)
+
+        return term
+
+    def remove_blocked_term(self, channel: str, blocked_term_id: str) -> None:
         """
+        Removes a term from a channel's blocked terms
+        The bot must be a moderator of the channel
+
         Args:
-            oauth_token (str): OAuth token
-            client_id (str): Client ID
-            client_secret (str): Client secret
-            redirect_uri (str): Redirect URI
-            tokens_path (str): Path of tokens file (file included)
-            username (str): Name of the bot
-            channels (list): Names of channels the bot will access
-            command_prefix (str): Prefix of the commands the bot will recognize
-            code (str): Authorization code for getting an user token
-            jwt_token (str): JWT Token
-            ready_message (str): Message that the bot will send through the chats of the channels it access
+            channel (str): Channel's name
+            blocked_term_id (str): ID of the blocked term
+
+        Raises:
+            errors.ClientError
         """
 
-        self.client = Client(
-            client_id,
-            client_secret,
-            redirect_uri,
-            tokens_path,
-            authorization_code,
-            jwt_token,
+        channel = channel.replace("#", "").lower()
+
+        self.client.remove_blocked_term(
+            self.__get_broadcaster_id(channel),
+            blocked_term_id,
+            self.__get_moderator_id(),
         )
-        self.__oauth_token = oauth_token
-        self.__finish = False
-        self.username = username
 
-        self.channels = []
+        text = self.__blocked_terms.get(channel, {}).pop(blocked_term_id, None)
+
+        if text is not None:
+            self.__get_term_matcher(channel).remove(text)
+
+    def sync_blocked_terms(self, channels: list[str], terms: list[str]) -> Future:
+        """
+        Makes the blocked terms of channels match a list, with the fewest additions and removals
+        The channels are synchronized concurrently, and the changes are applied as fast as the Helix rate limit allows
+        The bot must be a moderator of the channels
+
+        Args:
+            channels (list[str]): Channels' names
+            terms (list[str]): Words or phrases the channels must block, with an optional wildcard (*) at their start or end
+
+        Returns:
+            Future: Future whose result is the list of BlockedTermsSync, one for each channel
+        """
+
+        results = []
 
         for channel in channels:
-            self.channels.append(channel.replace("@", "").lower())
+            result = Future()
+            results.append(result)
+
+            self.__bulk_executor.submit(
+                self.__start_blocked_terms_sync,
+                result,
+                channel.replace("#", "").lower(),
+                list(terms),
+                time.monotonic(),
+            )
 
-        self.command_prefix = command_prefix
-        self.ready_message = ready_message if ready_message is not None else ""
+        return gather(results)
 
-        self.custom_methods_before_join_channel = {}
-        self.methods_before_join_channel_to_remove = []
-        self.custom_methods_after_join_channel = {}
-        self.methods_after_join_channel_to_remove = []
+    def __start_blocked_terms_sync(
+        self, result: Future, channel: str, terms: list[str], started_at: float
+    ) -> None:
+        try:
+            broadcaster_id = self.__get_broadcaster_id(channel)
+            moderator_id = self.__get_moderator_id()
+            to_add, to_remove = diff_blocked_terms(
+                self.client.get_all_blocked_terms(broadcaster_id, moderator_id), terms
+            )
 
-        self.custom_methods_before_leave_channel = {}
-        self.methods_before_leave_channel_to_remove = []
-        self.custom_methods_after_leave_channel = {}
-        self.methods_after_leave_channel_to_remove = []
+        except Exception as error:
+            logger.warning("Could not list the blocked terms of %s: %s", channel, error)
+            result.set_result(
+                BlockedTermsSync(
+                    channel, 0, 0, 0, time.monotonic() - started_at, str(error)
+                )
+            )
 
-        self.custom_checks = {}
-        self.checks_to_remove = []
-        self.custom_listeners = {}
-        self.listeners_to_remove = []
-        self.custom_commands = {}
-        self.commands_to_remove = []
-        self.custom_methods_before_commands = {}
-        self.methods_before_commands_to_remove = []
-        self.custom_methods_after_commands = {}
-        self.methods_after_commands_to_remove = []
+            return
 
-        self.custom_methods_after_clearchat = {}
-        self.methods_after_clearchat_to_remove = []
+        added: list[BlockedTerm] = []
+        removed: list[str] = []
+        operations = [
+            BulkOperation(
+                "add_blocked_term",
+                channel,
+                to_add,
+                lambda text: added.append(
+                    self.client.add_blocked_term(broadcaster_id, moderator_id, text)
+                ),
+                self.__helix_limiter,
+                None,
+            ),
+            BulkOperation(
+                "remove_blocked_term",
+                channel,
+                to_remove,
+                lambda term_id: self.__remove_synced_term(
+                    broadcaster_id, moderator_id, term_id, removed
+                ),
+                self.__helix_limiter,
+                None,
+            ),
+        ]
 
-        self.custom_methods_after_delete_message = {}
-        self.methods_after_delete_message_to_remove = []
+        gather(
+            [operation.start(self.__bulk_executor) for operation in operations]
+        ).add_done_callback(
+            lambda done: self.__finish_blocked_terms_sync(
+                result, channel, added, removed, done.result(), started_at
+            )
+        )
 
-        self.custom_methods_after_bot_connected = {}
-        self.methods_after_bot_connected_to_remove = []
+    def __remove_synced_term(
+        self, broadcaster_id: str, moderator_id: str, term_id: str, removed: list[str]
+    ) -> None:
+        self.client.remove_blocked_term(broadcaster_id, term_id, moderator_id)
+        removed.append(term_id)
 
-        self.custom_methods_after_toggle_host = {}
-        self.methods_after_toggle_host_to_remove = []
+    def __finish_blocked_terms_sync(
+        self,
+        result: Future,
+        channel: str,
+        added: list[BlockedTerm],
+        removed: list[str],
+        progress: list[BulkProgress],
+        started_at: float,
+    ) -> None:
+        sync = BlockedTermsSync(
+            channel,
+            len(added),
+            len(removed),
+            sum(operation.failed for operation in progress),
+            time.monotonic() - started_at,
+        )
 
-        self.custom_methods_after_server_reconnect = {}
-        self.methods_after_server_reconnect_to_remove = []
+        logger.info(
+            "Blocked terms of %s synchronized in %.2fs: %s added, %s removed, %s failed",
+            channel,
+            sync.elapsed,
+            sync.added,
+            sync.removed,
+            sync.failed,
+        )
 
-        self.custom_methods_after_channel_change = {}
-        self.methods_after_channel_change_to_remove = []
+        self.__blocked_term_updates.append((channel, added, removed))
+        self.__wake_up()
 
-        self.custom_methods_after_event = {}
-        self.methods_after_event_to_remove = []
+        result.set_result(sync)
 
-        self.custom_methods_after_user_join = {}
-        self.methods_after_user_join_to_remove = []
+    def __apply_blocked_term_updates(self) -> None:
+        while len(self.__blocked_term_updates) > 0:
+            channel, added, removed = self.__blocked_term_updates.popleft()
 
-        self.custom_methods_after_whisper = {}
-        self.methods_after_whisper_to_remove = []
+            # Only the channels whose terms were loaded are filtered by the bot
+            if channel not in self.__blocked_terms:
+                continue
 
-        self.irc = ssl.SSLContext().wrap_socket(socket.socket())
+            terms = self.__blocked_terms[channel]
+            matcher = self.__get_term_matcher(channel)
 
-    def __send_command(self, command: str, args: str, tags: str | None = None) -> None:
-        logger.info("%s%s < %s", tags + " " if tags is not None else "", command, args)
+            for term_id in removed:
+                text = terms.pop(term_id, None)
 
-        self.irc.send(
-            (
-                f"{tags + ' ' if tags is not None else ''}{command} {args}" + "\r\n"
-            ).encode()
-        )
+                if text is not None:
+                    matcher.remove(text)
 
-    def __send_join(self, channel: str) -> None:
-        self.__send_command("JOIN", f"#{channel}")
+            for term in added:
+                terms[term.term_id] = term.text
+                matcher.add(term.text)
 
-    def __send_nick(self, username: str) -> None:
-        self.__send_command("NICK", username)
+    def add_filtered_terms(self, channel: str, terms: list[str]) -> None:
+        """
+        Adds terms that the bot removes from a channel's chat without adding them to the channel's blocked terms
 
-    def __send_part(self, channel: str) -> None:
-        self.__send_command("PART", f"#{channel}")
+        Args:
+            channel (str): Channel's name
+            terms (list[str]): Words or phrases, with an optional wildcard (*) at their start or end
+        """
 
-    def __send_pass(self, oauth_token: str) -> None:
-        self.__send_command("PASS", oauth_token)
+        matcher = self.__get_term_matcher(channel.replace("#", "").lower())
 
-    def __send_pong(self, text: str) -> None:
-        self.__send_command("PONG", f":{text}")
+        for term in terms:
+            matcher.add(term)
 
-    def __send_privmsg(
-        self, channel: str, text: str, message_to_reply: str | None = None
-    ) -> None:
-        self.__send_command(
-            "PRIVMSG",
-            f"#{channel} :{text}",
-            (
-                f"@reply-parent-msg-id={message_to_reply}"
-                if message_to_reply is not None
-                else None
-            ),
+    def remove_filtered_terms(self, channel: str, terms: list[str]) -> None:
+        """
+        Removes terms added with add_filtered_terms
+
+        Args:
+            channel (str): Channel's name
+            terms (list[str]): Words or phrases, as they were added
+        """
+
+        matcher = self.__get_term_matcher(channel.replace("#", "").lower())
+
+        for term in terms:
+            matcher.remove(term)
+
+    def get_chatters(self, channel: str) -> list[str]:
+        """
+        Gets the users present in a channel's chat, as announced by Twitch when they join and leave
+        In channels with many users, Twitch only announces users periodically
+
+        Args:
+            channel (str): Channel's name
+
+        Returns:
+            list[str]
+        """
+
+        return self.__presence.users(channel.replace("#", "").lower())
+
+    def get_chatter_count(self, channel: str) -> int:
+        """
+        Gets the number of users present in a channel's chat
+
+        Args:
+            channel (str): Channel's name
+
+        Returns:
+            int
+        """
+
+        return self.__presence.count(channel.replace("#", "").lower())
+
+    def is_chatter(self, channel: str, user: str) -> bool:
+        """
+        Checks whether a user is present in a channel's chat
+
+        Args:
+            channel (str): Channel's name
+            user (str): User's name
+
+        Returns:
+            bool
+        """
+
+        return self.__presence.contains(
+            channel.replace("#", "").lower(), user.replace("@", "").lower()
         )
 
-    def __login(self) -> None:
-        self.__send_pass(self.__oauth_token)
-        self.__send_nick(self.username)
+    def get_user_messages(self, channel: str, user_id: str) -> list[HistoryEntry]:
+        """
+        Gets the last messages a user sent in a channel's chat
 
-    def __request_irc_capabilities(self) -> None:
-        self.__send_command(
-            "CAP REQ", ":twitch.tv/commands twitch.tv/membership twitch.tv/tags"
+        Args:
+            channel (str): Channel's name
+            user_id (str): User's ID
+
+        Returns:
+            list[HistoryEntry]: Messages from oldest to newest, including the deleted ones
+        """
+
+        if self.__history is None:
+            return []
+
+        return self.__history.get_user_messages(
+            channel.replace("#", "").lower(), user_id
+        )
+
+    def get_message(self, message_id: str) -> HistoryEntry | None:
+        """
+        Gets a recent chat message by its ID
+
+        Args:
+            message_id (str): Message's ID
+
+        Returns:
+            HistoryEntry | None: None if the message isn't kept
+        """
+
+        if self.__history is None:
+            return None
+
+        return self.__history.get_message(message_id)
+
+    def get_emote_usage(
+        self, channel: str, window: float = 60, limit: int | None = None
+    ) -> list[EmoteUsage]:
+        """
+        Gets the emotes most used in a channel's chat recently
+
+        Args:
+            channel (str): Channel's name
+            window (float): Seconds to look back, up to an hour
+                Default: 60
+            limit (int | None): Maximum number of emotes to get
+                Default: all of them
+
+        Returns:
+            list[EmoteUsage]: Emotes sorted from most to least used
+        """
+
+        return self.__emote_usage.top(
+            channel.replace("#", "").lower(), window, limit, time.monotonic()
         )
 
     def join_channel(self, channel: str) -> None:
@@ -174,16 +2196,132 @@ class Bot:
             channel (str): The channel to join
         """
 
+        self.__request_join(channel)
+
+        if len(self.connections) > 0:
+            self.__flush_joins()
+
+    def __request_join(self, channel: str) -> None:
         self.__execute_methods_before_join_channel(channel)
+        self.__remove_methods_before_join_channel()
 
-        self.__send_join(channel)
-        self.__send_privmsg(channel, self.ready_message)
+        self.__join_scheduler.enqueue(channel, time.monotonic())
 
-        self.__execute_methods_after_join_channel(channel)
+    def __has_capacity(self) -> bool:
+        return any(
+            len(connection.channels) < self.channels_per_connection
+            for connection in self.connections
+        )
+
+    def __flush_joins(self) -> None:
+        now = time.monotonic()
+
+        if (
+            self.__reconnect_at is not None
+            and now < self.__reconnect_at
+            and not self.__has_capacity()
+        ):
+            return
+
+        channels = self.__join_scheduler.take(now)
+
+        if len(channels) == 0:
+            return
+
+        batches: dict[Connection, list[str]] = {}
+        unassigned = []
+
+        for channel in channels:
+            connection = self.__assign_channel(channel)
+
+            if connection is None:
+                unassigned.append(channel)
+                continue
+
+            batches.setdefault(connection, []).append(channel)
+
+        if len(unassigned) > 0:
+            self.__join_scheduler.restore(unassigned)
+
+        recovering = set(self.__channels_to_recover)
+        joined = []
+        unsent = []
+
+        for connection, batch in batches.items():
+            lines: list[list[str]] = [[]]
+            length = 0
+
+            for channel in batch:
+                # Every JOIN command has to fit into a single IRC line
+                if length + len(channel) + 2 > _MAX_JOIN_LINE_LENGTH:
+                    lines.append([])
+                    length = 0
+
+                lines[-1].append(channel)
+                length += len(channel) + 2
+
+            for index, line in enumerate(lines):
+                self.__send_join(line, connection)
+
+                # The lost connection's channels are already queued to be rejoined
+                if connection not in self.connections:
+                    unsent.extend(
+                        channel
+                        for channels_left in lines[index:]
+                        for channel in channels_left
+                    )
+                    break
+
+                joined.extend(line)
+
+        if len(unsent) > 0:
+            # Never joined, so they are announced when they are
+            self.__channels_to_recover.difference_update(
+                channel for channel in unsent if channel not in recovering
+            )
+
+            if not self.__channels_to_recover:
+                self.__connection_lost_at = None
+
+        for channel in joined:
+            # Channels rejoined after a reconnection were already announced
+            if channel in recovering:
+                continue
+
+            if len(self.ready_message) > 0:
+                self.__send_privmsg(channel, self.ready_message)
+
+            self.__execute_methods_after_join_channel(channel)
 
-        self.__remove_methods_before_join_channel()
         self.__remove_methods_after_join_channel()
 
+    def __expire_joins(self) -> None:
+        now = time.monotonic()
+
+        for channel in self.__join_scheduler.expire(now):
+            logger.warning("Join of %s wasn't confirmed, giving it up", channel)
+
+            self.__give_up_join(channel, now)
+
+    def __give_up_join(self, channel: str, now: float) -> None:
+        connection = self.__connections_by_channel.pop(channel, None)
+
+        if connection is not None:
+            connection.channels.discard(channel)
+
+        self.__presence.discard(channel)
+        self.__recover_channel(channel, now)
+
+    def get_join_progress(self) -> JoinProgress:
+        """
+        Gets the progress of the channel joins requested by the bot
+
+        Returns:
+            JoinProgress
+        """
+
+        return self.__join_scheduler.progress()
+
     def leave_channel(self, channel: str) -> None:
         """
         Makes the bot to leave into a channel
@@ -194,7 +2332,25 @@ class Bot:
 
         self.__execute_methods_before_leave_channel(channel)
 
-        self.__send_part(channel)
+        if not self.__join_scheduler.discard(channel):
+            self.__send_part(channel)
+
+        with self.__outbound_lock:
+            self.__outbound.discard(channel)
+
+        self.__emote_usage.discard(channel)
+        self.__chat_state.discard(channel)
+        self.__presence.discard(channel)
+        self.disable_auto_shield_mode(channel)
+        self.__moderation_index.discard(channel)
+
+        if self.__spam_detector is not None:
+            self.__spam_detector.discard(channel)
+
+        if self.__history is not None:
+            self.__history.discard(channel)
+
+        self.__chat_messages.remove(channel)
 
         self.__execute_methods_after_leave_channel(channel)
 
@@ -202,22 +2358,50 @@ class Bot:
         self.__remove_methods_after_leave_channel()
 
     def __connect(self) -> None:
-        self.irc.settimeout(_DEFAULT_TIMEOUT)
-        self.irc.connect((_IRC_SERVER, _IRC_PORT))
+        shards = max(1, math.ceil(len(self.channels) / self.channels_per_connection))
+
+        for _ in range(shards):
+            self.__open_connection()
 
-        self.__login()
-        self.__request_irc_capabilities()
+        if len(self.connections) == 0:
+            self.__connection_lost_at = time.monotonic()
 
         for channel in self.channels:
-            self.join_channel(channel)
+            self.__request_join(channel)
+
+    def __disconnect(self) -> None:
+        for connection in list(self.connections):
+            self.__close_connection(connection)
 
     def run(self) -> None:
         """
         Runs the bot
         """
 
-        self.__connect()
-        self.__loop()
+        self.__finish = False
+        self.__loop_thread = threading.get_ident()
+        self.__irc_log.start()
+
+        try:
+            self.__connect()
+            self.__loop()
+
+        finally:
+            self.__loop_thread = None
+            self.__disconnect()
+
+            for executor in (
+                self.__moderation_executor,
+                self.__shield_mode_executor,
+                self.__automod_executor,
+            ):
+                executor.shutdown(wait=False, cancel_futures=True)
+
+            # Bulk operations, triages and syncs resolve the futures handed to their callers once their queued
+            # tasks finish, so those tasks aren't cancelled
+            self.__bulk_executor.shutdown(wait=False)
+
+            self.__irc_log.stop()
 
     def stop(self) -> None:
         """
@@ -225,6 +2409,7 @@ class Bot:
         """
 
         self.__finish = True
+        self.__wake_up()
 
     def __get_user_from_prefix(self, prefix: str) -> str | None:
         domain = prefix.split("!")[0]
@@ -243,6 +2428,21 @@ class Bot:
 
         return string[len(prefix) :]
 
+    def __get_command_prefixes(self) -> tuple[str, ...]:
+        if isinstance(self.command_prefix, str):
+            return (self.command_prefix,)
+
+        return tuple(self.command_prefix)
+
+    def __get_command_prefix(self, word: str) -> str | None:
+        prefixes = [
+            prefix
+            for prefix in self.__get_command_prefixes()
+            if word.startswith(prefix)
+        ]
+
+        return max(prefixes, key=len) if len(prefixes) > 0 else None
+
     def __parse_message(self, received_msg: str) -> Message:
         parts = received_msg.split(" ")
 
@@ -277,8 +2477,10 @@ class Bot:
             text_parts[0] = text_parts[0][1:]
             text = " ".join(text_parts)
 
-            if text_parts[0].startswith(self.command_prefix):
-                text_command = self.__remove_prefix(text_parts[0], self.command_prefix)
+            command_prefix = self.__get_command_prefix(text_parts[0])
+
+            if command_prefix is not None:
+                text_command = self.__remove_prefix(text_parts[0], command_prefix)
                 text_args = text_parts[1:]
 
             parts = parts[:text_start]
@@ -305,11 +2507,28 @@ class Bot:
             text_args,
         )
 
+        if irc_tags is not None:
+            message.badges, message.roles, message.subscriber_tier = parse_badges(
+                irc_tags.get("badges")
+            )
+            message.badge_info = parse_badge_info(irc_tags.get("badge-info"))
+            message.emotes = parse_emotes(irc_tags.get("emotes"), text)
+
+            if irc_tags.get("mod") == "1":
+                message.roles |= Role.MODERATOR
+
+            if irc_tags.get("vip") == "1":
+                message.roles |= Role.VIP
+
+            if irc_tags.get("subscriber") == "1":
+                message.roles |= Role.SUBSCRIBER
+                message.subscriber_tier = max(message.subscriber_tier, 1)
+
         return message
 
     def __execute_methods_before_join_channel(self, channel: str) -> None:
-        for method in self.custom_methods_before_join_channel.values():
-            method(channel)
+        for name, method in self.custom_methods_before_join_channel.items():
+            self.__call_handler("before_join_channel", name, method, channel)
 
     def __remove_methods_before_join_channel(self) -> None:
         for method in self.methods_before_join_channel_to_remove:
@@ -319,8 +2538,8 @@ class Bot:
         self.methods_before_join_channel_to_remove = []
 
     def __execute_methods_after_join_channel(self, channel: str) -> None:
-        for method in self.custom_methods_after_join_channel.values():
-            method(channel)
+        for name, method in self.custom_methods_after_join_channel.items():
+            self.__call_handler("after_join_channel", name, method, channel)
 
     def __remove_methods_after_join_channel(self) -> None:
         for method in self.methods_after_join_channel_to_remove:
@@ -330,8 +2549,8 @@ class Bot:
         self.methods_after_join_channel_to_remove = []
 
     def __execute_methods_before_leave_channel(self, channel: str) -> None:
-        for method in self.custom_methods_before_leave_channel.values():
-            method(channel)
+        for name, method in self.custom_methods_before_leave_channel.items():
+            self.__call_handler("before_leave_channel", name, method, channel)
 
     def __remove_methods_before_leave_channel(self) -> None:
         for method in self.methods_before_leave_channel_to_remove:
@@ -340,52 +2559,172 @@ class Bot:
 
         self.methods_before_leave_channel_to_remove = []
 
-    def __execute_methods_after_leave_channel(self, channel: str) -> None:
-        for method in self.custom_methods_after_leave_channel.values():
-            method(channel)
+    def __execute_methods_after_leave_channel(self, channel: str) -> None:
+        for name, method in self.custom_methods_after_leave_channel.items():
+            self.__call_handler("after_leave_channel", name, method, channel)
+
+    def __remove_methods_after_leave_channel(self) -> None:
+        for method in self.methods_after_leave_channel_to_remove:
+            if method in self.custom_methods_after_leave_channel:
+                self.custom_methods_after_leave_channel.pop(method)
+
+        self.methods_after_leave_channel_to_remove = []
+
+    def __call_handler(self, kind: str, name: str, method: Callable, *args) -> None:
+        if not self.__profiling:
+            method(*args)
+            return
+
+        self.__profiler.call(kind, name, method, *args)
+
+    def enable_profiling(
+        self, slow_threshold: float = _DEFAULT_SLOW_HANDLER_THRESHOLD
+    ) -> None:
+        """
+        Starts measuring the commands, listeners, handlers, checks and methods added with add_method_*, and the Client
+        calls made from them, from scratch
+        The handlers that run longer than a threshold are logged with a sample of their stack, while they run
+        While profiling, the bot's client is replaced by a proxy that measures its calls
+
+        Args:
+            slow_threshold (float): Seconds after which a handler is reported as slow
+                Default: 0.1
+        """
+
+        self.disable_profiling()
+
+        self.__profiler = HandlerProfiler(slow_threshold, _PROFILER_SAMPLES)
+        self.__profiler.start()
+        self.client = ProfiledClient(self.client, self.__profiler)
+        self.__profiling = True
+
+    def disable_profiling(self) -> None:
+        """
+        Stops measuring the handlers, the measures taken are kept
+        """
+
+        if not self.__profiling:
+            return
+
+        self.__profiling = False
+        self.__profiler.stop()
+
+        if isinstance(self.client, ProfiledClient):
+            self.client = self.client.client
+
+    def get_handler_stats(self) -> list[HandlerStats]:
+        """
+        Gets the measures of the handlers and the Client methods called from them, slowest first
+
+        Returns:
+            list[HandlerStats]: Empty if profiling was never enabled
+        """
 
-    def __remove_methods_after_leave_channel(self) -> None:
-        for method in self.methods_after_leave_channel_to_remove:
-            if method in self.custom_methods_after_leave_channel:
-                self.custom_methods_after_leave_channel.pop(method)
+        if self.__profiler is None:
+            return []
 
-        self.methods_after_leave_channel_to_remove = []
+        return self.__profiler.stats()
 
     def __execute_checks(self) -> None:
-        for check in self.custom_checks.values():
-            check()
+        with self.__scheduler_lock:
+            due = self.__scheduler.pop_due(time.monotonic())
+
+        for name, lateness in due:
+            check = self.custom_checks.get(name)
+
+            if check is None:
+                with self.__scheduler_lock:
+                    self.__scheduler.remove(name)
+
+                continue
+
+            if lateness >= _CHECK_LATENESS_WARNING:
+                logger.warning("Check %s ran %.2fs late", name, lateness)
+
+            self.__call_handler("check", name, check)
 
     def __remove_checks(self) -> None:
         for check in self.checks_to_remove:
             if check in self.custom_checks:
                 self.custom_checks.pop(check)
 
+                with self.__scheduler_lock:
+                    self.__scheduler.remove(check)
+
         self.checks_to_remove = []
 
     def __execute_listeners(self, message: Message) -> None:
-        for listener in self.custom_listeners.values():
-            listener(message)
+        for name in self.__listener_index.match(message):
+            listener = self.custom_listeners.get(name)
+
+            if listener is not None:
+                self.__call_handler("listener", name, listener, message)
 
     def __remove_listeners(self) -> None:
         for listener in self.listeners_to_remove:
             if listener in self.custom_listeners:
                 self.custom_listeners.pop(listener)
+                self.__listener_index.remove(listener)
 
         self.listeners_to_remove = []
 
+    def __execute_handlers(self, message: Message) -> None:
+        for name in self.__handler_index.match(message):
+            handler = self.custom_handlers.get(name)
+
+            if handler is not None:
+                self.__call_handler("handler", name, handler, message)
+
+    def __remove_handlers(self) -> None:
+        for handler in self.handlers_to_remove:
+            if handler in self.custom_handlers:
+                self.custom_handlers.pop(handler)
+                self.__handler_index.remove(handler)
+
+        self.handlers_to_remove = []
+
+    def __has_command_permission(self, command: str, message: Message) -> bool:
+        permission = self.__command_permissions.get(command)
+
+        if permission is None:
+            return True
+
+        roles, subscriber_tier = permission
+
+        if roles and not message.roles & roles:
+            return False
+
+        return message.subscriber_tier >= subscriber_tier
+
     def __execute_command(self, message: Message) -> None:
-        self.custom_commands[message.text_command](message)
+        started_at = time.perf_counter()
+
+        try:
+            self.__call_handler(
+                "command",
+                message.text_command,
+                self.custom_commands[message.text_command],
+                message,
+            )
+
+        finally:
+            self.__command_time.labels(message.text_command).observe(
+                time.perf_counter() - started_at
+            )
 
     def __remove_commands(self) -> None:
         for command in self.commands_to_remove:
             if command in self.custom_commands:
                 self.custom_commands.pop(command)
+                self.__command_router.remove(command)
+                self.__cooldowns.remove(command)
+                self.__command_permissions.pop(command, None)
 
         self.commands_to_remove = []
 
     def __execute_methods_before_commands(self, message: Message) -> None:
-        for before in self.custom_methods_before_commands.values():
-            before(message)
+        for name, before in self.custom_methods_before_commands.items():
+            self.__call_handler("before_commands", name, before, message)
 
     def __remove_methods_before_commands(self) -> None:
         for method in self.methods_before_commands_to_remove:
@@ -395,8 +2734,8 @@ class Bot:
         self.methods_before_commands_to_remove = []
 
     def __execute_methods_after_commands(self, message: Message) -> None:
-        for after in self.custom_methods_after_commands.values():
-            after(message)
+        for name, after in self.custom_methods_after_commands.items():
+            self.__call_handler("after_commands", name, after, message)
 
     def __remove_methods_after_commands(self) -> None:
         for method in self.methods_after_commands_to_remove:
@@ -406,8 +2745,8 @@ class Bot:
         self.methods_after_commands_to_remove = []
 
     def __execute_methods_after_clearchat(self, message: Message) -> None:
-        for method in self.custom_methods_after_clearchat.values():
-            method(message)
+        for name, method in self.custom_methods_after_clearchat.items():
+            self.__call_handler("after_clearchat", name, method, message)
 
     def __remove_methods_after_clearchat(self) -> None:
         for method in self.methods_after_clearchat_to_remove:
@@ -417,8 +2756,8 @@ class Bot:
         self.methods_after_clearchat_to_remove = []
 
     def __execute_methods_after_delete_message(self, message: Message) -> None:
-        for method in self.custom_methods_after_delete_message.values():
-            method(message)
+        for name, method in self.custom_methods_after_delete_message.items():
+            self.__call_handler("after_delete_message", name, method, message)
 
     def __remove_methods_after_delete_message(self) -> None:
         for method in self.methods_after_delete_message_to_remove:
@@ -428,8 +2767,8 @@ class Bot:
         self.methods_after_delete_message_to_remove = []
 
     def __execute_methods_after_bot_connected(self, message: Message) -> None:
-        for method in self.custom_methods_after_bot_connected.values():
-            method(message)
+        for name, method in self.custom_methods_after_bot_connected.items():
+            self.__call_handler("after_bot_connected", name, method, message)
 
     def __remove_methods_after_bot_connected(self) -> None:
         for method in self.methods_after_bot_connected_to_remove:
@@ -439,8 +2778,8 @@ class Bot:
         self.methods_after_bot_connected_to_remove = []
 
     def __execute_methods_after_toggle_host(self, message: Message) -> None:
-        for method in self.custom_methods_after_toggle_host.values():
-            method(message)
+        for name, method in self.custom_methods_after_toggle_host.items():
+            self.__call_handler("after_toggle_host", name, method, message)
 
     def __remove_methods_after_toggle_host(self) -> None:
         for method in self.methods_after_toggle_host_to_remove:
@@ -450,8 +2789,8 @@ class Bot:
         self.methods_after_toggle_host_to_remove = []
 
     def __execute_methods_after_server_reconnect(self, message: Message) -> None:
-        for method in self.custom_methods_after_server_reconnect.values():
-            method(message)
+        for name, method in self.custom_methods_after_server_reconnect.items():
+            self.__call_handler("after_server_reconnect", name, method, message)
 
     def __remove_methods_after_server_reconnect(self) -> None:
         for method in self.methods_after_server_reconnect_to_remove:
@@ -461,8 +2800,8 @@ class Bot:
         self.methods_after_server_reconnect_to_remove = []
 
     def __execute_methods_after_channel_change(self, message: Message) -> None:
-        for method in self.custom_methods_after_channel_change.values():
-            method(message)
+        for name, method in self.custom_methods_after_channel_change.items():
+            self.__call_handler("after_channel_change", name, method, message)
 
     def __remove_methods_after_channel_change(self) -> None:
         for method in self.methods_after_channel_change_to_remove:
@@ -472,8 +2811,8 @@ class Bot:
         self.methods_after_channel_change_to_remove = []
 
     def __execute_methods_after_event(self, message: Message) -> None:
-        for method in self.custom_methods_after_event.values():
-            method(message)
+        for name, method in self.custom_methods_after_event.items():
+            self.__call_handler("after_event", name, method, message)
 
     def __remove_methods_after_event(self) -> None:
         for method in self.methods_after_event_to_remove:
@@ -483,8 +2822,8 @@ class Bot:
         self.methods_after_event_to_remove = []
 
     def __execute_methods_after_user_join(self, message: Message) -> None:
-        for method in self.custom_methods_after_user_join.values():
-            method(message)
+        for name, method in self.custom_methods_after_user_join.items():
+            self.__call_handler("after_user_join", name, method, message)
 
     def __remove_methods_after_user_join(self) -> None:
         for method in self.methods_after_user_join_to_remove:
@@ -494,8 +2833,8 @@ class Bot:
         self.methods_after_user_join_to_remove = []
 
     def __execute_methods_after_whisper(self, message: Message) -> None:
-        for method in self.custom_methods_after_whisper.values():
-            method(message)
+        for name, method in self.custom_methods_after_whisper.items():
+            self.__call_handler("after_whisper", name, method, message)
 
     def __remove_methods_after_whisper(self) -> None:
         for method in self.methods_after_whisper_to_remove:
@@ -504,42 +2843,287 @@ class Bot:
 
         self.methods_after_whisper_to_remove = []
 
+    def __execute_methods_after_chatter_join(self, channel: str, user: str) -> None:
+        for name, method in self.custom_methods_after_chatter_join.items():
+            self.__call_handler("after_chatter_join", name, method, channel, user)
+
+    def __remove_methods_after_chatter_join(self) -> None:
+        for method in self.methods_after_chatter_join_to_remove:
+            if method in self.custom_methods_after_chatter_join:
+                self.custom_methods_after_chatter_join.pop(method)
+
+        self.methods_after_chatter_join_to_remove = []
+
+    def __execute_methods_after_chatter_leave(self, channel: str, user: str) -> None:
+        for name, method in self.custom_methods_after_chatter_leave.items():
+            self.__call_handler("after_chatter_leave", name, method, channel, user)
+
+    def __remove_methods_after_chatter_leave(self) -> None:
+        for method in self.methods_after_chatter_leave_to_remove:
+            if method in self.custom_methods_after_chatter_leave:
+                self.custom_methods_after_chatter_leave.pop(method)
+
+        self.methods_after_chatter_leave_to_remove = []
+
+    def __execute_methods_after_spam(self, event: SpamEvent) -> None:
+        for name, method in self.custom_methods_after_spam.items():
+            self.__call_handler("after_spam", name, method, event)
+
+    def __remove_methods_after_spam(self) -> None:
+        for method in self.methods_after_spam_to_remove:
+            if method in self.custom_methods_after_spam:
+                self.custom_methods_after_spam.pop(method)
+
+        self.methods_after_spam_to_remove = []
+
+    def __execute_methods_after_automod_check(
+        self, message: Message, is_permitted: bool
+    ) -> None:
+        for name, method in self.custom_methods_after_automod_check.items():
+            self.__call_handler(
+                "after_automod_check", name, method, message, is_permitted
+            )
+
+    def __remove_methods_after_automod_check(self) -> None:
+        for method in self.methods_after_automod_check_to_remove:
+            if method in self.custom_methods_after_automod_check:
+                self.custom_methods_after_automod_check.pop(method)
+
+        self.methods_after_automod_check_to_remove = []
+
     def __handle_notice(self, message: Message) -> None:
-        logger.info(
-            "%s > [%s]: %s | %s",
-            message.irc_command,
-            message.channel,
-            message.text,
-            message.irc_tags,
-        )
+        level = self.__irc_log.level(message.irc_command)
+
+        if level:
+            self.__irc_log.log_received(
+                level,
+                message,
+                "%s > [%s]: %s | %s",
+                message.irc_command,
+                message.channel,
+                message.text,
+                message.irc_tags,
+            )
+
+        # Sent instead of the JOIN of a channel that doesn't exist or is suspended
+        if (
+            message.channel is not None
+            and message.irc_tags is not None
+            and message.irc_tags.get("msg-id") == "msg_channel_suspended"
+            and self.__join_scheduler.fail(message.channel)
+        ):
+            logger.warning("Could not join %s: %s", message.channel, message.text)
+
+            self.__give_up_join(message.channel, time.monotonic())
+
+    def __handle_join(self, message: Message) -> None:
+        level = self.__irc_log.level(message.irc_command)
+
+        if level:
+            self.__irc_log.log_received(
+                level,
+                message,
+                "%s > [%s] %s",
+                message.irc_command,
+                message.channel,
+                message.user,
+            )
+
+        if message.channel is None or message.user is None:
+            return
+
+        if message.user != self.username:
+            if self.__presence.join(message.channel, message.user):
+                self.__execute_methods_after_chatter_join(message.channel, message.user)
+                self.__remove_methods_after_chatter_join()
+
+            return
+
+        now = time.monotonic()
+        latency = self.__join_scheduler.confirm(message.channel, now)
+
+        self.__recover_channel(message.channel, now)
+
+        if latency is not None and self.__join_scheduler.pending == 0:
+            progress = self.__join_scheduler.progress()
+
+            logger.info(
+                "All %s requested channels joined (average latency %.2fs, max %.2fs)",
+                progress.requested,
+                progress.average_latency,
+                progress.max_latency,
+            )
 
     def __handle_part(self, message: Message) -> None:
-        logger.info("%s > [%s] %s", message.irc_command, message.channel, message.user)
+        level = self.__irc_log.level(message.irc_command)
+
+        if level:
+            self.__irc_log.log_received(
+                level,
+                message,
+                "%s > [%s] %s",
+                message.irc_command,
+                message.channel,
+                message.user,
+            )
+
+        if (
+            message.channel is not None
+            and message.user is not None
+            and message.user != self.username
+            and self.__presence.leave(message.channel, message.user)
+        ):
+            self.__execute_methods_after_chatter_leave(message.channel, message.user)
+            self.__remove_methods_after_chatter_leave()
 
         self.__execute_methods_after_leave_channel(
             message.channel if message.channel is not None else ""
         )
         self.__remove_methods_after_leave_channel()
 
-    def __handle_ping(self, message: Message) -> None:
-        logger.info("%s > :%s", message.irc_command, message.text)
+    def __handle_names(self, message: Message) -> None:
+        level = self.__irc_log.level(message.irc_command)
+
+        if level:
+            self.__irc_log.log_received(
+                level,
+                message,
+                "%s > [%s] %s",
+                message.irc_command,
+                message.channel,
+                message.text,
+            )
+
+        if message.channel is not None and message.text is not None:
+            self.__presence.add_names(
+                message.channel,
+                [user for user in message.text.split() if user != self.username],
+            )
+
+    def __handle_end_of_names(self, message: Message) -> None:
+        if message.channel is None:
+            return
+
+        joined, left = self.__presence.end_names(message.channel)
+
+        for user in joined:
+            self.__execute_methods_after_chatter_join(message.channel, user)
+
+        self.__remove_methods_after_chatter_join()
+
+        for user in left:
+            self.__execute_methods_after_chatter_leave(message.channel, user)
+
+        self.__remove_methods_after_chatter_leave()
+
+    def __handle_ping(self, connection: Connection, message: Message) -> None:
+        level = self.__irc_log.level(message.irc_command)
+
+        if level:
+            self.__irc_log.log_received(
+                level,
+                message,
+                "%s > :%s",
+                message.irc_command,
+                message.text,
+            )
+
+        self.__send_pong(message.text if message.text is not None else "", connection)
+
+    def __handle_pong(self, connection: Connection, message: Message) -> None:
+        level = self.__irc_log.level(message.irc_command)
+
+        if level:
+            self.__irc_log.log_received(
+                level,
+                message,
+                "%s > :%s",
+                message.irc_command,
+                message.text,
+            )
 
-        self.__send_pong(message.text if message.text is not None else "")
+        self.__keepalive.pong(connection, message.text, time.monotonic())
 
     def __handle_privmsg(self, message: Message) -> None:
-        logger.info(
-            "%s > [%s] %s: %s | %s",
-            message.irc_command,
-            message.channel,
-            message.user,
-            message.text,
-            message.irc_tags,
-        )
+        level = self.__irc_log.level(message.irc_command)
+
+        if level:
+            self.__irc_log.log_received(
+                level,
+                message,
+                "%s > [%s] %s: %s | %s",
+                message.irc_command,
+                message.channel,
+                message.user,
+                message.text,
+                message.irc_tags,
+            )
+
+        if self.__history is not None and message.channel is not None:
+            self.__history.add(
+                HistoryEntry(
+                    (
+                        message.irc_tags.get("id")
+                        if message.irc_tags is not None
+                        else None
+                    ),
+                    message.channel,
+                    self.__get_user_id(message),
+                    message.user,
+                    message.text if message.text is not None else "",
+                    self.__get_sent_time(message),
+                )
+            )
+
+        if self.__match_blocked_terms(message):
+            return
+
+        self.__track_chat_rate(message, self.__detect_spam(message))
+        self.__index_roles(message)
+        self.__screen_automod(message)
+
+        if message.emotes is not None and message.channel is not None:
+            self.__emote_usage.add(
+                message.channel, message.emotes, message.text, time.monotonic()
+            )
 
         self.__execute_listeners(message)
         self.__remove_listeners()
 
-        if message.text_command in self.custom_commands:
+        route = (
+            self.__command_router.resolve(message.text, self.__get_command_prefixes())
+            if message.text is not None
+            else None
+        )
+
+        if route is not None and route[0] in self.custom_commands:
+            if not self.__has_command_permission(route[0], message):
+                logger.info(
+                    "%s can't invoke command %s in %s",
+                    message.user,
+                    route[0],
+                    message.channel,
+                )
+
+                return
+
+            if not self.__cooldowns.acquire(
+                route[0],
+                message.channel if message.channel is not None else "",
+                self.__get_user_id(message),
+                time.monotonic(),
+            ):
+                logger.info(
+                    "Command %s is on cooldown for %s in %s",
+                    route[0],
+                    message.user,
+                    message.channel,
+                )
+
+                return
+
+            message.text_command, message.text_args = route
+
             self.__execute_methods_before_commands(message)
             self.__remove_methods_before_commands()
             self.__execute_command(message)
@@ -548,100 +3132,245 @@ class Bot:
             self.__remove_methods_after_commands()
 
     def __handle_clearchat(self, message: Message) -> None:
-        logger.info(
-            "%s > [%s] %s | %s",
-            message.irc_command,
-            message.channel,
-            message.text if message.text is None else "",
-            message.irc_tags,
-        )
+        level = self.__irc_log.level(message.irc_command)
+
+        if level:
+            self.__irc_log.log_received(
+                level,
+                message,
+                "%s > [%s] %s | %s",
+                message.irc_command,
+                message.channel,
+                message.text if message.text is None else "",
+                message.irc_tags,
+            )
+
+        # Without a user, the whole chat was cleared
+        if message.channel is not None and message.text is None:
+            self.__chat_state.clear(message.channel, self.__get_sent_time(message))
+
+        if (
+            message.channel is not None
+            and message.irc_tags is not None
+            and "target-user-id" in message.irc_tags
+        ):
+            duration = message.irc_tags.get("ban-duration")
+
+            self.__moderation_index.ban(
+                message.channel,
+                message.irc_tags["target-user-id"],
+                time.time() + int(duration) if duration else None,
+            )
+
+        if self.__history is not None and message.channel is not None:
+            self.__history.delete_user_messages(
+                message.channel,
+                (
+                    message.irc_tags.get("target-user-id", message.text)
+                    if message.irc_tags is not None
+                    else message.text
+                ),
+            )
 
         self.__execute_methods_after_clearchat(message)
         self.__remove_methods_after_clearchat()
 
+    def __get_user_id(self, message: Message) -> str:
+        if message.irc_tags is not None and message.irc_tags.get("user-id"):
+            return message.irc_tags["user-id"]
+
+        return message.user if message.user is not None else ""
+
+    def __get_sent_time(self, message: Message) -> datetime:
+        if message.irc_tags is not None and message.irc_tags.get("tmi-sent-ts"):
+            return datetime.fromtimestamp(int(message.irc_tags["tmi-sent-ts"]) / 1000)
+
+        return datetime.now()
+
     def __handle_clearmsg(self, message: Message) -> None:
-        logger.info(
-            "%s > [%s]: %s | %s",
-            message.irc_command,
-            message.channel,
-            message.text,
-            message.irc_tags,
-        )
+        level = self.__irc_log.level(message.irc_command)
+
+        if level:
+            self.__irc_log.log_received(
+                level,
+                message,
+                "%s > [%s]: %s | %s",
+                message.irc_command,
+                message.channel,
+                message.text,
+                message.irc_tags,
+            )
+
+        if (
+            self.__history is not None
+            and message.irc_tags is not None
+            and "target-msg-id" in message.irc_tags
+        ):
+            self.__history.delete_message(message.irc_tags["target-msg-id"])
 
         self.__execute_methods_after_delete_message(message)
         self.__remove_methods_after_delete_message()
 
     def __handle_globaluserstate(self, message: Message) -> None:
-        logger.info("%s > | %s", message.irc_command, message.irc_tags)
+        level = self.__irc_log.level(message.irc_command)
+
+        if level:
+            self.__irc_log.log_received(
+                level,
+                message,
+                "%s > | %s",
+                message.irc_command,
+                message.irc_tags,
+            )
+
+        if message.irc_tags is not None and message.irc_tags.get("user-id"):
+            self.__user_id = message.irc_tags["user-id"]
 
         self.__execute_methods_after_bot_connected(message)
         self.__remove_methods_after_bot_connected()
 
     def __handle_hosttarget(self, message: Message) -> None:
-        logger.info("%s > [%s]: %s", message.irc_command, message.channel, message.text)
+        level = self.__irc_log.level(message.irc_command)
+
+        if level:
+            self.__irc_log.log_received(
+                level,
+                message,
+                "%s > [%s]: %s",
+                message.irc_command,
+                message.channel,
+                message.text,
+            )
 
         self.__execute_methods_after_toggle_host(message)
         self.__remove_methods_after_toggle_host()
 
-    def __handle_reconnect(self, message: Message) -> None:
-        logger.info("%s >", message.irc_command)
+    def __handle_reconnect(self, connection: Connection, message: Message) -> None:
+        level = self.__irc_log.level(message.irc_command)
+
+        if level:
+            self.__irc_log.log_received(level, message, "%s >", message.irc_command)
 
         self.__execute_methods_after_server_reconnect(message)
         self.__remove_methods_after_server_reconnect()
 
+        # The server is about to close the connection
+        if connection.alive:
+            self.__handle_connection_lost(connection)
+
     def __handle_roomstate(self, message: Message) -> None:
-        logger.info(
-            "%s > [%s] | %s", message.irc_command, message.channel, message.irc_tags
-        )
+        level = self.__irc_log.level(message.irc_command)
+
+        if level:
+            self.__irc_log.log_received(
+                level,
+                message,
+                "%s > [%s] | %s",
+                message.irc_command,
+                message.channel,
+                message.irc_tags,
+            )
+
+        if message.channel is not None and message.irc_tags is not None:
+            self.__chat_state.update_room(message.channel, message.irc_tags)
+
+            if "slow" in message.irc_tags:
+                with self.__outbound_lock:
+                    self.__outbound.set_slow_mode(
+                        message.channel, int(message.irc_tags["slow"] or 0)
+                    )
 
         self.__execute_methods_after_channel_change(message)
         self.__remove_methods_after_channel_change()
 
     def __handle_usernotice(self, message: Message) -> None:
-        logger.info(
-            "%s > [%s]: %s | %s",
-            message.irc_command,
-            message.channel,
-            message.text if message.text is not None else "",
-            message.irc_tags,
-        )
+        level = self.__irc_log.level(message.irc_command)
+
+        if level:
+            self.__irc_log.log_received(
+                level,
+                message,
+                "%s > [%s]: %s | %s",
+                message.irc_command,
+                message.channel,
+                message.text if message.text is not None else "",
+                message.irc_tags,
+            )
 
         self.__execute_methods_after_event(message)
         self.__remove_methods_after_event()
 
     def __handle_userstate(self, message: Message) -> None:
-        logger.info(
-            "%s > [%s] | %s", message.irc_command, message.channel, message.irc_tags
-        )
+        level = self.__irc_log.level(message.irc_command)
+
+        if level:
+            self.__irc_log.log_received(
+                level,
+                message,
+                "%s > [%s] | %s",
+                message.irc_command,
+                message.channel,
+                message.irc_tags,
+            )
+
+        if message.channel is not None and message.irc_tags is not None:
+            is_moderator = bool(message.roles & (Role.MODERATOR | Role.BROADCASTER))
+            self.__chat_state.update_user(message.channel, message.roles)
+
+            with self.__outbound_lock:
+                self.__outbound.set_moderator(message.channel, is_moderator)
 
         self.__execute_methods_after_user_join(message)
         self.__remove_methods_after_user_join()
 
     def __handle_whisper(self, message: Message) -> None:
-        logger.info(
-            "%s > %s: %s",
-            message.irc_command,
-            message.irc_args[0] if message.irc_args is not None else "",
-            message.text,
-        )
+        level = self.__irc_log.level(message.irc_command)
+
+        if level:
+            self.__irc_log.log_received(
+                level,
+                message,
+                "%s > %s: %s",
+                message.irc_command,
+                message.irc_args[0] if message.irc_args is not None else "",
+                message.text,
+            )
 
         self.__execute_methods_after_whisper(message)
         self.__remove_methods_after_whisper()
 
-    def __handle_message(self, received_msg: str) -> None:
+    def __handle_message(self, connection: Connection, received_msg: str) -> None:
         if len(received_msg) == 0:
             return
 
+        started_at = time.perf_counter()
         message = self.__parse_message(received_msg)
 
+        self.__observe_latency(message)
+
+        self.__execute_handlers(message)
+        self.__remove_handlers()
+
         if message.irc_command == "NOTICE":
             self.__handle_notice(message)
 
+        elif message.irc_command == "JOIN":
+            self.__handle_join(message)
+
         elif message.irc_command == "PART":
             self.__handle_part(message)
 
+        elif message.irc_command == "353":
+            self.__handle_names(message)
+
+        elif message.irc_command == "366":
+            self.__handle_end_of_names(message)
+
         elif message.irc_command == "PING":
-            self.__handle_ping(message)
+            self.__handle_ping(connection, message)
+
+        elif message.irc_command == "PONG":
+            self.__handle_pong(connection, message)
 
         elif message.irc_command == "PRIVMSG":
             self.__handle_privmsg(message)
@@ -655,44 +3384,288 @@ class Bot:
         elif message.irc_command == "GLOBALUSERSTATE":
             self.__handle_globaluserstate(message)
 
-        elif message.irc_command == "HOSTTARGET":
-            self.__handle_hosttarget(message)
+        elif message.irc_command == "HOSTTARGET":
+            self.__handle_hosttarget(message)
+
+        elif message.irc_command == "RECONNECT":
+            self.__handle_reconnect(connection, message)
+
+        elif message.irc_command == "ROOMSTATE":
+            self.__handle_roomstate(message)
+
+        elif message.irc_command == "USERNOTICE":
+            self.__handle_usernotice(message)
+
+        elif message.irc_command == "USERSTATE":
+            self.__handle_userstate(message)
+
+        elif message.irc_command == "WHISPER":
+            self.__handle_whisper(message)
+
+        else:
+            level = self.__irc_log.level(message.irc_command)
+
+            if level:
+                self.__irc_log.log_received(
+                    level,
+                    message,
+                    "%s > [%s] %s: %s",
+                    message.irc_command,
+                    message.channel,
+                    message.user,
+                    message.text,
+                )
+
+        self.__count_message(message, time.perf_counter() - started_at)
+
+    def __observe_latency(self, message: Message) -> None:
+        if message.irc_tags is None:
+            return
+
+        sent_at = message.irc_tags.get("tmi-sent-ts")
+
+        # The clocks of Twitch and the bot can differ slightly
+        if sent_at:
+            self.__chat_latency.observe(max(0.0, time.time() - int(sent_at) / 1000))
+
+    def __count_message(self, message: Message, elapsed: float) -> None:
+        command = message.irc_command if message.irc_command is not None else ""
+
+        self.__received_messages.labels(command).inc()
+        self.__handling_time.labels(command).observe(elapsed)
+
+        if command == "PRIVMSG" and message.channel is not None:
+            self.__chat_messages.labels(message.channel).inc()
+
+    def __loop(self) -> None:
+        while not self.__finish:
+            if len(self.connections) == 0:
+                self.__open_connection()
+
+            self.__execute_checks()
+            self.__remove_checks()
+            self.__check_keepalive()
+            self.__check_shield_mode()
+            self.__flush_automod()
+            self.__refresh_moderation_indexes()
+            self.__apply_blocked_term_updates()
+            self.__flush_blocked_term_matches()
+            self.__expire_joins()
+            self.__flush_joins()
+            self.__flush_outbound()
+
+            now = time.monotonic()
+            timeout = _DEFAULT_TIMEOUT
+            join_delay = self.__join_scheduler.delay(now)
+            outbound_delay = None
+            reconnect_delay = (
+                max(0, self.__reconnect_at - now)
+                if self.__reconnect_at is not None
+                else None
+            )
+
+            # Joins and messages that need a new connection wait for the reconnection
+            if (
+                join_delay is not None
+                and reconnect_delay is not None
+                and not self.__has_capacity()
+            ):
+                join_delay = max(join_delay, reconnect_delay)
+
+            if len(self.connections) > 0:
+                with self.__outbound_lock:
+                    outbound_delay = self.__outbound.delay(now)
+
+            # A connection lost while sending is reopened right away, unless the reconnection is delayed
+            else:
+                join_delay = reconnect_delay if reconnect_delay is not None else 0
+
+            with self.__scheduler_lock:
+                check_delay = self.__scheduler.delay(now)
+
+            keepalive_delay = self.__keepalive.delay(now)
+            shield_mode_delay = self.__shield_mode_trigger.delay(now)
+
+            with self.__automod_lock:
+                automod_delay = self.__automod_batcher.delay(now)
+
+            moderation_index_delay = self.__moderation_index.delay(now)
+
+            for delay in (
+                join_delay,
+                outbound_delay,
+                check_delay,
+                keepalive_delay,
+                shield_mode_delay,
+                automod_delay,
+                moderation_index_delay,
+            ):
+                if delay is not None:
+                    timeout = min(timeout, delay)
+
+            events = self.__selector.select(timeout)
+
+            for key, _ in events:
+                connection = key.data
+
+                if connection is None:
+                    self.__drain_wakeups()
+                    continue
+
+                if not connection.alive:
+                    continue
+
+                try:
+                    received_msgs = connection.receive()
+
+                except OSError:
+                    self.__handle_connection_lost(connection)
+                    continue
+
+                for received_msg in received_msgs:
+                    self.__handle_message(connection, received_msg)
+
+    def __drain_wakeups(self) -> None:
+        try:
+            while self.__wakeup_reader.recv(4096):
+                pass
+
+        except (BlockingIOError, OSError):
+            pass
+
+    def __get_target_id(self, user: str) -> str:
+        login = user.replace("@", "").lower()
+        users = self.client.get_users(login=[login])
+
+        if len(users) == 0:
+            raise ValueError(f"User not found: {login}")
+
+        return str(users[0].user_id)
+
+    def __moderate(
+        self, action: str, channel: str, apply: Callable[[str, str], object]
+    ) -> Future:
+        channel = channel.replace("#", "").lower()
+        future = self.__moderation_executor.submit(
+            self.__apply_moderation, channel, apply
+        )
+        future.add_done_callback(
+            lambda done: self.__log_moderation_error(action, channel, done)
+        )
+
+        return future
+
+    def __apply_moderation(
+        self, channel: str, apply: Callable[[str, str], object]
+    ) -> object:
+        broadcaster_id = self.__get_broadcaster_id(channel)
+        moderator_id = self.__get_moderator_id()
+
+        self.__helix_limiter.acquire()
+
+        return apply(broadcaster_id, moderator_id)
+
+    def __log_moderation_error(self, action: str, channel: str, future: Future) -> None:
+        if future.exception() is not None:
+            logger.warning(
+                "Could not apply %s in %s: %s", action, channel, future.exception()
+            )
+
+    def __moderate_many(
+        self,
+        action: str,
+        channel: str,
+        targets: list[str],
+        apply: Callable[[str, str, str], None],
+        on_progress: Callable[[BulkProgress], None] | None,
+    ) -> Future:
+        channel = channel.replace("#", "").lower()
+        result = Future()
+
+        self.__bulk_executor.submit(
+            self.__start_bulk, result, action, channel, targets, apply, on_progress
+        )
+
+        return result
+
+    def __start_bulk(
+        self,
+        result: Future,
+        action: str,
+        channel: str,
+        targets: list[str],
+        apply: Callable[[str, str, str], None],
+        on_progress: Callable[[BulkProgress], None] | None,
+    ) -> None:
+        try:
+            broadcaster_id = self.__get_broadcaster_id(channel)
+            moderator_id = self.__get_moderator_id()
 
-        elif message.irc_command == "RECONNECT":
-            self.__handle_reconnect(message)
+        except Exception as error:
+            logger.warning("Could not apply %s in %s: %s", action, channel, error)
+            result.set_exception(error)
 
-        elif message.irc_command == "ROOMSTATE":
-            self.__handle_roomstate(message)
+            return
 
-        elif message.irc_command == "USERNOTICE":
-            self.__handle_usernotice(message)
+        operation = BulkOperation(
+            action,
+            channel,
+            targets,
+            lambda target: apply(broadcaster_id, moderator_id, target),
+            self.__helix_limiter,
+            on_progress,
+        )
+        operation.start(self.__bulk_executor).add_done_callback(
+            lambda done: result.set_result(done.result())
+        )
 
-        elif message.irc_command == "USERSTATE":
-            self.__handle_userstate(message)
+    def __ban_user(
+        self,
+        channel: str,
+        broadcaster_id: str,
+        moderator_id: str,
+        user_id: str,
+        reason: str,
+        duration: int | None,
+    ) -> None:
+        self.client.ban_user(broadcaster_id, moderator_id, reason, user_id, duration)
+        self.__moderation_index.ban(
+            channel.replace("#", "").lower(),
+            user_id,
+            time.time() + duration if duration is not None else None,
+        )
 
-        elif message.irc_command == "WHISPER":
-            self.__handle_whisper(message)
+    def __unban_user(
+        self, channel: str, broadcaster_id: str, moderator_id: str, user_id: str
+    ) -> None:
+        self.client.unban_user(broadcaster_id, moderator_id, user_id)
+        self.__moderation_index.unban(channel.replace("#", "").lower(), user_id)
+
+    def __set_moderator(
+        self, channel: str, broadcaster_id: str, user_id: str, is_moderator: bool
+    ) -> None:
+        if is_moderator:
+            self.client.add_channel_moderator(broadcaster_id, user_id)
 
         else:
-            logger.info(
-                "%s > [%s] %s: %s",
-                message.irc_command,
-                message.channel,
-                message.user,
-                message.text,
-            )
+            self.client.remove_channel_moderator(broadcaster_id, user_id)
 
-    def __loop(self) -> None:
-        while not self.__finish:
-            try:
-                received_msgs = self.irc.recv(2048).decode()
+        self.__moderation_index.set_moderator(
+            channel.replace("#", "").lower(), user_id, is_moderator
+        )
+
+    def __set_vip(
+        self, channel: str, broadcaster_id: str, user_id: str, is_vip: bool
+    ) -> None:
+        if is_vip:
+            self.client.add_channel_vip(user_id, broadcaster_id)
 
-                for received_msg in received_msgs.split("\r\n"):
-                    self.__handle_message(received_msg)
+        else:
+            self.client.remove_channel_vip(user_id, broadcaster_id)
 
-            except socket.timeout:
-                self.__execute_checks()
-                self.__remove_checks()
+        self.__moderation_index.set_vip(
+            channel.replace("#", "").lower(), user_id, is_vip
+        )
 
     def send(self, channel: str, text: str) -> None:
         """
@@ -717,38 +3690,68 @@ class Bot:
 
         self.__send_privmsg(channel, text, message_id)
 
-    def ban(self, channel: str, user: str, reason: str = "") -> None:
+    def ban(self, channel: str, user: str, reason: str = "") -> Future:
         """
         Bans a user
+        The bot must be a moderator of the channel
 
         Args:
             channel (str): Channel who bans
-            username (str): User to ban
+            user (str): User to ban
             reason (str): Reason of the ban
+                Default: ""
+
+        Returns:
+            Future: Future of the request, whose exception is the error if it failed
         """
 
-        self.send(channel, f"/ban @{user} {reason}")
+        return self.__moderate(
+            "ban",
+            channel,
+            lambda broadcaster_id, moderator_id: self.__ban_user(
+                channel,
+                broadcaster_id,
+                moderator_id,
+                self.__get_target_id(user),
+                reason,
+                None,
+            ),
+        )
 
-    def unban(self, channel: str, user: str) -> None:
+    def unban(self, channel: str, user: str) -> Future:
         """
         Undoes the ban of a user
+        The bot must be a moderator of the channel
 
         Args:
             channel (str): Name of the channel who readmits
             user (str): Name of the user to readmit
+
+        Returns:
+            Future: Future of the request, whose exception is the error if it failed
         """
 
-        self.send(channel, f"/unban @{user}")
+        return self.__moderate(
+            "unban",
+            channel,
+            lambda broadcaster_id, moderator_id: self.__unban_user(
+                channel, broadcaster_id, moderator_id, self.__get_target_id(user)
+            ),
+        )
 
-    def clear(self, channel: str) -> None:
+    def clear(self, channel: str) -> Future:
         """
         Clears the chat
+        The bot must be a moderator of the channel
 
         Args:
             channel (str): Channel to clean the chat
+
+        Returns:
+            Future: Future of the request, whose exception is the error if it failed
         """
 
-        self.send(channel, "/clear")
+        return self.__moderate("clear", channel, self.client.delete_chat_messages)
 
     def color(self, channel: str, color: str) -> None:
         """
@@ -772,16 +3775,26 @@ class Bot:
 
         self.send(channel, f"/commercial {duration}")
 
-    def delete(self, channel: str, message_id: str) -> None:
+    def delete(self, channel: str, message_id: str) -> Future:
         """
         Deletes the specified message from the chat room
+        The bot must be a moderator of the channel
 
         Args:
             channel (str): Channel where the message was sent
             message_id (str): ID of the message
+
+        Returns:
+            Future: Future of the request, whose exception is the error if it failed
         """
 
-        self.send(channel, f"/delete {message_id}")
+        return self.__moderate(
+            "delete",
+            channel,
+            lambda broadcaster_id, moderator_id: self.client.delete_chat_messages(
+                broadcaster_id, moderator_id, message_id
+            ),
+        )
 
     def disconnect(self, channel: str) -> None:
         """
@@ -793,45 +3806,85 @@ class Bot:
 
         self.send(channel, "/disconnect")
 
-    def emoteonly(self, channel: str) -> None:
+    def emoteonly(self, channel: str) -> Future:
         """
         Activates the "emotes only" mode
+        The bot must be a moderator of the channel
 
         Args:
             channel (str): Channel on which activate the mode
+
+        Returns:
+            Future: Future of the request, whose exception is the error if it failed
         """
 
-        self.send(channel, "/emoteonly")
+        return self.__moderate(
+            "emoteonly",
+            channel,
+            lambda broadcaster_id, moderator_id: self.client.update_chat_settings(
+                broadcaster_id, moderator_id, emote_mode=True
+            ),
+        )
 
-    def emoteonlyoff(self, channel: str) -> None:
+    def emoteonlyoff(self, channel: str) -> Future:
         """
         Disables "emotes only" mode
+        The bot must be a moderator of the channel
 
         Args:
             channel (str): Channel on which disable the mode
+
+        Returns:
+            Future: Future of the request, whose exception is the error if it failed
         """
 
-        self.send(channel, "/emoteonlyoff")
+        return self.__moderate(
+            "emoteonlyoff",
+            channel,
+            lambda broadcaster_id, moderator_id: self.client.update_chat_settings(
+                broadcaster_id, moderator_id, emote_mode=False
+            ),
+        )
 
-    def followers(self, channel: str) -> None:
+    def followers(self, channel: str) -> Future:
         """
         Activates the "followers only" mode
+        The bot must be a moderator of the channel
 
         Args:
             channel (str): Channel on which activate the mode
+
+        Returns:
+            Future: Future of the request, whose exception is the error if it failed
         """
 
-        self.send(channel, "/followers")
+        return self.__moderate(
+            "followers",
+            channel,
+            lambda broadcaster_id, moderator_id: self.client.update_chat_settings(
+                broadcaster_id, moderator_id, follower_mode=True
+            ),
+        )
 
-    def followersoff(self, channel: str) -> None:
+    def followersoff(self, channel: str) -> Future:
         """
         Disables the "followers only" mode
+        The bot must be a moderator of the channel
 
         Args:
             channel (str): Channel on which disable the mode
+
+        Returns:
+            Future: Future of the request, whose exception is the error if it failed
         """
 
-        self.send(channel, "/followersoff")
+        return self.__moderate(
+            "followersoff",
+            channel,
+            lambda broadcaster_id, moderator_id: self.client.update_chat_settings(
+                broadcaster_id, moderator_id, follower_mode=False
+            ),
+        )
 
     def help(self, channel: str, command: str = "") -> None:
         """
@@ -887,27 +3940,47 @@ class Bot:
 
         self.send(channel, f"/me {text}")
 
-    def mod(self, channel: str, username: str) -> None:
+    def mod(self, channel: str, username: str) -> Future:
         """
         Makes a user mod
+        The bot's user token must belong to the channel's broadcaster
 
         Args:
             channel (str): Channel who promotes the user
             username (str): Name of the user to be promoted
+
+        Returns:
+            Future: Future of the request, whose exception is the error if it failed
         """
 
-        self.send(channel, f"/mod {username}")
+        return self.__moderate(
+            "mod",
+            channel,
+            lambda broadcaster_id, _: self.__set_moderator(
+                channel, broadcaster_id, self.__get_target_id(username), True
+            ),
+        )
 
-    def unmod(self, channel: str, username: str) -> None:
+    def unmod(self, channel: str, username: str) -> Future:
         """
         Removes the moderator's rank from a user
+        The bot's user token must belong to the channel's broadcaster
 
         Args:
             channel (str): Channel who removes the moderator's rank
             username (str): User's name
+
+        Returns:
+            Future: Future of the request, whose exception is the error if it failed
         """
 
-        self.send(channel, f"/unmod {username}")
+        return self.__moderate(
+            "unmod",
+            channel,
+            lambda broadcaster_id, _: self.__set_moderator(
+                channel, broadcaster_id, self.__get_target_id(username), False
+            ),
+        )
 
     def mods(self, channel: str) -> None:
         """
@@ -940,111 +4013,220 @@ class Bot:
 
         self.send(channel, "/unraid")
 
-    def slow(self, channel: str, duration: int) -> None:
+    def slow(self, channel: str, duration: int) -> Future:
         """
         Activates the "slow" mode
+        The bot must be a moderator of the channel
 
         Args:
             channel (str): Channel on which activate the mode
             duration (int): Time between messages
+
+        Returns:
+            Future: Future of the request, whose exception is the error if it failed
         """
 
-        self.send(channel, f"/slow {duration}")
+        return self.__moderate(
+            "slow",
+            channel,
+            lambda broadcaster_id, moderator_id: self.client.update_chat_settings(
+                broadcaster_id,
+                moderator_id,
+                slow_mode=True,
+                slow_mode_wait_time=duration,
+            ),
+        )
 
-    def slowoff(self, channel: str) -> None:
+    def slowoff(self, channel: str) -> Future:
         """
         Disables the "slow" mode
+        The bot must be a moderator of the channel
 
         Args:
             channel (str): Channel on which disable the mode
+
+        Returns:
+            Future: Future of the request, whose exception is the error if it failed
         """
 
-        self.send(channel, "/slowoff")
+        return self.__moderate(
+            "slowoff",
+            channel,
+            lambda broadcaster_id, moderator_id: self.client.update_chat_settings(
+                broadcaster_id, moderator_id, slow_mode=False
+            ),
+        )
 
-    def subscribers(self, channel: str) -> None:
+    def subscribers(self, channel: str) -> Future:
         """
         Activates the "subscribers only" mode
+        The bot must be a moderator of the channel
 
         Args:
             channel (str): Channel on which activate the mode
+
+        Returns:
+            Future: Future of the request, whose exception is the error if it failed
         """
 
-        self.send(channel, "/subscribers")
+        return self.__moderate(
+            "subscribers",
+            channel,
+            lambda broadcaster_id, moderator_id: self.client.update_chat_settings(
+                broadcaster_id, moderator_id, subscriber_mode=True
+            ),
+        )
 
-    def subscribersoff(self, channel: str) -> None:
+    def subscribersoff(self, channel: str) -> Future:
         """
         Disables "subscriber only" mode
+        The bot must be a moderator of the channel
 
         Args:
             channel (str): Channel on which disable the mode
+
+        Returns:
+            Future: Future of the request, whose exception is the error if it failed
         """
 
-        self.send(channel, "/subscribersoff")
+        return self.__moderate(
+            "subscribersoff",
+            channel,
+            lambda broadcaster_id, moderator_id: self.client.update_chat_settings(
+                broadcaster_id, moderator_id, subscriber_mode=False
+            ),
+        )
 
-    def timeout(self, channel: str, user: str, duration: int = 600) -> None:
+    def timeout(self, channel: str, user: str, duration: int = 600) -> Future:
         """
         Expels a user temporarily
+        The bot must be a moderator of the channel
 
         Args:
             channel (str): Channel who ejects
             user (str): Name of the user to expel
-            duration (int): Ejecting time
+            duration (int): Ejecting time, in seconds
+                Default: 600
+
+        Returns:
+            Future: Future of the request, whose exception is the error if it failed
         """
 
-        self.send(channel, f"/timeout @{user} {duration}")
+        return self.__moderate(
+            "timeout",
+            channel,
+            lambda broadcaster_id, moderator_id: self.__ban_user(
+                channel,
+                broadcaster_id,
+                moderator_id,
+                self.__get_target_id(user),
+                "",
+                duration,
+            ),
+        )
 
-    def untimeout(self, channel: str, username: str) -> None:
+    def untimeout(self, channel: str, username: str) -> Future:
         """
         Cancels the timeout of a user
+        The bot must be a moderator of the channel
 
         Args:
             channel (str): Channel who ejected the user
             username (str): User to readmit
+
+        Returns:
+            Future: Future of the request, whose exception is the error if it failed
         """
 
-        self.send(channel, f"/untimeout @{username}")
+        return self.__moderate(
+            "untimeout",
+            channel,
+            lambda broadcaster_id, moderator_id: self.__unban_user(
+                channel, broadcaster_id, moderator_id, self.__get_target_id(username)
+            ),
+        )
 
-    def uniquechat(self, channel: str) -> None:
+    def uniquechat(self, channel: str) -> Future:
         """
         Activates the "unique" mode
+        The bot must be a moderator of the channel
 
         Args:
             channel (str): Channel on which activate the mode
+
+        Returns:
+            Future: Future of the request, whose exception is the error if it failed
         """
 
-        self.send(channel, "/uniquechat")
+        return self.__moderate(
+            "uniquechat",
+            channel,
+            lambda broadcaster_id, moderator_id: self.client.update_chat_settings(
+                broadcaster_id, moderator_id, unique_chat_mode=True
+            ),
+        )
 
-    def uniquechatoff(self, channel: str) -> None:
+    def uniquechatoff(self, channel: str) -> Future:
         """
         Disables the "unique" mode
+        The bot must be a moderator of the channel
 
         Args:
             channel (str): Channel on which disable the mode
+
+        Returns:
+            Future: Future of the request, whose exception is the error if it failed
         """
 
-        self.send(channel, "/uniquechatoff")
+        return self.__moderate(
+            "uniquechatoff",
+            channel,
+            lambda broadcaster_id, moderator_id: self.client.update_chat_settings(
+                broadcaster_id, moderator_id, unique_chat_mode=False
+            ),
+        )
 
-    def vip(self, channel: str, username: str) -> None:
+    def vip(self, channel: str, username: str) -> Future:
         """
         Makes a user vip
+        The bot's user token must belong to the channel's broadcaster
 
         Args:
             channel (str): Channel who makes a user vip
             username (str): User's name
+
+        Returns:
+            Future: Future of the request, whose exception is the error if it failed
         """
 
-        self.send(channel, f"/vip {username}")
+        return self.__moderate(
+            "vip",
+            channel,
+            lambda broadcaster_id, _: self.__set_vip(
+                channel, broadcaster_id, self.__get_target_id(username), True
+            ),
+        )
 
-    def unvip(self, channel: str, username: str) -> None:
+    def unvip(self, channel: str, username: str) -> Future:
         """
         Removes the vip range from a user
+        The bot's user token must belong to the channel's broadcaster
 
         Args:
             channel (str): Channel who remove's the vip range
             username (str): User's name
+
+        Returns:
+            Future: Future of the request, whose exception is the error if it failed
         """
 
-        self.send(channel, f"/unvip {username}")
+        return self.__moderate(
+            "unvip",
+            channel,
+            lambda broadcaster_id, _: self.__set_vip(
+                channel, broadcaster_id, self.__get_target_id(username), False
+            ),
+        )
 
     def vips(self, channel: str) -> None:
         """
@@ -1056,6 +4238,137 @@ class Bot:
 
         self.send(channel, "/vips")
 
+    def ban_users(
+        self,
+        channel: str,
+        user_ids: list[str],
+        reason: str = "",
+        on_progress: Callable[[BulkProgress], None] | None = None,
+    ) -> Future:
+        """
+        Bans many users concurrently, as fast as the Helix rate limit allows
+        The bot must be a moderator of the channel
+
+        Args:
+            channel (str): Channel who bans
+            user_ids (list[str]): IDs of the users to ban
+            reason (str): Reason of the bans
+                Default: ""
+            on_progress (Callable[[BulkProgress], None] | None): Method to be executed with the progress after each user
+                Default: None
+
+        Returns:
+            Future: Future whose result is the final BulkProgress
+        """
+
+        return self.__moderate_many(
+            "ban",
+            channel,
+            user_ids,
+            lambda broadcaster_id, moderator_id, user_id: self.__ban_user(
+                channel, broadcaster_id, moderator_id, user_id, reason, None
+            ),
+            on_progress,
+        )
+
+    def timeout_users(
+        self,
+        channel: str,
+        user_ids: list[str],
+        duration: int = 600,
+        reason: str = "",
+        on_progress: Callable[[BulkProgress], None] | None = None,
+    ) -> Future:
+        """
+        Expels many users temporarily and concurrently, as fast as the Helix rate limit allows
+        The bot must be a moderator of the channel
+
+        Args:
+            channel (str): Channel who ejects
+            user_ids (list[str]): IDs of the users to expel
+            duration (int): Ejecting time, in seconds
+                Default: 600
+            reason (str): Reason of the timeouts
+                Default: ""
+            on_progress (Callable[[BulkProgress], None] | None): Method to be executed with the progress after each user
+                Default: None
+
+        Returns:
+            Future: Future whose result is the final BulkProgress
+        """
+
+        return self.__moderate_many(
+            "timeout",
+            channel,
+            user_ids,
+            lambda broadcaster_id, moderator_id, user_id: self.__ban_user(
+                channel, broadcaster_id, moderator_id, user_id, reason, duration
+            ),
+            on_progress,
+        )
+
+    def unban_users(
+        self,
+        channel: str,
+        user_ids: list[str],
+        on_progress: Callable[[BulkProgress], None] | None = None,
+    ) -> Future:
+        """
+        Undoes the bans or timeouts of many users concurrently, as fast as the Helix rate limit allows
+        The bot must be a moderator of the channel
+
+        Args:
+            channel (str): Name of the channel who readmits
+            user_ids (list[str]): IDs of the users to readmit
+            on_progress (Callable[[BulkProgress], None] | None): Method to be executed with the progress after each user
+                Default: None
+
+        Returns:
+            Future: Future whose result is the final BulkProgress
+        """
+
+        return self.__moderate_many(
+            "unban",
+            channel,
+            user_ids,
+            lambda broadcaster_id, moderator_id, user_id: self.__unban_user(
+                channel, broadcaster_id, moderator_id, user_id
+            ),
+            on_progress,
+        )
+
+    def delete_messages(
+        self,
+        channel: str,
+        message_ids: list[str],
+        on_progress: Callable[[BulkProgress], None] | None = None,
+    ) -> Future:
+        """
+        Deletes many messages from the chat room concurrently, as fast as the Helix rate limit allows
+        The bot must be a moderator of the channel
+
+        Args:
+            channel (str): Channel where the messages were sent
+            message_ids (list[str]): IDs of the messages
+            on_progress (Callable[[BulkProgress], None] | None): Method to be executed with the progress after each message
+                Default: None
+
+        Returns:
+            Future: Future whose result is the final BulkProgress
+        """
+
+        return self.__moderate_many(
+            "delete",
+            channel,
+            message_ids,
+            lambda broadcaster_id, moderator_id, message_id: (
+                self.client.delete_chat_messages(
+                    broadcaster_id, moderator_id, message_id
+                )
+            ),
+            on_progress,
+        )
+
     def whisper(self, channel: str, user: str, text: str) -> None:
         """
         Whispers to a user
@@ -1160,18 +4473,48 @@ class Bot:
 
         self.methods_after_leave_channel_to_remove.append(name)
 
-    def add_check(self, name: str, check: Callable[[], None]) -> None:
+    def add_check(
+        self,
+        name: str,
+        check: Callable[[], None],
+        interval: float = _DEFAULT_CHECK_INTERVAL,
+        cron: str | None = None,
+    ) -> None:
         """
         Adds a check to the bot
-        Checks work permanently
+        Checks work permanently, running on their own schedule whatever the chat traffic
 
         Args:
             name (str): Check's name
             check (Callable[[], None]): Method that will act as a check
+            interval (float): Seconds between runs of the check
+                Default: 10
+            cron (str | None): Cron expression of the runs of the check, e.g. "*/5 * * * *"
+                If given, it is used instead of the interval
+
+        Raises:
+            ValueError: If the interval or the cron expression are not valid
         """
 
+        with self.__scheduler_lock:
+            self.__scheduler.add(name, time.monotonic(), interval, cron)
+
         self.custom_checks[name] = check
 
+        if self.__loop_thread != threading.get_ident():
+            self.__wake_up()
+
+    def get_check_stats(self) -> list[CheckStats]:
+        """
+        Gets how many times each check has run and how late its runs started
+
+        Returns:
+            list[CheckStats]
+        """
+
+        with self.__scheduler_lock:
+            return self.__scheduler.stats()
+
     def remove_check(self, name: str) -> None:
         """
         Removes a check from the bot
@@ -1182,7 +4525,15 @@ class Bot:
 
         self.checks_to_remove.append(name)
 
-    def add_listener(self, name: str, listener: Callable[[Message], None]) -> None:
+    def add_listener(
+        self,
+        name: str,
+        listener: Callable[[Message], None],
+        channels: list[str] | None = None,
+        users: list[str] | None = None,
+        badges: list[str] | None = None,
+        pattern: str | None = None,
+    ) -> None:
         """
         Adds a listener to the bot
         Listeners work only when a message is received
@@ -1191,8 +4542,19 @@ class Bot:
         Args:
             name (str): Listener's name
             listener (Callable[[Message], None]): Method that will be executed after every chat message
+            channels (list[str] | None): Channels whose messages the listener receives
+                Default: all of them
+            users (list[str] | None): Users whose messages the listener receives
+                Default: all of them
+            badges (list[str] | None): Badges, e.g. "moderator", of which the sender must have at least one
+                Default: no badge is needed
+            pattern (str | None): Regular expression that must be found in the messages the listener receives
+
+        Raises:
+            re.error: If the pattern is not a valid regular expression
         """
 
+        self.__listener_index.add(name, channels, users, badges, None, pattern)
         self.custom_listeners[name] = listener
 
     def remove_listener(self, name: str) -> None:
@@ -1205,15 +4567,102 @@ class Bot:
 
         self.listeners_to_remove.append(name)
 
-    def add_command(self, name: str, command: Callable[[Message], None]) -> None:
+    def add_handler(
+        self,
+        name: str,
+        handler: Callable[[Message], None],
+        message_types: list[str] | None = None,
+        channels: list[str] | None = None,
+        users: list[str] | None = None,
+        badges: list[str] | None = None,
+        pattern: str | None = None,
+    ) -> None:
+        """
+        Adds a handler to the bot
+        Handlers receive every message from the server that matches their filters, before the bot handles it
+        Filters are indexed, so messages only reach the handlers that can match them
+
+        Args:
+            name (str): Handler's name
+            handler (Callable[[Message], None]): Method that will be executed with each matching message
+            message_types (list[str] | None): IRC commands of the messages the handler receives, e.g. ["PRIVMSG", "USERNOTICE"]
+                Default: all of them
+            channels (list[str] | None): Channels whose messages the handler receives
+                Default: all of them
+            users (list[str] | None): Users whose messages the handler receives
+                Default: all of them
+            badges (list[str] | None): Badges, e.g. "moderator", of which the sender must have at least one
+                Default: no badge is needed
+            pattern (str | None): Regular expression that must be found in the messages the handler receives
+
+        Raises:
+            re.error: If the pattern is not a valid regular expression
+        """
+
+        self.__handler_index.add(name, channels, users, badges, message_types, pattern)
+        self.custom_handlers[name] = handler
+
+    def remove_handler(self, name: str) -> None:
+        """
+        Removes a handler from the bot
+
+        Args:
+            name (str): Handler's name
+        """
+
+        self.handlers_to_remove.append(name)
+
+    def add_command(
+        self,
+        name: str,
+        command: Callable[[Message], None],
+        aliases: list[str] | None = None,
+        pattern: str | None = None,
+        global_cooldown: float = 0,
+        channel_cooldown: float = 0,
+        user_cooldown: float = 0,
+        cooldown_uses: int = 1,
+        roles: Role = Role.NONE,
+        subscriber_tier: int = 0,
+    ) -> None:
         """
         Adds a command to the bot
         Commands must receive as a parameter the messages which call them
+        The message's text_command is the command's name and its text_args are the words after the invoked name
 
         Args:
             name (str): Command's name
+                Names with several words, e.g. "queue add", are sub-commands and take precedence over shorter names
             command (Callable[[Message], None]): Method that will be executed when the command is invoked
-        """
+            aliases (list[str] | None): Other names that invoke the command
+            pattern (str | None): Regular expression that invokes the command when found in a message without a command
+            global_cooldown (float): Seconds during which the command can't be invoked again in any channel
+                Default: 0
+            channel_cooldown (float): Seconds during which the command can't be invoked again in the same channel
+                Default: 0
+            user_cooldown (float): Seconds during which the same user can't invoke the command again in the same channel
+                Default: 0
+            cooldown_uses (int): Invocations allowed during each cooldown before the command is blocked
+                Default: 1
+            roles (Role): Roles allowed to invoke the command, e.g. Role.MODERATOR | Role.BROADCASTER
+                Default: Role.NONE, anyone can invoke it
+            subscriber_tier (int): Minimum subscription tier needed to invoke the command
+                Default: 0
+
+        Raises:
+            re.error: If the pattern is not a valid regular expression
+        """
+
+        self.__command_router.add(name, aliases, pattern)
+        self.__cooldowns.set(
+            name, global_cooldown, channel_cooldown, user_cooldown, cooldown_uses
+        )
+
+        if roles or subscriber_tier > 0:
+            self.__command_permissions[name] = (roles, subscriber_tier)
+
+        else:
+            self.__command_permissions.pop(name, None)
 
         self.custom_commands[name] = command
 
@@ -1479,3 +4928,98 @@ class Bot:
         """
 
         self.methods_after_whisper_to_remove.append(name)
+
+    def add_method_after_chatter_join(
+        self, name: str, method: Callable[[str, str], None]
+    ) -> None:
+        """
+        Adds to the bot a method that will be executed after a user joins the chat of one of its channels
+
+        Args:
+            name (str): Method's name
+            method (Callable[[str, str], None]): Method to be executed with the channel and the user after a user joins a chat
+        """
+
+        self.custom_methods_after_chatter_join[name] = method
+
+    def remove_method_after_chatter_join(self, name: str) -> None:
+        """
+        Removes a method that is executed after a user joins the chat of one of the bot's channels
+
+        Args:
+            name (str): Method's name
+        """
+
+        self.methods_after_chatter_join_to_remove.append(name)
+
+    def add_method_after_chatter_leave(
+        self, name: str, method: Callable[[str, str], None]
+    ) -> None:
+        """
+        Adds to the bot a method that will be executed after a user leaves the chat of one of its channels
+
+        Args:
+            name (str): Method's name
+            method (Callable[[str, str], None]): Method to be executed with the channel and the user after a user leaves a chat
+        """
+
+        self.custom_methods_after_chatter_leave[name] = method
+
+    def remove_method_after_chatter_leave(self, name: str) -> None:
+        """
+        Removes a method that is executed after a user leaves the chat of one of the bot's channels
+
+        Args:
+            name (str): Method's name
+        """
+
+        self.methods_after_chatter_leave_to_remove.append(name)
+
+    def add_method_after_spam(
+        self, name: str, method: Callable[[SpamEvent], None]
+    ) -> None:
+        """
+        Adds to the bot a method that will be executed after a burst of repeated messages is detected in the chat of one of its channels
+        The method can react to the burst, e.g. with timeout_spammers or client.update_shield_mode_status
+
+        Args:
+            name (str): Method's name
+            method (Callable[[SpamEvent], None]): Method to be executed with the burst
+        """
+
+        self.custom_methods_after_spam[name] = method
+
+    def remove_method_after_spam(self, name: str) -> None:
+        """
+        Removes a method that is executed after a burst of repeated messages is detected
+
+        Args:
+            name (str): Method's name
+        """
+
+        self.methods_after_spam_to_remove.append(name)
+
+    def add_method_after_automod_check(
+        self, name: str, method: Callable[[Message, bool], None]
+    ) -> None:
+        """
+        Adds to the bot a method that will be executed after a chat message of one of its channels is checked against AutoMod
+        While there are such methods, every chat message that isn't from a moderator is checked
+        The bot's user token must belong to the channel's broadcaster
+
+        Args:
+            name (str): Method's name
+            method (Callable[[Message, bool], None]): Method to be executed with the message and whether AutoMod permits it
+        """
+
+        self.custom_methods_after_automod_check[name] = method
+
+    def remove_method_after_automod_check(self, name: str) -> None:
+        """
+        Removes a method that is executed after a chat message is checked against AutoMod
+
+        Args:
+            name (str): Method's name
+        """
+
+        self.methods_after_automod_check_to_remove.append(name)
@@ -1,5 +1,6 @@
 import logging
 import os
+from collections.abc import Iterator
 from datetime import datetime
 
 import requests
@@ -2446,7 +2447,7 @@ class Client:
 
         Args:
             broadcaster_id (str): Provided broadcaster_id must match the user_id in the auth token
-            data (list[tuple[str, str]]): The list of messages to check
+            data (list[tuple[str, str]]): The list of messages to check, as pairs of caller-defined ID and text
                 Minimum: 1
                 Maximum: 100
 
@@ -2454,7 +2455,7 @@ class Client:
             errors.ClientError
 
         Returns:
-            list[tuple[str, bool]]
+            list[tuple[str, bool]]: Pairs of message ID and whether AutoMod permits the message
         """
 
         return moderation.check_automod_status(
@@ -2584,6 +2585,24 @@ class Client:
             self.__user_token, self.client_id, broadcaster_id, user_id, first
         )
 
+    def get_all_banned_users(self, broadcaster_id: str) -> Iterator[BannedUser]:
+        """
+        Returns all banned and timed-out users in a channel, requesting the pages as they are consumed
+
+        Args:
+            broadcaster_id (str): Provided broadcaster_id must match the user_id in the auth token
+
+        Raises:
+            errors.ClientError
+
+        Returns:
+            Iterator[BannedUser]
+        """
+
+        return moderation.get_all_banned_users(
+            self.__user_token, self.client_id, broadcaster_id
+        )
+
     def ban_user(
         self,
         broadcaster_id: str,
@@ -2683,6 +2702,40 @@ class Client:
             first,
         )
 
+    def get_all_unban_requests(
+        self,
+        broadcaster_id: str,
+        moderator_id: str,
+        status: str,
+        user_id: str | None = None,
+    ) -> Iterator[UnbanRequest]:
+        """
+        Gets all the unban requests for a broadcaster’s channel, requesting the pages as they are consumed
+
+        Args:
+            broadcaster_id (str): The ID of the broadcaster whose channel is receiving unban requests
+            moderator_id (str): The ID of the broadcaster or a user that has permission to moderate the broadcaster’s unban requests
+                This ID must match the user ID in the user access token
+            status (str): Filter by a status
+                Possible values: pending, approved, denied, acknowledged, canceled
+            user_id (str | None): The ID used to filter what unban requests are returned
+
+        Raises:
+            errors.ClientError
+
+        Returns:
+            Iterator[UnbanRequest]
+        """
+
+        return moderation.get_all_unban_requests(
+            self.__user_token,
+            self.client_id,
+            broadcaster_id,
+            moderator_id,
+            status,
+            user_id,
+        )
+
     def resolve_unban_requests(
         self,
         broadcaster_id: str,
@@ -2749,6 +2802,28 @@ class Client:
             self.__user_token, self.client_id, broadcaster_id, moderator_id, first
         )
 
+    def get_all_blocked_terms(
+        self, broadcaster_id: str, moderator_id: str
+    ) -> Iterator[BlockedTerm]:
+        """
+        Gets all the broadcaster’s non-private, blocked words or phrases, requesting the pages as they are consumed
+
+        Args:
+            broadcaster_id (str): The ID of the broadcaster whose blocked terms you’re getting
+            moderator_id (str): The ID of a user that has permission to moderate the broadcaster’s chat room
+                This ID must match the user ID associated with the user OAuth token
+
+        Raises:
+            errors.ClientError
+
+        Returns:
+            Iterator[BlockedTerm]
+        """
+
+        return moderation.get_all_blocked_terms(
+            self.__user_token, self.client_id, broadcaster_id, moderator_id
+        )
+
     def add_blocked_term(
         self, broadcaster_id: str, moderator_id: str, text: str
     ) -> BlockedTerm:
@@ -2868,6 +2943,24 @@ class Client:
             self.__user_token, self.client_id, broadcaster_id, user_id, first
         )
 
+    def get_all_moderators(self, broadcaster_id: str) -> Iterator[User]:
+        """
+        Returns all moderators in a channel, requesting the pages as they are consumed
+
+        Args:
+            broadcaster_id (str): Provided broadcaster_id must match the user_id in the auth token
+
+        Raises:
+            errors.ClientError
+
+        Returns:
+            Iterator[User]
+        """
+
+        return moderation.get_all_moderators(
+            self.__user_token, self.client_id, broadcaster_id
+        )
+
     def add_channel_moderator(self, broadcaster_id: str, user_id: str) -> None:
         """
         Adds a moderator to the broadcaster’s chat room
@@ -2928,6 +3021,23 @@ class Client:
             self.__user_token, self.client_id, broadcaster_id, user_id, first
         )
 
+    def get_all_vips(self, broadcaster_id: str) -> Iterator[User]:
+        """
+        Gets all the broadcaster’s VIPs, requesting the pages as they are consumed
+
+        Args:
+            broadcaster_id (str): The ID of the broadcaster whose list of VIPs you want to get
+                This ID must match the user ID in the access token
+
+        Raises:
+            errors.ClientError
+
+        Returns:
+            Iterator[User]
+        """
+
+        return channels.get_all_vips(self.__user_token, self.client_id, broadcaster_id)
+
     def add_channel_vip(self, user_id: str, broadcaster_id: str) -> None:
         """
         Adds the specified user as a VIP in the broadcaster’s channel
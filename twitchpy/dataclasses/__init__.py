@@ -6,13 +6,18 @@ from .user import User
 from .banned_user import BannedUser
 from .bits_leaderboard_leader import BitsLeaderboardLeader
 from .blocked_term import BlockedTerm
+from .blocked_terms_sync import BlockedTermsSync
+from .bulk_progress import BulkProgress
 from .game import Game
 from .channel import Channel
 from .charity_campaign_amount import CharityCampaignAmount
 from .charity_campaign import CharityCampaign
 from .charity_campaign_donation import CharityCampaignDonation
+from .chat_rates import ChatRates
 from .chat_settings import ChatSettings
+from .chat_state import ChatState
 from .chatter_warning import ChatterWarning
+from .check_stats import CheckStats
 from .cheermote_tier import CheermoteTier
 from .cheermote import Cheermote
 from .clip import Clip
@@ -24,6 +29,7 @@ from .content_classification_label import ContentClassificationLabel
 from .creator_goal import CreatorGoal
 from .drop_entitlement import DropEntitlement
 from .emote import Emote
+from .emote_usage import EmoteUsage
 from .eventsub_subscription import EventSubSubscription
 from .extension import Extension
 from .extension_analytics_report import ExtensionAnalyticsReport
@@ -37,18 +43,29 @@ from .guest import Guest
 from .guest_star_invite import GuestStarInvite
 from .guest_star_session import GuestStarSession
 from .guest_star_settings import GuestStarSettings
+from .handler_stats import HandlerStats
 from .hype_train_contribution import HypeTrainContribution
 from .hype_train_event_data import HypeTrainEventData
 from .hypetrain_event import HypeTrainEvent
+from .history_entry import HistoryEntry
+from .join_progress import JoinProgress
+from .emote_spans import EmoteSpans
+from .role import Role
 from .message import Message
+from .metric_sample import MetricSample
+from .metric_snapshot import MetricSnapshot
+from .outbound_stats import OutboundStats
+from .ping_stats import PingStats
 from .poll_choice import PollChoice
 from .poll import Poll
 from .predictor import Predictor
 from .prediction_outcome import PredictionOutcome
 from .prediction import Prediction
+from .reconnect_stats import ReconnectStats
 from .reward import Reward
 from .redemption import Redemption
 from .shield_mode_status import ShieldModeStatus
+from .spam_event import SpamEvent
 from .stream import Stream
 from .stream_marker import StreamMarker
 from .stream_schedule_segment import StreamScheduleSegment
@@ -58,4 +75,6 @@ from .tag import Tag
 from .team import Team
 from .token import TokenInfo
 from .unban_request import UnbanRequest
+from .unban_request_context import UnbanRequestContext
+from .unban_triage import UnbanTriage
 from .video import Video
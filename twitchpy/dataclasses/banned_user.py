@@ -11,14 +11,14 @@ class BannedUser:
 
     Attributes:
         user (User): The banned user
-        expires_at (datetime): The UTC date and time (in RFC3339 format) of when the timeout expires, or an empty string if the user is permanently banned
+        expires_at (datetime | None): The UTC date and time (in RFC3339 format) of when the timeout expires, or None if the user is permanently banned
         created_at (datetime): The UTC date and time (in RFC3339 format) of when the user was banned
         reason (str): The reason the user was banned or put in a timeout if the moderator provided one
         moderator (User): The moderator that banned the user or put them in a timeout
     """
 
     user: User
-    expires_at: datetime
+    expires_at: datetime | None
     created_at: datetime
     reason: str
     moderator: User
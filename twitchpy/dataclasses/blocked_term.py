@@ -14,7 +14,7 @@ class BlockedTerm:
         text (str): The blocked word or phrase
         created_at (datetime): The UTC date and time (in RFC3339 format) that the term was blocked
         updated_at (datetime): The UTC date and time (in RFC3339 format) that the term was updated
-        expires_at (datetime): The UTC date and time (in RFC3339 format) that the blocked term is set to expire
+        expires_at (datetime | None): The UTC date and time (in RFC3339 format) that the blocked term is set to expire, None if it doesn't expire
     """
 
     broadcaster_id: str
@@ -23,4 +23,4 @@ class BlockedTerm:
     text: str
     created_at: datetime
     updated_at: datetime
-    expires_at: datetime
+    expires_at: datetime | None
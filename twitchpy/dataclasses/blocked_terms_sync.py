@@ -0,0 +1,23 @@
+from dataclasses import dataclass
+
+
+@dataclass
+class BlockedTermsSync:
+    """
+    Represents the result of bringing a channel's blocked terms in line with a list
+
+    Attributes:
+        channel (str): Channel whose blocked terms were synchronized
+        added (int): Number of terms added
+        removed (int): Number of terms removed
+        failed (int): Number of additions and removals that failed
+        elapsed (float): Seconds the synchronization took
+        error (str | None): Why the channel's terms couldn't be listed, None if they were
+    """
+
+    channel: str
+    added: int
+    removed: int
+    failed: int
+    elapsed: float
+    error: str | None = None
@@ -0,0 +1,23 @@
+from dataclasses import dataclass, field
+
+
+@dataclass
+class BulkProgress:
+    """
+    Represents the progress of a moderation action applied to many users or messages
+
+    Attributes:
+        action (str): Name of the action, e.g. "ban"
+        channel (str): Channel where the action is applied
+        total (int): Number of users or messages the action is applied to
+        succeeded (int): Number of users or messages the action was applied to
+        failed (int): Number of users or messages the action couldn't be applied to
+        errors (dict[str, str]): Error of each user or message the action couldn't be applied to, by ID
+    """
+
+    action: str
+    channel: str
+    total: int
+    succeeded: int = 0
+    failed: int = 0
+    errors: dict[str, str] = field(default_factory=dict)
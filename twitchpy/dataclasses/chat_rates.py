@@ -0,0 +1,17 @@
+from dataclasses import dataclass
+
+
+@dataclass
+class ChatRates:
+    """
+    Represents the recent activity of a channel's chat
+
+    Attributes:
+        messages_per_second (float): Messages sent per second
+        new_chatters_per_second (float): Users sending their first message per second
+        duplicate_ratio (float): Fraction of the messages that repeat a recent one
+    """
+
+    messages_per_second: float
+    new_chatters_per_second: float
+    duplicate_ratio: float
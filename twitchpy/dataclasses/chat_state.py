@@ -0,0 +1,36 @@
+from dataclasses import dataclass
+from datetime import datetime
+
+
+@dataclass
+class ChatState:
+    """
+    Represents the state of a channel's chat as seen by a bot
+
+    Attributes:
+        channel (str): Channel's name
+        room_id (str | None): ID of the channel's broadcaster
+        emote_mode (bool): Whether chat messages must contain only emotes
+        follower_mode (bool): Whether only followers can talk in the chat
+        follower_mode_duration (int): Minutes users must follow the broadcaster before talking in the chat
+        slow_mode (bool): Whether users must wait between sending messages
+        slow_mode_wait_time (int): Seconds users must wait between sending messages
+        subscriber_mode (bool): Whether only subscribers can talk in the chat
+        unique_chat_mode (bool): Whether users can only post unique messages
+        is_moderator (bool | None): Whether the bot moderates the chat, None if it isn't known yet
+        is_vip (bool | None): Whether the bot is a VIP in the chat, None if it isn't known yet
+        last_cleared (datetime | None): Last time the chat was cleared
+    """
+
+    channel: str
+    room_id: str | None = None
+    emote_mode: bool = False
+    follower_mode: bool = False
+    follower_mode_duration: int = 0
+    slow_mode: bool = False
+    slow_mode_wait_time: int = 0
+    subscriber_mode: bool = False
+    unique_chat_mode: bool = False
+    is_moderator: bool | None = None
+    is_vip: bool | None = None
+    last_cleared: datetime | None = None
@@ -0,0 +1,21 @@
+from dataclasses import dataclass
+
+
+@dataclass
+class CheckStats:
+    """
+    Represents the statistics of a bot's check
+
+    Attributes:
+        name (str): Check's name
+        runs (int): Number of times the check has run
+        last_lateness (float | None): Seconds the last run started after it was due
+        average_lateness (float | None): Average seconds the runs started after they were due
+        max_lateness (float | None): Maximum seconds a run started after it was due
+    """
+
+    name: str
+    runs: int
+    last_lateness: float | None = None
+    average_lateness: float | None = None
+    max_lateness: float | None = None
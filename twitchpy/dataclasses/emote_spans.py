@@ -0,0 +1,62 @@
+from array import array
+from dataclasses import dataclass, field
+
+
+@dataclass
+class EmoteSpans:
+    """
+    Represents the positions of the emotes in a chat message, as parsed from its emotes tag
+    Positions are code point offsets, so they can slice the message's text directly
+
+    Attributes:
+        ids (list[str]): ID of the emote of each span
+        starts (array): Offset of the first character of each span
+        ends (array): Offset after the last character of each span
+    """
+
+    ids: list[str] = field(default_factory=list)
+    starts: array = field(default_factory=lambda: array("I"))
+    ends: array = field(default_factory=lambda: array("I"))
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __iter__(self):
+        return zip(self.ids, self.starts, self.ends)
+
+    def names(self, text: str) -> list[str]:
+        """
+        Gets the name of the emote of each span
+
+        Args:
+            text (str): Message's text
+
+        Returns:
+            list[str]
+        """
+
+        return [text[start:end] for start, end in zip(self.starts, self.ends)]
+
+    def to_utf16(self, text: str) -> list[tuple[str, int, int]]:
+        """
+        Gets the spans with UTF-16 code unit offsets, as used by JavaScript strings
+
+        Args:
+            text (str): Message's text
+
+        Returns:
+            list[tuple[str, int, int]]: ID, start and end of each span
+        """
+
+        if text.isascii():
+            return list(self)
+
+        # Characters outside the Basic Multilingual Plane take two UTF-16 code units
+        offsets = array("I", [0])
+
+        for character in text:
+            offsets.append(offsets[-1] + (2 if ord(character) > 0xFFFF else 1))
+
+        return [
+            (emote_id, offsets[start], offsets[end]) for emote_id, start, end in self
+        ]
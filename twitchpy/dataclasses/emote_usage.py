@@ -0,0 +1,17 @@
+from dataclasses import dataclass
+
+
+@dataclass
+class EmoteUsage:
+    """
+    Represents how many times an emote was used in a channel's chat
+
+    Attributes:
+        id (str): Emote's ID
+        name (str): Emote's name
+        count (int): Number of times the emote was used
+    """
+
+    id: str
+    name: str
+    count: int
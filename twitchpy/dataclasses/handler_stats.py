@@ -0,0 +1,35 @@
+from dataclasses import dataclass
+
+
+@dataclass
+class HandlerStats:
+    """
+    Represents the measures of a bot's handler or of a Client method called from the handlers
+
+    Attributes:
+        kind (str): Kind of handler, e.g. "command", "listener" or "after_commands", or "client" for Client methods
+        name (str): Handler's or method's name
+        calls (int): Number of times it ran
+        exceptions (int): Number of times it raised an exception
+        total_time (float): Seconds it ran in total
+        average_time (float): Average seconds of a run
+        p50_time (float): Median seconds of the recent runs
+        p95_time (float): 95th percentile of the seconds of the recent runs
+        p99_time (float): 99th percentile of the seconds of the recent runs
+        max_time (float): Maximum seconds of a run
+        client_calls (int): Number of Client methods it called
+        client_time (float): Seconds it spent in Client methods
+    """
+
+    kind: str
+    name: str
+    calls: int
+    exceptions: int
+    total_time: float
+    average_time: float
+    p50_time: float
+    p95_time: float
+    p99_time: float
+    max_time: float
+    client_calls: int = 0
+    client_time: float = 0
@@ -0,0 +1,26 @@
+from dataclasses import dataclass
+from datetime import datetime
+
+
+@dataclass
+class HistoryEntry:
+    """
+    Represents a chat message kept in a bot's message history
+
+    Attributes:
+        message_id (str | None): Message's ID
+        channel (str): Channel on which the message was sent
+        user_id (str): ID of the user who sent the message, or their name if the ID isn't known
+        user (str | None): Name of the user who sent the message
+        text (str): Message's text
+        sent_at (datetime): Time the message was sent
+        deleted (bool): Whether the message was deleted or its user was banned or timed out afterwards
+    """
+
+    message_id: str | None
+    channel: str
+    user_id: str
+    user: str | None
+    text: str
+    sent_at: datetime
+    deleted: bool = False
@@ -0,0 +1,21 @@
+from dataclasses import dataclass
+
+
+@dataclass
+class JoinProgress:
+    """
+    Represents the progress of the channel joins requested by a bot
+
+    Attributes:
+        requested (int): Number of joins requested since the bot started
+        joined (int): Number of joins confirmed by the server
+        pending (int): Number of joins waiting for the rate limit or for the server's confirmation
+        average_latency (float | None): Average seconds between requesting a join and its confirmation
+        max_latency (float | None): Maximum seconds between requesting a join and its confirmation
+    """
+
+    requested: int
+    joined: int
+    pending: int
+    average_latency: float | None = None
+    max_latency: float | None = None
@@ -1,4 +1,6 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+
+from ..dataclasses import EmoteSpans, Role
 
 
 @dataclass
@@ -16,6 +18,11 @@ class Message:
         text (str | None): Message's text
         text_command (str | None): Command related to the message
         text_args (list[str] | None): Command's arguments
+        badges (dict[str, str]): Versions of the sender's badges, by badge name
+        badge_info (dict[str, str]): Details of the sender's badges, e.g. the months of a subscription
+        roles (Role): Roles of the sender
+        subscriber_tier (int): Tier of the sender's subscription, 0 if the sender isn't subscribed
+        emotes (EmoteSpans | None): Positions of the emotes in the text
     """
 
     prefix: str | None = None
@@ -27,3 +34,8 @@ class Message:
     text: str | None = None
     text_command: str | None = None
     text_args: list[str] | None = None
+    badges: dict[str, str] = field(default_factory=dict)
+    badge_info: dict[str, str] = field(default_factory=dict)
+    roles: Role = Role.NONE
+    subscriber_tier: int = 0
+    emotes: EmoteSpans | None = None
@@ -0,0 +1,17 @@
+from dataclasses import dataclass
+
+
+@dataclass
+class MetricSample:
+    """
+    Represents a value of a metric
+
+    Attributes:
+        name (str): Sample's name, the metric's name followed by _bucket, _sum or _count for histograms
+        labels (dict[str, str]): Labels of the value
+        value (float)
+    """
+
+    name: str
+    labels: dict[str, str]
+    value: float
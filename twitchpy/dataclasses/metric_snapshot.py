@@ -0,0 +1,22 @@
+from dataclasses import dataclass
+
+from ..dataclasses import MetricSample
+
+
+@dataclass
+class MetricSnapshot:
+    """
+    Represents the values of a bot's metric at a point in time
+
+    Attributes:
+        name (str): Metric's name
+        kind (str): Metric's type
+            Possible values: counter, gauge, histogram
+        description (str): What the metric measures
+        samples (list[MetricSample]): Values of the metric
+    """
+
+    name: str
+    kind: str
+    description: str
+    samples: list[MetricSample]
@@ -0,0 +1,23 @@
+from dataclasses import dataclass
+
+
+@dataclass
+class OutboundStats:
+    """
+    Represents the statistics of the messages sent by a bot
+
+    Attributes:
+        queued (int): Number of messages waiting for the rate limits
+        sent (int): Number of messages written to the chat
+        dropped (int): Number of messages dropped because the queue was full or the channel was left
+        coalesced (int): Number of messages merged into an identical queued message
+        average_latency (float | None): Average seconds a message waits in the queue
+        max_latency (float | None): Maximum seconds a message waited in the queue
+    """
+
+    queued: int
+    sent: int
+    dropped: int
+    coalesced: int
+    average_latency: float | None = None
+    max_latency: float | None = None
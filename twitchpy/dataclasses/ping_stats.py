@@ -0,0 +1,29 @@
+from dataclasses import dataclass
+
+
+@dataclass
+class PingStats:
+    """
+    Represents the statistics of the PINGs a bot sends to keep its connections alive
+
+    Attributes:
+        sent (int): Number of PINGs sent
+        answered (int): Number of PINGs answered with a PONG
+        missed (int): Number of PINGs that weren't answered in time
+        dead_connections (int): Number of connections closed because they stopped answering
+        last_rtt (float | None): Seconds between the last answered PING and its PONG
+        p50_rtt (float | None): Median round-trip time of the recent PINGs, in seconds
+        p90_rtt (float | None): 90th percentile of the round-trip time of the recent PINGs, in seconds
+        p99_rtt (float | None): 99th percentile of the round-trip time of the recent PINGs, in seconds
+        max_rtt (float | None): Maximum round-trip time of the recent PINGs, in seconds
+    """
+
+    sent: int
+    answered: int
+    missed: int
+    dead_connections: int
+    last_rtt: float | None = None
+    p50_rtt: float | None = None
+    p90_rtt: float | None = None
+    p99_rtt: float | None = None
+    max_rtt: float | None = None
@@ -0,0 +1,21 @@
+from dataclasses import dataclass
+
+
+@dataclass
+class ReconnectStats:
+    """
+    Represents the statistics of a bot's reconnections
+
+    Attributes:
+        reconnects (int): Number of times the bot recovered from lost connections
+        failed_attempts (int): Number of connection attempts that failed while reconnecting
+        last_duration (float | None): Seconds between losing a connection and rejoining all its channels, in the last reconnection
+        average_duration (float | None): Average seconds between losing a connection and rejoining all its channels
+        max_duration (float | None): Maximum seconds between losing a connection and rejoining all its channels
+    """
+
+    reconnects: int
+    failed_attempts: int
+    last_duration: float | None = None
+    average_duration: float | None = None
+    max_duration: float | None = None
@@ -0,0 +1,15 @@
+from enum import IntFlag
+
+
+class Role(IntFlag):
+    """
+    Represents the roles of a chat user as flags that can be combined, e.g. Role.MODERATOR | Role.VIP
+    """
+
+    NONE = 0
+    SUBSCRIBER = 1
+    FOUNDER = 2
+    VIP = 4
+    MODERATOR = 8
+    BROADCASTER = 16
+    STAFF = 32
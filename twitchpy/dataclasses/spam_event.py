@@ -0,0 +1,23 @@
+from dataclasses import dataclass
+
+
+@dataclass
+class SpamEvent:
+    """
+    Represents a burst of repeated messages detected in a channel's chat
+
+    Attributes:
+        channel (str): Channel where the messages were sent
+        kind (str): "duplicate" for identical messages, "near_duplicate" for similar ones
+        count (int): Approximate number of matching messages inside the detection window
+        text (str): Text of the message that triggered the detection
+        user_ids (list[str]): IDs of the last users who sent matching messages
+        message_ids (list[str]): IDs of the last matching messages
+    """
+
+    channel: str
+    kind: str
+    count: int
+    text: str
+    user_ids: list[str]
+    message_ids: list[str]
@@ -18,7 +18,7 @@ class UnbanRequest:
         status (str): Status of the request
             Possible values: pending, approved, denied, acknowledged, canceled
         created_at (datetime): Timestamp of when the unban request was created
-        resolved_at (datetime): Timestamp of when moderator/broadcaster approved or denied the request
+        resolved_at (datetime | None): Timestamp of when moderator/broadcaster approved or denied the request, None if it's pending
         resolution_text (str): Text input by the resolver (moderator) of the unban request
     """
 
@@ -29,5 +29,5 @@ class UnbanRequest:
     text: str
     status: str
     created_at: datetime
-    resolved_at: datetime
+    resolved_at: datetime | None
     resolution_text: str
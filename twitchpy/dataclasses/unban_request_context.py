@@ -0,0 +1,21 @@
+from dataclasses import dataclass
+
+from ..dataclasses import BannedUser, UnbanRequest, User
+
+
+@dataclass
+class UnbanRequestContext:
+    """
+    Represents a pending unban request with what is known about its user, as given to the triage rules
+
+    Attributes:
+        request (UnbanRequest): The unban request
+        user (User | None): Full information of the user who is asking for an unban, None if the user doesn't exist anymore
+        ban (BannedUser | None): Current ban of the user, None if the user isn't banned anymore
+        previous_requests (int): Number of earlier requests of the user in the channel, as recorded in the audit log
+    """
+
+    request: UnbanRequest
+    user: User | None
+    ban: BannedUser | None
+    previous_requests: int
@@ -0,0 +1,29 @@
+from dataclasses import dataclass, field
+
+
+@dataclass
+class UnbanTriage:
+    """
+    Represents the result of triaging a channel's pending unban requests
+
+    Attributes:
+        channel (str): Channel whose requests were triaged
+        reviewed (int): Number of pending requests the rules were run on
+        approved (int): Number of requests approved
+        denied (int): Number of requests denied
+        skipped (int): Number of requests no rule decided on, which are still pending
+        failed (int): Number of requests whose rules or resolution failed
+        elapsed (float): Seconds the triage took
+        errors (dict[str, str]): Error of each request that failed, by ID
+        error (str | None): Why the requests couldn't be listed, None if they were
+    """
+
+    channel: str
+    reviewed: int = 0
+    approved: int = 0
+    denied: int = 0
+    skipped: int = 0
+    failed: int = 0
+    elapsed: float = 0
+    errors: dict[str, str] = field(default_factory=dict)
+    error: str | None = None